@@ -11,7 +11,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from fastapi import APIRouter, Query, HTTPException, BackgroundTasks
+from fastapi import APIRouter, Query, HTTPException, BackgroundTasks, Request
 from typing import Optional, List
 import logging
 from datetime import datetime
@@ -24,6 +24,8 @@ from services.enhanced_mobile_banner_crawler import EnhancedMobileBannerCrawler
 from models.banner import BannerResponse
 from core.cache import get_banner_cache
 from core.scheduler import get_scheduler
+from core.response_cache import ResponseCache
+from api.http_cache import conditional_response
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/banner", tags=["banner"])
@@ -33,8 +35,12 @@ _thread_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="BannerCrawl
 _last_banner_images: List[str] = []
 _crawl_lock = threading.Lock()
 
+# 已编码响应体缓存（按轮播图数据版本自动失效）
+_response_cache = ResponseCache(max_entries=8, max_search_entries=1)
+
 @router.get("/mobile", response_model=BannerResponse)
 async def get_mobile_banners(
+    request: Request,
     force_crawl: bool = Query(False, description="是否强制重新爬取")
 ):
     """
@@ -42,6 +48,8 @@ async def get_mobile_banners(
     
     参数说明：
     - force_crawl: 是否强制重新爬取（否则返回缓存结果）
+    
+    缓存结果按Accept请求头返回JSON、MessagePack（application/msgpack）或CBOR（application/cbor）
     """
     try:
         banner_cache = get_banner_cache()
@@ -65,16 +73,19 @@ async def get_mobile_banners(
         
         # 如果有缓存数据且不强制爬取，返回缓存结果
         if not force_crawl and cache_status["cache_count"] > 0:
-            cached_images = banner_cache.get_banner_images()
-            image_urls = [img.get('url', '') for img in cached_images if img.get('url')]
+            version, cached_images = banner_cache.get_versioned_images()
+            
+            def build_result() -> BannerResponse:
+                image_urls = [img.get('url', '') for img in cached_images if img.get('url')]
+                return BannerResponse(
+                    success=True,
+                    images=image_urls,
+                    total=len(image_urls),
+                    message=f"获取手机版Banner图片成功（缓存），共 {len(image_urls)} 张"
+                )
             
             logger.info("📋 返回缓存的Banner图片URL列表")
-            return BannerResponse(
-                success=True,
-                images=image_urls,
-                total=len(image_urls),
-                message=f"获取手机版Banner图片成功（缓存），共 {len(image_urls)} 张"
-            )
+            return conditional_response(request, _response_cache, version, ("mobile",), build_result)
         
         logger.info("🚀 开始爬取手机版Banner图片URL")
         
@@ -339,15 +350,9 @@ async def clear_banner_cache():
     清空轮播图缓存
     """
     try:
-        banner_cache = get_banner_cache()
+        # 清空缓存（递增版本号使ETag和响应缓存失效，并持久化空快照）
+        original_count = get_banner_cache().clear_cache()
         
-        # 清空缓存
-        with banner_cache._cache_lock:
-            original_count = len(banner_cache._cache)
-            banner_cache._cache.clear()
-            banner_cache._last_update = None
-            banner_cache._update_count = 0
-            
         logger.info(f"🗑️ 轮播图缓存已清空，原有 {original_count} 张图片")
         
         return {
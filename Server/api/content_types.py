@@ -0,0 +1,91 @@
+# Copyright (c) 2025 XBXyftx
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# 
+#     http://www.apache.org/licenses/LICENSE-2.0
+# 
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Dict, Tuple
+
+from pydantic import BaseModel
+
+try:
+    import msgpack
+except ImportError:  # msgpack为可选依赖，未安装时不提供MessagePack响应
+    msgpack = None
+
+try:
+    import cbor2
+except ImportError:  # cbor2为可选依赖，未安装时不提供CBOR响应
+    cbor2 = None
+
+JSON_MEDIA_TYPE = "application/json"
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+CBOR_MEDIA_TYPE = "application/cbor"
+
+# Accept中可能出现的等价写法
+MEDIA_TYPE_ALIASES: Dict[str, Tuple[str, ...]] = {
+    MSGPACK_MEDIA_TYPE: (MSGPACK_MEDIA_TYPE, "application/x-msgpack", "application/vnd.msgpack"),
+    CBOR_MEDIA_TYPE: (CBOR_MEDIA_TYPE,),
+}
+
+# CBOR不定长数组/映射的起止字节，流式输出时无需预先写入元素个数
+_CBOR_INDEFINITE_ARRAY = b"\x9f"
+_CBOR_INDEFINITE_MAP = b"\xbf"
+_CBOR_BREAK = b"\xff"
+
+
+def binary_media_types() -> Tuple[str, ...]:
+    """当前环境支持的二进制响应格式，按优先级排序"""
+    available = []
+    if msgpack is not None:
+        available.append(MSGPACK_MEDIA_TYPE)
+    if cbor2 is not None:
+        available.append(CBOR_MEDIA_TYPE)
+    return tuple(available)
+
+
+def _pack(value, media_type: str) -> bytes:
+    """编码已转换为JSON兼容类型的值"""
+    if media_type == MSGPACK_MEDIA_TYPE and msgpack is not None:
+        return msgpack.packb(value, use_bin_type=True)
+    if media_type == CBOR_MEDIA_TYPE and cbor2 is not None:
+        return cbor2.dumps(value)
+    raise ValueError(f"不支持的响应格式: {media_type}")
+
+
+def encode_model(model: BaseModel, media_type: str = JSON_MEDIA_TYPE) -> bytes:
+    """
+    将响应模型编码为指定格式；二进制格式与JSON使用相同的字段和取值
+    （日期时间为ISO字符串、枚举为取值），客户端可共用同一套模型解析
+    """
+    if media_type == JSON_MEDIA_TYPE:
+        return model.model_dump_json().encode("utf-8")
+    return _pack(model.model_dump(mode="json"), media_type)
+
+
+def stream_frame(envelope: BaseModel, total: int, media_type: str = JSON_MEDIA_TYPE) -> Tuple[bytes, bytes, bytes]:
+    """
+    分块输出与envelope结构相同的文档时使用的(头, 分隔符, 尾)
+    envelope的articles为空列表，调用方在头和尾之间逐篇写入total篇文章的encode_model结果，文章之间以分隔符连接
+    """
+    if media_type == JSON_MEDIA_TYPE:
+        head, _, rest = envelope.model_dump_json().partition('"articles":[]')
+        return (head + '"articles":[').encode("utf-8"), b",", ("]" + rest).encode("utf-8")
+    
+    fields = envelope.model_dump(mode="json", exclude={"articles"})
+    rest = b"".join(_pack(name, media_type) + _pack(value, media_type) for name, value in fields.items())
+    if media_type == MSGPACK_MEDIA_TYPE and msgpack is not None:
+        packer = msgpack.Packer(use_bin_type=True)
+        head = packer.pack_map_header(len(fields) + 1) + packer.pack("articles") + packer.pack_array_header(total)
+        return head, b"", rest
+    if media_type == CBOR_MEDIA_TYPE and cbor2 is not None:
+        head = _CBOR_INDEFINITE_MAP + cbor2.dumps("articles") + _CBOR_INDEFINITE_ARRAY
+        return head, b"", _CBOR_BREAK + rest + _CBOR_BREAK
+    raise ValueError(f"不支持的响应格式: {media_type}")
@@ -0,0 +1,163 @@
+# Copyright (c) 2025 XBXyftx
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# 
+#     http://www.apache.org/licenses/LICENSE-2.0
+# 
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+from typing import Callable, Dict, Hashable, Iterable, Optional, Tuple
+
+from fastapi import Request, Response
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+from api.content_types import JSON_MEDIA_TYPE, MEDIA_TYPE_ALIASES, binary_media_types, encode_model
+from core.config import settings
+from core.response_cache import ResponseCache, supported_encodings
+
+def make_etag(version: int, key: Hashable, encoding: Optional[str] = None) -> str:
+    """
+    根据快照版本和查询参数生成强ETag，无需读取文章数据
+    不同压缩编码的表示字节不同，强ETag需附加编码后缀加以区分
+    """
+    digest = hashlib.sha1(repr(key).encode("utf-8")).hexdigest()[:16]
+    suffix = f"-{encoding}" if encoding else ""
+    return f'"{version:x}-{digest}{suffix}"'
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    If-None-Match比较（弱比较：nginx压缩后会把ETag转为W/前缀）
+    etag为不带编码后缀的基础ETag，同一快照和查询的任一压缩版本的ETag都视为命中
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    base = etag[:-1]
+    accepted = {etag} | {f'{base}-{encoding}"' for encoding in supported_encodings()}
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate in accepted:
+            return True
+    return False
+
+def _parse_weights(header: str) -> Dict[str, float]:
+    """解析Accept/Accept-Encoding请求头，返回取值（小写）到q权重的映射"""
+    weights = {}
+    for item in header.split(","):
+        parts = item.strip().split(";")
+        coding = parts[0].strip().lower()
+        weight = 1.0
+        for param in parts[1:]:
+            name, _, value = param.strip().partition("=")
+            if name.strip() == "q":
+                try:
+                    weight = float(value)
+                except ValueError:
+                    weight = 0.0
+        if coding:
+            weights[coding] = weight
+    return weights
+
+def choose_media_type(accept: Optional[str]) -> str:
+    """
+    根据Accept选择响应格式：二进制格式（MessagePack/CBOR）需显式列出，
+    权重不低于JSON时优先；未列出、权重为0或未安装对应依赖时返回JSON
+    """
+    if not accept:
+        return JSON_MEDIA_TYPE
+    
+    weights = _parse_weights(accept)
+    json_weight = weights.get(JSON_MEDIA_TYPE, weights.get("application/*", weights.get("*/*", 0.0)))
+    best, best_weight = JSON_MEDIA_TYPE, 0.0
+    for media_type in binary_media_types():
+        weight = max(weights.get(alias, 0.0) for alias in MEDIA_TYPE_ALIASES[media_type])
+        if weight > best_weight:
+            best, best_weight = media_type, weight
+    return best if best_weight > 0 and best_weight >= json_weight else JSON_MEDIA_TYPE
+
+def representation_key(key: Hashable, media_type: str) -> Hashable:
+    """响应缓存和ETag使用的键：二进制格式附加媒体类型，JSON保持原键"""
+    return key if media_type == JSON_MEDIA_TYPE else (key, media_type)
+
+def not_modified(request: Request, version: int, key: Hashable, media_type: str) -> bool:
+    """If-None-Match是否命中该快照和查询的指定格式表示，命中时无需读取文章数据"""
+    return etag_matches(request.headers.get("if-none-match"), make_etag(version, representation_key(key, media_type)))
+
+def choose_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """根据Accept-Encoding选择预压缩编码（优先br，其次gzip），不接受压缩时返回None"""
+    if not accept_encoding:
+        return None
+    
+    weights = _parse_weights(accept_encoding)
+    for encoding in supported_encodings():
+        if weights.get(encoding, weights.get("*", 0.0)) > 0:
+            return encoding
+    return None
+
+def cache_control(is_stable: bool) -> str:
+    """
+    快照稳定时允许客户端和nginx在max-age内直接复用响应；
+    首次加载期间每批写入都会产生新快照，要求每次用ETag重新验证
+    """
+    if not is_stable:
+        return "no-cache"
+    return f"public, max-age={settings.http_cache_max_age}"
+
+def conditional_response(request: Request, response_cache: ResponseCache, version: int,
+                         key: Hashable, build: Callable[[], BaseModel], is_stable: bool = True,
+                         is_search: bool = False) -> Response:
+    """
+    带ETag的缓存响应：If-None-Match命中时直接返回304，不读取文章数据；
+    否则按Accept选择JSON/MessagePack/CBOR，按Accept-Encoding返回按快照版本缓存的原始或预压缩响应体。
+    build()返回响应模型，每种格式每个快照只编码一次
+    """
+    media_type = choose_media_type(request.headers.get("accept"))
+    key = representation_key(key, media_type)
+    encoding = choose_encoding(request.headers.get("accept-encoding"))
+    headers = {
+        "ETag": make_etag(version, key, encoding),
+        "Cache-Control": cache_control(is_stable),
+        "Vary": "Accept, Accept-Encoding"
+    }
+    if etag_matches(request.headers.get("if-none-match"), make_etag(version, key)):
+        return Response(status_code=304, headers=headers)
+    
+    body, used_encoding = response_cache.get_or_build(
+        version, key, lambda: encode_model(build(), media_type), is_search=is_search, encoding=encoding
+    )
+    if used_encoding:
+        headers["Content-Encoding"] = used_encoding
+    else:
+        # 响应体过小未压缩时，ETag不带编码后缀
+        headers["ETag"] = make_etag(version, key)
+    return Response(content=body, media_type=media_type, headers=headers)
+
+def streaming_response(request: Request, version: int, key: Hashable,
+                       open_stream: Callable[[], Tuple[Iterable[bytes], Dict[str, str]]], is_stable: bool = True,
+                       media_type: str = JSON_MEDIA_TYPE) -> Response:
+    """
+    带ETag的流式响应：If-None-Match命中时直接返回304，不调用open_stream()；
+    否则边生成边发送open_stream()返回的数据块（连同附加响应头），响应体不整体驻留内存，
+    也不写入响应缓存（不预压缩）。media_type由调用方协商确定，ETag按媒体类型区分
+    """
+    etag = make_etag(version, representation_key(key, media_type))
+    headers = {
+        "ETag": etag,
+        "Cache-Control": cache_control(is_stable),
+        "Vary": "Accept"
+    }
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    chunks, extra_headers = open_stream()
+    headers.update(extra_headers)
+    return StreamingResponse(chunks, media_type=media_type, headers=headers)
@@ -11,28 +11,116 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from fastapi import APIRouter, Query, HTTPException, Depends
-from typing import List, Optional
+from fastapi import APIRouter, Query, HTTPException, Depends, Request, Response
+from typing import Iterable, Iterator, List, Optional, Union
 import logging
-from datetime import datetime
+from datetime import date, datetime
 
 from services.openharmony_news_crawler import OpenHarmonyNewsCrawler
 from services.news_service import get_news_service, NewsSource
-from models.news import NewsArticle, NewsResponse
-from core.database import get_db
+from models.news import (
+    NewsArticle, NewsArticleSummary, NewsChangesResponse, NewsFacetsResponse, NewsFormat, NewsResponse,
+    NewsSort, NewsSuggestResponse, NewsSummaryResponse, NewsView
+)
+from core.database import search_news_articles
+from core.search_index import normalize_title
 from core.scheduler import get_scheduler
-from core.cache import get_news_cache, ServiceStatus
+from core.cache import get_news_cache, ServiceStatus, decode_cursor
+from core.article_store import get_content_lru
+from core.date_normalizer import get_date_normalizer
+from core.shared_cache import get_shared_cache
+from core.config import settings
+from core.response_cache import ResponseCache
+from api.content_types import JSON_MEDIA_TYPE, encode_model, stream_frame
+from api.http_cache import (
+    choose_media_type, conditional_response, not_modified, representation_key, streaming_response
+)
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/news", tags=["news"])
 
-@router.get("/", response_model=NewsResponse)
+# 已编码响应体缓存（按快照版本自动失效）
+_response_cache = ResponseCache(
+    max_entries=settings.response_cache_max_entries,
+    max_search_entries=settings.response_cache_search_entries,
+    max_bytes=settings.response_cache_max_mb * 1024 * 1024,
+    max_search_bytes=settings.response_cache_search_mb * 1024 * 1024
+)
+
+def _cached_response(request: Request, snapshot, key: tuple, build, is_search: bool = False) -> Response:
+    """
+    返回带ETag的缓存响应：If-None-Match命中时返回304；
+    否则返回缓存的响应体（按Accept编码为JSON/MessagePack/CBOR），未命中时调用build()生成NewsResponse并编码缓存
+    """
+    return conditional_response(
+        request, _response_cache, snapshot.version, key, build,
+        is_stable=not snapshot.is_first_load,
+        is_search=is_search
+    )
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+def _stream_articles(articles: Iterable[Union[NewsArticle, NewsArticleSummary]], separator: bytes,
+                     head: bytes = b"", tail: bytes = b"", media_type: str = JSON_MEDIA_TYPE) -> Iterator[bytes]:
+    """
+    逐篇按media_type编码文章并以separator连接，每news_stream_batch_size篇合并为一个数据块写出；
+    head在读取文章前先行写出，缩短首字节时间
+    """
+    batch_size = settings.news_stream_batch_size
+    try:
+        if head:
+            yield head
+        prefix = b""
+        pending = []
+        for article in articles:
+            pending.append(encode_model(article, media_type))
+            if len(pending) >= batch_size:
+                yield prefix + separator.join(pending)
+                prefix = separator
+                pending = []
+        if pending:
+            yield prefix + separator.join(pending)
+        if tail:
+            yield tail
+    except Exception as e:
+        # 响应头已发出，无法再返回500，只能中断连接
+        logger.error(f"流式输出新闻列表失败: {e}")
+        raise
+
+def _all_response(view: NewsView, articles: list, total: int, version: int) -> Union[NewsResponse, NewsSummaryResponse]:
+    """不分页的全部文章响应（一页包含全部匹配文章）"""
+    response_model = NewsSummaryResponse if view == NewsView.SUMMARY else NewsResponse
+    return response_model(articles=articles, total=total, page=1, page_size=total,
+                          has_next=False, has_prev=False, version=version)
+
+def _preparing_response(view: NewsView, page: int, page_size: int) -> Union[NewsResponse, NewsSummaryResponse]:
+    """服务准备中时的空列表响应，与请求的视图使用相同的响应结构"""
+    response_model = NewsSummaryResponse if view == NewsView.SUMMARY else NewsResponse
+    return response_model(articles=[], total=0, page=page, page_size=page_size,
+                          has_next=False, has_prev=False)
+
+def _stream_document(envelope: Union[NewsResponse, NewsSummaryResponse],
+                     articles: Iterable[Union[NewsArticle, NewsArticleSummary]],
+                     media_type: str = JSON_MEDIA_TYPE) -> Iterator[bytes]:
+    """以分块方式输出与envelope结构相同的文档（JSON/MessagePack/CBOR），articles数组逐篇写入"""
+    head, separator, tail = stream_frame(envelope, envelope.total, media_type)
+    return _stream_articles(articles, separator, head, tail, media_type)
+
+@router.get("/", response_model=Union[NewsResponse, NewsSummaryResponse])
 async def get_news(
+    request: Request,
     page: int = Query(1, ge=1, description="页码"),
     page_size: int = Query(20, ge=1, le=100, description="每页数量"),
     category: Optional[str] = Query(None, description="新闻分类"),
+    source: Optional[str] = Query(None, description="新闻来源"),
     search: Optional[str] = Query(None, description="搜索关键词"),
-    all: bool = Query(False, description="是否返回全部新闻不分页")
+    sort: NewsSort = Query(NewsSort.DATE, description="搜索结果排序：date按日期，relevance按相关度（检索正文）"),
+    cursor: Optional[str] = Query(None, description="分页游标（取自上一页的next_cursor）"),
+    view: NewsView = Query(NewsView.FULL, description="返回视图：full为完整文章，summary为不含内容块的列表摘要"),
+    start_date: Optional[date] = Query(None, description="起始日期（含），格式YYYY-MM-DD"),
+    end_date: Optional[date] = Query(None, description="结束日期（含），格式YYYY-MM-DD"),
+    all: bool = Query(False, description="是否返回全部新闻不分页"),
+    format: NewsFormat = Query(NewsFormat.JSON, description="响应格式：json为单个文档，ndjson为每行一篇文章的流式响应（不分页）")
 ):
     """
     获取新闻列表，支持分页、分类和搜索
@@ -41,48 +129,106 @@ async def get_news(
     - page: 页码（当all=True时忽略）
     - page_size: 每页数量（当all=True时忽略）
     - category: 新闻分类过滤
+    - source: 新闻来源过滤
     - search: 搜索关键词
-    - all: 是否返回全部新闻不分页，为true时返回所有匹配的新闻
+    - sort: 搜索结果排序，relevance按BM25相关度排序并检索正文，结果数上限由search_ranked_max_results决定，不支持游标分页
+    - cursor: 键集分页游标，传入时忽略page，从上一页最后一篇文章之后继续（分批写入期间翻页稳定）
+    - view: 返回视图，summary只返回标题、日期、摘要和首图等列表字段，完整内容通过详情接口获取
+    - start_date/end_date: 按文章日期过滤（含两端），可与分类、来源、搜索组合使用
+    - all: 是否返回全部新闻不分页，为true时返回所有匹配的新闻；
+      匹配数超过news_stream_min_articles时分块流式输出同结构的JSON文档
+    - format: ndjson时忽略分页参数，逐行流式输出全部匹配文章，
+      总数和快照版本分别在X-Total-Count和X-Snapshot-Version响应头中返回
+    
+    format为json时按Accept请求头返回JSON、MessagePack（application/msgpack）或CBOR（application/cbor）
     """
     try:
+        if start_date and end_date and start_date > end_date:
+            raise HTTPException(status_code=400, detail="起始日期不能晚于结束日期")
+        if cursor and search and sort == NewsSort.RELEVANCE:
+            raise HTTPException(status_code=400, detail="相关度排序不支持游标分页，请使用page参数")
+        
+        # 校验分页游标
+        if cursor and not all:
+            try:
+                decode_cursor(cursor)
+            except ValueError:
+                raise HTTPException(status_code=400, detail="无效的分页游标")
+        
         # 从缓存获取数据
         cache = get_news_cache()
-        cache_status = cache.get_status()
+        snapshot = cache.snapshot  # 一次读取快照，状态与数据保持一致
         
         # 检查服务状态
-        if cache_status["status"] == ServiceStatus.ERROR.value:
+        if snapshot.status == ServiceStatus.ERROR:
             raise HTTPException(
                 status_code=503, 
-                detail=f"服务暂时不可用: {cache_status.get('error_message', '未知错误')}"
+                detail=f"服务暂时不可用: {snapshot.error_message or '未知错误'}"
             )
         
         # 如果服务正在准备中，返回提示信息
-        if cache_status["status"] == ServiceStatus.PREPARING.value:
-            return NewsResponse(
-                articles=[],
-                total=0,
-                page=page,
-                page_size=page_size,
-                has_next=False,
-                has_prev=False
-            )
+        if snapshot.status == ServiceStatus.PREPARING:
+            if format == NewsFormat.NDJSON:
+                return Response(content=b"", media_type=NDJSON_MEDIA_TYPE)
+            return _preparing_response(view, page, page_size)
+        
+        # 相关度索引在后台构建完成前暂按日期排序；缓存键和ETag使用实际的排序方式，索引就绪后不会命中旧结果
+        sort = cache.resolve_sort(search, sort, snapshot)
+        filters = (view.value, category, source, search, start_date, end_date, sort.value if search else None)
+        is_stable = not snapshot.is_first_load
+        
+        # 任意日期范围与搜索词一样取值分散，放入有界LRU，避免挤掉常规列表缓存
+        is_search = bool(search) or start_date is not None or end_date is not None
+        
+        # 不分页时只在需要生成响应时才过滤文章，304和响应缓存命中时不重复搜索
+        selected = []
+        def select_all():
+            if not selected:
+                selected.append(cache.iter_news(category=category, search=search, source=source,
+                                                snapshot=snapshot, view=view,
+                                                start_date=start_date, end_date=end_date, sort=sort))
+            return selected[0]
+        
+        # 流式输出：只引用本次读取的快照，逐篇生成文章，内存占用与文章总数无关
+        if format == NewsFormat.NDJSON:
+            def open_ndjson():
+                total, articles = select_all()
+                chunks = _stream_articles(articles, b"\n", tail=b"\n" if total else b"")
+                return chunks, {"X-Total-Count": str(total), "X-Snapshot-Version": str(snapshot.version)}
+            return streaming_response(request, snapshot.version, ("ndjson",) + filters, open_ndjson,
+                                      is_stable=is_stable, media_type=NDJSON_MEDIA_TYPE)
         
-        # 从缓存获取数据
         if all:
-            # 如果要返回全部数据，设置一个很大的page_size来获取所有数据
-            result = cache.get_news(page=1, page_size=10000, 
-                                  category=category, search=search)
-            # 重新设置分页信息，表示这是全部数据
-            result.page = 1
-            result.page_size = result.total
-            result.has_next = False
-            result.has_prev = False
+            cache_key = ("list",) + filters + ("all",)
+            # 同一快照和查询的匹配数固定，整体缓存或流式输出的选择也固定，两种方式共用ETag
+            media_type = choose_media_type(request.headers.get("accept"))
+            if not (not_modified(request, snapshot.version, cache_key, media_type) or
+                    _response_cache.contains(snapshot.version, representation_key(cache_key, media_type), is_search)):
+                total, articles = select_all()
+                if total > settings.news_stream_min_articles:
+                    envelope = _all_response(view, [], total, snapshot.version)
+                    return streaming_response(
+                        request, snapshot.version, cache_key,
+                        lambda: (_stream_document(envelope, articles, media_type), {}),
+                        is_stable=is_stable, media_type=media_type
+                    )
+        elif cursor:
+            cache_key = ("list",) + filters + ("cursor", cursor, page_size)
         else:
-            # 正常分页逻辑
-            result = cache.get_news(page=page, page_size=page_size, 
-                                  category=category, search=search)
+            cache_key = ("list",) + filters + (page, page_size)
         
-        return result
+        # 从缓存获取数据
+        def build_result() -> Union[NewsResponse, NewsSummaryResponse]:
+            if all:
+                # 结果较少时整体生成并缓存响应体，一页返回全部匹配文章
+                total, articles = select_all()
+                return _all_response(view, list(articles), total, snapshot.version)
+            # 正常分页逻辑（传入游标时使用键集分页）
+            return cache.get_news(page=page, page_size=page_size, 
+                                  category=category, search=search, source=source,
+                                  snapshot=snapshot, cursor=cursor, view=view,
+                                  start_date=start_date, end_date=end_date, sort=sort)
+        return _cached_response(request, snapshot, cache_key, build_result, is_search=is_search)
         
     except HTTPException:
         raise
@@ -90,11 +236,13 @@ async def get_news(
         logger.error(f"获取新闻列表失败: {e}")
         raise HTTPException(status_code=500, detail="获取新闻列表失败")
 
-@router.get("/openharmony", response_model=NewsResponse)
+@router.get("/openharmony", response_model=Union[NewsResponse, NewsSummaryResponse])
 async def get_openharmony_news(
+    request: Request,
     page: int = Query(1, ge=1, description="页码"),
     page_size: int = Query(20, ge=1, le=100, description="每页数量"),
-    search: Optional[str] = Query(None, description="搜索关键词")
+    search: Optional[str] = Query(None, description="搜索关键词"),
+    view: NewsView = Query(NewsView.FULL, description="返回视图：full为完整文章，summary为不含内容块的列表摘要")
 ):
     """
     获取OpenHarmony官网最新资讯
@@ -102,43 +250,26 @@ async def get_openharmony_news(
     try:
         # 从缓存获取数据，过滤OpenHarmony来源
         cache = get_news_cache()
-        cache_status = cache.get_status()
+        snapshot = cache.snapshot  # 一次读取快照，状态与数据保持一致
         
         # 检查服务状态
-        if cache_status["status"] == ServiceStatus.ERROR.value:
+        if snapshot.status == ServiceStatus.ERROR:
             raise HTTPException(
                 status_code=503, 
-                detail=f"服务暂时不可用: {cache_status.get('error_message', '未知错误')}"
+                detail=f"服务暂时不可用: {snapshot.error_message or '未知错误'}"
             )
         
         # 如果服务正在准备中，返回提示信息
-        if cache_status["status"] == ServiceStatus.PREPARING.value:
-            return NewsResponse(
-                articles=[],
-                total=0,
-                page=page,
-                page_size=page_size,
-                has_next=False,
-                has_prev=False
-            )
+        if snapshot.status == ServiceStatus.PREPARING:
+            return _preparing_response(view, page, page_size)
         
-        # 从缓存获取数据，只返回OpenHarmony来源的文章
-        result = cache.get_news(page=page, page_size=page_size, 
-                              category="官方动态", search=search)
-        
-        # 过滤只保留OpenHarmony来源的文章
-        filtered_articles = [
-            article for article in result.articles 
-            if getattr(article, 'source', None) == 'OpenHarmony'
-        ]
-        
-        return NewsResponse(
-            articles=filtered_articles,
-            total=len(filtered_articles),
-            page=page,
-            page_size=page_size,
-            has_next=len(filtered_articles) == page_size,
-            has_prev=page > 1
+        # 从缓存的(分类, 来源)视图获取数据，只返回OpenHarmony来源的文章
+        return _cached_response(
+            request, snapshot, ("openharmony", view.value, search, page, page_size),
+            lambda: cache.get_news(page=page, page_size=page_size, 
+                                   category="官方动态", search=search,
+                                   source="OpenHarmony", snapshot=snapshot, view=view),
+            is_search=bool(search)
         )
         
     except HTTPException:
@@ -147,11 +278,13 @@ async def get_openharmony_news(
         logger.error(f"获取OpenHarmony官网新闻失败: {e}")
         raise HTTPException(status_code=500, detail="获取OpenHarmony官网新闻失败")
 
-@router.get("/blog", response_model=NewsResponse)
+@router.get("/blog", response_model=Union[NewsResponse, NewsSummaryResponse])
 async def get_openharmony_blog(
+    request: Request,
     page: int = Query(1, ge=1, description="页码"),
     page_size: int = Query(20, ge=1, le=100, description="每页数量"),
-    search: Optional[str] = Query(None, description="搜索关键词")
+    search: Optional[str] = Query(None, description="搜索关键词"),
+    view: NewsView = Query(NewsView.FULL, description="返回视图：full为完整文章，summary为不含内容块的列表摘要")
 ):
     """
     获取OpenHarmony技术博客文章
@@ -159,43 +292,26 @@ async def get_openharmony_blog(
     try:
         # 从缓存获取数据，过滤技术博客来源
         cache = get_news_cache()
-        cache_status = cache.get_status()
+        snapshot = cache.snapshot  # 一次读取快照，状态与数据保持一致
         
         # 检查服务状态
-        if cache_status["status"] == ServiceStatus.ERROR.value:
+        if snapshot.status == ServiceStatus.ERROR:
             raise HTTPException(
                 status_code=503, 
-                detail=f"服务暂时不可用: {cache_status.get('error_message', '未知错误')}"
+                detail=f"服务暂时不可用: {snapshot.error_message or '未知错误'}"
             )
         
         # 如果服务正在准备中，返回提示信息
-        if cache_status["status"] == ServiceStatus.PREPARING.value:
-            return NewsResponse(
-                articles=[],
-                total=0,
-                page=page,
-                page_size=page_size,
-                has_next=False,
-                has_prev=False
-            )
+        if snapshot.status == ServiceStatus.PREPARING:
+            return _preparing_response(view, page, page_size)
         
-        # 从缓存获取数据，只返回技术博客来源的文章
-        result = cache.get_news(page=page, page_size=page_size, 
-                              category="技术博客", search=search)
-        
-        # 过滤只保留OpenHarmony技术博客来源的文章
-        filtered_articles = [
-            article for article in result.articles 
-            if getattr(article, 'source', None) == 'OpenHarmony技术博客'
-        ]
-        
-        return NewsResponse(
-            articles=filtered_articles,
-            total=len(filtered_articles),
-            page=page,
-            page_size=page_size,
-            has_next=len(filtered_articles) == page_size,
-            has_prev=page > 1
+        # 从缓存的(分类, 来源)视图获取数据，只返回技术博客来源的文章
+        return _cached_response(
+            request, snapshot, ("blog", view.value, search, page, page_size),
+            lambda: cache.get_news(page=page, page_size=page_size, 
+                                   category="技术博客", search=search,
+                                   source="OpenHarmony技术博客", snapshot=snapshot, view=view),
+            is_search=bool(search)
         )
         
     except HTTPException:
@@ -204,6 +320,148 @@ async def get_openharmony_blog(
         logger.error(f"获取OpenHarmony技术博客失败: {e}")
         raise HTTPException(status_code=500, detail="获取OpenHarmony技术博客失败")
 
+@router.get("/changes", response_model=NewsChangesResponse)
+async def get_news_changes(
+    request: Request,
+    since: int = Query(..., ge=0, description="客户端已同步的快照版本号（取自列表响应的version）")
+):
+    """
+    获取自指定快照版本以来新增、变化和移除的文章（增量同步）
+    
+    since已超出服务端保留的差异历史时返回full_resync=true，客户端需通过all=true重新全量拉取
+    """
+    try:
+        cache = get_news_cache()
+        snapshot = cache.snapshot  # 一次读取快照，状态与数据保持一致
+        
+        # 检查服务状态
+        if snapshot.status == ServiceStatus.ERROR:
+            raise HTTPException(
+                status_code=503, 
+                detail=f"服务暂时不可用: {snapshot.error_message or '未知错误'}"
+            )
+        
+        def build_result() -> NewsChangesResponse:
+            changes = cache.get_changes(since, snapshot=snapshot)
+            if changes is None:
+                logger.info(f"📝 [增量同步] 版本 {since} 已超出差异历史，要求客户端全量同步")
+                return NewsChangesResponse(since=since, version=snapshot.version, full_resync=True)
+            return NewsChangesResponse(since=since, **changes)
+        
+        # since取值不受限，使用独立的有界LRU缓存
+        return _cached_response(request, snapshot, ("changes", since), build_result, is_search=True)
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"获取增量变化失败: {e}")
+        raise HTTPException(status_code=500, detail="获取增量变化失败")
+
+@router.get("/facets", response_model=NewsFacetsResponse)
+async def get_news_facets(
+    request: Request,
+    search: Optional[str] = Query(None, description="搜索关键词（只统计命中的文章）")
+):
+    """
+    获取按分类、来源和月份统计的文章数
+    
+    不带搜索词时直接返回快照发布时统计好的直方图；带搜索词时通过搜索索引统计命中的文章
+    """
+    try:
+        cache = get_news_cache()
+        snapshot = cache.snapshot  # 一次读取快照，状态与数据保持一致
+        
+        if snapshot.status == ServiceStatus.ERROR:
+            raise HTTPException(
+                status_code=503, 
+                detail=f"服务暂时不可用: {snapshot.error_message or '未知错误'}"
+            )
+        
+        return _cached_response(
+            request, snapshot, ("facets", search or None),
+            lambda: cache.get_facets(search=search, snapshot=snapshot),
+            is_search=bool(search)
+        )
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"获取分面统计失败: {e}")
+        raise HTTPException(status_code=500, detail="获取分面统计失败")
+
+@router.get("/suggest", response_model=NewsSuggestResponse)
+async def get_news_suggestions(
+    request: Request,
+    q: str = Query(..., min_length=1, max_length=100, description="已输入的搜索词（标题前缀）"),
+    limit: int = Query(10, ge=1, le=20, description="返回数量")
+):
+    """
+    搜索框自动补全：返回标题（或标题中某个词）以q开头的最新文章标题
+    
+    使用快照发布时构建的有序后缀数组二分查找，不扫描全部文章
+    """
+    try:
+        cache = get_news_cache()
+        snapshot = cache.snapshot  # 一次读取快照，状态与数据保持一致
+        
+        if snapshot.status == ServiceStatus.ERROR:
+            raise HTTPException(
+                status_code=503, 
+                detail=f"服务暂时不可用: {snapshot.error_message or '未知错误'}"
+            )
+        
+        # 输入取值分散，放入有界LRU
+        return _cached_response(
+            request, snapshot, ("suggest", normalize_title(q), limit),
+            lambda: cache.get_suggestions(q, limit=limit, snapshot=snapshot),
+            is_search=True
+        )
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"获取搜索补全失败: {e}")
+        raise HTTPException(status_code=500, detail="获取搜索补全失败")
+
+@router.get("/archive", response_model=NewsSummaryResponse)
+def get_archived_news(
+    page: int = Query(1, ge=1, description="页码"),
+    page_size: int = Query(20, ge=1, le=100, description="每页数量"),
+    category: Optional[str] = Query(None, description="新闻分类"),
+    source: Optional[str] = Query(None, description="新闻来源"),
+    search: Optional[str] = Query(None, description="搜索关键词（检索标题、摘要和正文）")
+):
+    """
+    查询文章归档（历次爬取写入数据库的全部文章，包括已不在当前缓存中的文章）
+    
+    有搜索词时由SQLite FTS5全文索引按相关度排序，否则按日期由近到远；每次只从磁盘读取当前页
+    """
+    if not settings.news_archive_enabled:
+        raise HTTPException(status_code=404, detail="文章归档未启用")
+    try:
+        rows, total = search_news_articles(
+            search, category=category, source=source,
+            limit=page_size, offset=(page - 1) * page_size
+        )
+    except Exception as e:
+        logger.error(f"查询文章归档失败: {e}")
+        raise HTTPException(status_code=500, detail="查询文章归档失败")
+    
+    return NewsSummaryResponse(
+        articles=[
+            NewsArticleSummary(
+                id=row["article_id"], title=row["title"], date=row["date"], url=row["url"],
+                category=row["category"], summary=row["summary"], source=row["source"], image=row["image"]
+            )
+            for row in rows
+        ],
+        total=total,
+        page=page,
+        page_size=page_size,
+        has_next=page * page_size < total,
+        has_prev=page > 1
+    )
+
 
 @router.post("/crawl")
 async def crawl_news(
@@ -237,20 +495,19 @@ async def get_article_detail(article_id: str):
     try:
         # 从缓存中查找指定文章
         cache = get_news_cache()
-        cache_status = cache.get_status()
+        snapshot = cache.snapshot  # 一次读取快照，状态与数据保持一致
         
         # 检查服务状态
-        if cache_status["status"] == ServiceStatus.ERROR.value:
+        if snapshot.status == ServiceStatus.ERROR:
             raise HTTPException(
                 status_code=503, 
-                detail=f"服务暂时不可用: {cache_status.get('error_message', '未知错误')}"
+                detail=f"服务暂时不可用: {snapshot.error_message or '未知错误'}"
             )
         
-        # 获取所有文章并查找指定ID
-        all_news = cache.get_news(page=1, page_size=1000)
-        for article in all_news.articles:
-            if article.id == article_id:
-                return article
+        # 通过快照的ID索引直接查找，与文章总数无关
+        article = cache.get_article(article_id, snapshot=snapshot)
+        if article is not None:
+            return article
         
         # 如果没找到，返回404
         raise HTTPException(status_code=404, detail="文章不存在")
@@ -273,9 +530,14 @@ async def get_service_status():
         # 获取新闻服务信息
         news_service = get_news_service()
         news_sources = news_service.get_news_sources()
+        coordinator = get_shared_cache()
         
         return {
             "service_status": status_info,
+            "response_cache": _response_cache.get_stats(),
+            "content_cache": get_content_lru().get_stats(),
+            "date_parser": get_date_normalizer().get_stats(),
+            "worker_role": coordinator.role if coordinator is not None else "standalone",
             "news_sources": news_sources,
             "timestamp": datetime.now().isoformat(),
             "endpoints": {
@@ -283,6 +545,7 @@ async def get_service_status():
                 "openharmony_news": "/api/news/openharmony",
                 "openharmony_blog": "/api/news/blog",
                 "news_detail": "/api/news/{article_id}",
+                "news_changes": "/api/news/changes?since={version}",
                 "manual_crawl": "/api/news/crawl",
                 "service_status": "/api/news/status/info",
                 "cache_refresh": "/api/news/cache/refresh"
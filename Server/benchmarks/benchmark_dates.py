@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+# Copyright (c) 2025 XBXyftx
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+日期解析基准测试：原有的三个解析函数 vs 统一的预编译解析（有/无LRU）
+
+日期字符串模拟真实数据：接口返回的startTime为YYYY-MM-DD或带时间，少量为点号/斜杠/中文格式，
+缓存中的日期已由爬虫标准化为YYYY-MM-DD；同一天发布多篇文章，字符串重复度高。
+原有函数的实现复制在本文件中作为对照。
+
+用法: python benchmarks/benchmark_dates.py [--dates 50000] [--page-size 200]
+"""
+
+import argparse
+import logging
+import random
+import re
+import time
+from datetime import date, datetime, timedelta
+
+import synthetic_corpus  # noqa: F401  设置导入路径
+
+from core.date_normalizer import DateNormalizer
+
+
+def legacy_parse_date_for_sorting(date_str):
+    """原NewsCache._parse_date_for_sorting（去掉日志）"""
+    try:
+        if not date_str or not isinstance(date_str, str):
+            return datetime(1970, 1, 1)
+        date_str = date_str.strip()
+        date_patterns = [
+            r'(\d{4})[-./](\d{1,2})[-./](\d{1,2})',
+            r'(\d{4})年(\d{1,2})月(\d{1,2})日?',
+            r'(\d{4})年(\d{1,2})月(\d{1,2})',
+            r'(\d{1,2})[-./](\d{1,2})[-./](\d{4})',
+        ]
+        for pattern in date_patterns:
+            match = re.search(pattern, date_str)
+            if match:
+                groups = match.groups()
+                try:
+                    if pattern.startswith(r'(\d{1,2})'):
+                        day, month, year = groups
+                    else:
+                        year, month, day = groups
+                    year, month, day = int(year), int(month), int(day)
+                    if 1 <= month <= 12 and 1 <= day <= 31 and 1900 <= year <= 2100:
+                        return datetime(year, month, day)
+                except (ValueError, TypeError):
+                    continue
+        date_formats = [
+            '%Y-%m-%d', '%Y.%m.%d', '%Y/%m/%d', '%Y-%m-%d %H:%M:%S', '%Y.%m.%d %H:%M:%S',
+            '%Y/%m/%d %H:%M:%S', '%Y年%m月%d日', '%Y年%m月%d', '%m-%d', '%m.%d', '%m/%d',
+        ]
+        for date_format in date_formats:
+            try:
+                parsed_date = datetime.strptime(date_str, date_format)
+                if '%Y' not in date_format:
+                    parsed_date = parsed_date.replace(year=datetime.now().year)
+                return parsed_date
+            except ValueError:
+                continue
+        number_match = re.findall(r'\d+', date_str)
+        if len(number_match) >= 3:
+            try:
+                nums = [int(x) for x in number_match[:3]]
+                if nums[0] > 1900:
+                    year, month, day = nums[0], nums[1], nums[2]
+                elif nums[2] > 1900:
+                    day, month, year = nums[0], nums[1], nums[2]
+                else:
+                    year = datetime.now().year
+                    month, day = nums[0], nums[1]
+                if 1 <= month <= 12 and 1 <= day <= 31:
+                    return datetime(year, month, day)
+            except (ValueError, IndexError):
+                pass
+        return datetime(1970, 1, 1)
+    except Exception:
+        return datetime(1970, 1, 1)
+
+
+def legacy_standardize_date(date_str):
+    """原OpenHarmonyNewsCrawler._standardize_date（去掉日志）"""
+    if not date_str:
+        return ''
+    match = re.search(r'(\d{4})[.\-\/年](\d{1,2})[.\-\/月](\d{1,2})[日]?', str(date_str))
+    if match:
+        year, month, day = match.groups()
+        return f"{year}-{int(month):02d}-{int(day):02d}"
+    month_match = re.search(r'(\d{4})[.\-\/年](\d{1,2})[月]?', str(date_str))
+    if month_match:
+        year, month = month_match.groups()
+        return f"{year}-{int(month):02d}-01"
+    return date_str
+
+
+def legacy_format_date(date_str):
+    """原OpenHarmonyBlogCrawler._format_date"""
+    if not date_str:
+        return datetime.now().strftime('%Y-%m-%d')
+    if '.' in date_str:
+        date_str = date_str.replace('.', '-')
+    try:
+        return datetime.strptime(date_str, '%Y-%m-%d').strftime('%Y-%m-%d')
+    except ValueError:
+        return date_str
+
+
+def make_dates(count, seed=11):
+    """生成日期字符串：约3年内的发布日期，每天多篇，格式按真实数据的比例混合"""
+    rng = random.Random(seed)
+    start = date(2023, 1, 1)
+    formats = [
+        (lambda d: d.isoformat(), 70),
+        (lambda d: f"{d.isoformat()} {rng.randint(0, 23):02d}:{rng.randint(0, 59):02d}:00", 15),
+        (lambda d: f"{d.year}.{d.month}.{d.day}", 6),
+        (lambda d: f"{d.year}/{d.month:02d}/{d.day:02d}", 5),
+        (lambda d: f"{d.year}年{d.month}月{d.day}日", 4),
+    ]
+    makers, weights = zip(*formats)
+    return [
+        rng.choices(makers, weights)[0](start + timedelta(days=rng.randint(0, 1000)))
+        for _ in range(count)
+    ]
+
+
+def timed(func):
+    start = time.perf_counter()
+    func()
+    return (time.perf_counter() - start) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="日期解析基准测试")
+    parser.add_argument("--dates", type=int, default=50000, help="日期字符串数量")
+    parser.add_argument("--page-size", type=int, default=200, help="列表页大小（批量接口每次处理的数量）")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    raw_dates = make_dates(args.dates)
+    cached_dates = [legacy_standardize_date(value) for value in raw_dates]  # 缓存中已标准化的日期
+    pages = [raw_dates[i:i + args.page_size] for i in range(0, len(raw_dates), args.page_size)]
+
+    # 结果一致性校验
+    normalizer = DateNormalizer(cache_size=0)
+    for value in raw_dates:
+        parsed = normalizer.parse(value)
+        assert parsed == legacy_parse_date_for_sorting(value).date(), value
+        assert normalizer.normalize(value) == legacy_standardize_date(value), value
+    assert normalizer.failures == 0
+
+    uncached = DateNormalizer(cache_size=0)
+    cached = DateNormalizer(cache_size=4096)
+    cached_cold = DateNormalizer(cache_size=4096)
+    rows = [
+        ("缓存排序键（原_parse_date_for_sorting）", timed(lambda: [legacy_parse_date_for_sorting(v) for v in cached_dates])),
+        ("缓存排序键（统一解析，无LRU）", timed(lambda: [uncached.parse(v) for v in cached_dates])),
+        ("缓存排序键（统一解析，LRU冷启动）", timed(lambda: [cached_cold.parse(v) for v in cached_dates])),
+        ("新闻列表页（原_standardize_date）", timed(lambda: [[legacy_standardize_date(v) for v in page] for page in pages])),
+        ("博客列表页（原_format_date）", timed(lambda: [[legacy_format_date(v) for v in page] for page in pages])),
+        ("列表页（统一解析，批量+LRU）", timed(lambda: [cached.normalize_many(page) for page in pages])),
+    ]
+
+    print(f"{len(raw_dates)} 个日期字符串，{len(set(raw_dates))} 个不同取值，列表页 {args.page_size} 条")
+    print(f"{'方案':<36}{'总耗时 (ms)':>14}{'每条 (us)':>12}")
+    for name, elapsed in rows:
+        print(f"{name:<36}{elapsed:>14.1f}{elapsed * 1000 / len(raw_dates):>12.2f}")
+    print(f"LRU统计: {cached.get_stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# Copyright (c) 2025 XBXyftx
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# 
+#     http://www.apache.org/licenses/LICENSE-2.0
+# 
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+文章详情延迟基准测试：正文未压缩 vs zlib压缩（有/无解压LRU）
+
+访问分布模拟详情页热点：大部分请求集中在最近的少量文章上（Zipf分布）。
+
+用法: python benchmarks/benchmark_detail.py [--articles 20000] [--requests 20000]
+"""
+
+import argparse
+import logging
+import random
+import time
+
+from synthetic_corpus import make_articles, percentile
+
+from core.article_store import get_content_lru
+from core.cache import NewsCache
+from core.config import settings
+
+
+def zipf_ids(ids, count, seed=7, exponent=1.1):
+    """按Zipf分布生成访问序列，排名越靠前（越新）的文章访问越频繁"""
+    rng = random.Random(seed)
+    weights = [1 / (rank + 1) ** exponent for rank in range(len(ids))]
+    return rng.choices(ids, weights=weights, k=count)
+
+
+def measure(cache, workload):
+    samples = []
+    for article_id in workload:
+        start = time.perf_counter()
+        cache.get_article(article_id)
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description="文章详情延迟基准测试")
+    parser.add_argument("--articles", type=int, default=20000, help="合成文章数量")
+    parser.add_argument("--requests", type=int, default=20000, help="详情请求数量")
+    parser.add_argument("--blocks", type=int, default=8, help="每篇文章的内容块数量")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+
+    print(f"生成 {args.articles} 篇合成文章...")
+    articles = make_articles(args.articles, content_blocks=args.blocks)
+    lru = get_content_lru()
+    default_entries = lru.max_entries
+
+    results = []
+    for label, compress, lru_entries in (("未压缩", False, 0),
+                                         ("压缩+无LRU", True, 0),
+                                         (f"压缩+LRU({default_entries})", True, default_entries)):
+        settings.cache_compress_content = compress
+        lru.max_entries = lru_entries
+        lru.clear()
+
+        cache = NewsCache()
+        cache.update_cache(articles)
+        ids = [article.id for article in cache.snapshot.articles]
+        workload = zipf_ids(ids, args.requests)
+
+        samples = measure(cache, workload)
+        stats = lru.get_stats()
+        lookups = stats["hits"] + stats["misses"]
+        hit_rate = stats["hits"] / lookups * 100 if compress and lookups else 0.0
+        results.append((label, samples, hit_rate))
+
+    print(f"{'存储方式':<18}{'p50 (ms)':>12}{'p99 (ms)':>12}{'LRU命中率':>12}")
+    for label, samples, hit_rate in results:
+        print(f"{label:<18}{percentile(samples, 50):>12.4f}{percentile(samples, 99):>12.4f}{hit_rate:>11.1f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# Copyright (c) 2025 XBXyftx
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+响应格式基准测试：all=true全量响应的JSON vs MessagePack vs CBOR
+
+统计编码耗时（从响应模型到字节）、解码耗时（客户端解析为字典/列表）以及原始和gzip压缩后的响应体大小。
+未安装msgpack/cbor2时跳过对应格式。
+
+用法: python benchmarks/benchmark_formats.py [--articles 5000] [--blocks 8] [--rounds 5] [--view full]
+"""
+
+import argparse
+import gzip
+import json
+import logging
+import time
+
+from synthetic_corpus import make_articles
+
+from api.content_types import CBOR_MEDIA_TYPE, JSON_MEDIA_TYPE, MSGPACK_MEDIA_TYPE, cbor2, encode_model, msgpack
+from core.cache import NewsCache
+from models.news import NewsView
+
+
+def best_of(func, rounds):
+    """返回(最短耗时毫秒, 最后一次的结果)"""
+    best = float("inf")
+    result = None
+    for _ in range(rounds):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="响应格式基准测试")
+    parser.add_argument("--articles", type=int, default=5000, help="合成文章数量")
+    parser.add_argument("--blocks", type=int, default=8, help="每篇文章的内容块数量")
+    parser.add_argument("--rounds", type=int, default=5, help="每种格式的重复次数（取最短耗时）")
+    parser.add_argument("--view", choices=[view.value for view in NewsView], default=NewsView.FULL.value, help="返回视图")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+
+    print(f"生成 {args.articles} 篇合成文章（每篇 {args.blocks} 个内容块）...")
+    cache = NewsCache()
+    cache.update_cache(make_articles(args.articles, content_blocks=args.blocks))
+    response = cache.get_news(page=1, page_size=args.articles, view=NewsView(args.view))
+
+    formats = [(JSON_MEDIA_TYPE, json.loads)]
+    if msgpack is not None:
+        formats.append((MSGPACK_MEDIA_TYPE, msgpack.unpackb))
+    else:
+        print("未安装msgpack，跳过MessagePack")
+    if cbor2 is not None:
+        formats.append((CBOR_MEDIA_TYPE, cbor2.loads))
+    else:
+        print("未安装cbor2，跳过CBOR")
+
+    expected = json.loads(encode_model(response))
+    print(f"{'格式':<22}{'编码 (ms)':>12}{'解码 (ms)':>12}{'原始 (KB)':>12}{'gzip (KB)':>12}")
+    for media_type, decode in formats:
+        encode_ms, body = best_of(lambda: encode_model(response, media_type), args.rounds)
+        decode_ms, decoded = best_of(lambda: decode(body), args.rounds)
+        assert decoded == expected, media_type  # 各格式解码后的数据与JSON一致
+        compressed = gzip.compress(body, compresslevel=9, mtime=0)
+        print(f"{media_type:<22}{encode_ms:>12.1f}{decode_ms:>12.1f}"
+              f"{len(body) / 1024:>12.1f}{len(compressed) / 1024:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# Copyright (c) 2025 XBXyftx
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# 
+#     http://www.apache.org/licenses/LICENSE-2.0
+# 
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+缓存内存占用基准测试：pydantic文章模型 vs 紧凑文章记录（正文未压缩/zlib压缩）
+
+用法: python benchmarks/benchmark_memory.py [--articles 20000] [--blocks 8]
+"""
+
+import argparse
+import gc
+import logging
+import tracemalloc
+
+from synthetic_corpus import make_article_dicts
+
+from core.article_store import ArticleRecord, compress_content
+from core.cache import NewsCache
+from models.news import NewsArticle
+
+
+def traced_bytes() -> int:
+    gc.collect()
+    return tracemalloc.get_traced_memory()[0]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="缓存内存占用基准测试")
+    parser.add_argument("--articles", type=int, default=20000, help="合成文章数量")
+    parser.add_argument("--blocks", type=int, default=8, help="每篇文章的内容块数量")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+
+    print(f"生成 {args.articles} 篇合成文章（每篇 {args.blocks} 个内容块）...")
+
+    # 统计口径包含文章持有的全部字符串：语料在跟踪开始后生成，转换后释放输入
+    tracemalloc.start()
+    baseline = traced_bytes()
+
+    # 原有方式：缓存直接持有pydantic模型
+    dicts = make_article_dicts(args.articles, content_blocks=args.blocks)
+    articles = [NewsArticle(**item) for item in dicts]
+    del dicts
+    pydantic_bytes = traced_bytes() - baseline
+
+    # 紧凑记录（正文未压缩）：转换后释放pydantic模型，只保留记录
+    records = [ArticleRecord.from_article(article, compress=False) for article in articles]
+    del articles
+    record_bytes = traced_bytes() - baseline
+
+    # 紧凑记录（正文zlib压缩）：压缩后原始正文字符串随记录一起释放
+    records = [
+        ArticleRecord.from_article(NewsArticle(**item), compress=True)
+        for item in make_article_dicts(args.articles, content_blocks=args.blocks)
+    ]
+    compressed_bytes = traced_bytes() - baseline
+
+    # 完整快照：紧凑记录 + 排序键、搜索索引、视图和ID/URL索引（按配置压缩正文）
+    del records
+    cache = NewsCache()
+    cache.update_cache([
+        NewsArticle(**item) for item in make_article_dicts(args.articles, content_blocks=args.blocks)
+    ])
+    snapshot_bytes = traced_bytes() - baseline
+
+    tracemalloc.stop()
+
+    count = args.articles
+    print(f"{'存储方式':<16}{'总计 (MB)':>12}{'每篇 (字节)':>14}")
+    for label, total in (("pydantic模型", pydantic_bytes),
+                         ("紧凑记录", record_bytes),
+                         ("紧凑记录+压缩正文", compressed_bytes),
+                         ("完整快照(含索引)", snapshot_bytes)):
+        print(f"{label:<16}{total / 1024 / 1024:>12.1f}{total / count:>14.0f}")
+    print(f"紧凑记录节省: {(1 - record_bytes / pydantic_bytes) * 100:.1f}%")
+    print(f"紧凑记录+压缩正文节省: {(1 - compressed_bytes / pydantic_bytes) * 100:.1f}%")
+
+    # 压缩率取决于正文内容：合成语料词表较小，压缩率高于真实中文正文
+    sample = [ArticleRecord.from_article(NewsArticle(**item), compress=False)
+              for item in make_article_dicts(200, content_blocks=args.blocks)]
+    raw_size = sum(len("".join(value for _, value in record.content).encode("utf-8")) for record in sample)
+    compressed_size = sum(len(compress_content(record.content)) for record in sample)
+    print(f"正文压缩率（合成语料）: {raw_size / compressed_size:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
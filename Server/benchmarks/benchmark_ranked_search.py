@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# Copyright (c) 2025 XBXyftx
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+相关度搜索基准测试：BM25索引的构建/增量追加耗时与查询延迟
+
+用法: python benchmarks/benchmark_ranked_search.py [--articles 50000] [--vocabulary 5000] [--rounds 20]
+--vocabulary 0 使用均匀抽词的语料（每篇文章几乎包含全部查询词，阈值算法无法提前结束，为最坏情况）
+"""
+
+import argparse
+import logging
+import time
+
+from synthetic_corpus import DEFAULT_QUERIES, make_articles, percentile
+
+import core.search_index as search_index
+from core.search_index import BM25SearchIndex
+from models.news import ContentType
+
+
+def body_texts(article):
+    return [block.value for block in article.content if block.type in (ContentType.TEXT, ContentType.CODE)]
+
+
+def measure(func, rounds):
+    samples = []
+    for _ in range(rounds):
+        for query in DEFAULT_QUERIES:
+            start = time.perf_counter()
+            func(query)
+            samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description="相关度搜索基准测试")
+    parser.add_argument("--articles", type=int, default=50000, help="合成文章数量")
+    parser.add_argument("--vocabulary", type=int, default=5000, help="正文Zipf词表大小，0为均匀抽词")
+    parser.add_argument("--batch", type=int, default=100, help="增量追加的批次大小")
+    parser.add_argument("--rounds", type=int, default=20, help="每个查询的重复次数")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+
+    print(f"生成 {args.articles} 篇合成文章（词表: {args.vocabulary or '均匀'}）...")
+    articles = make_articles(args.articles, zipf_vocabulary=args.vocabulary)
+    entries = [(a.title, a.summary, body_texts(a)) for a in articles]
+
+    start = time.perf_counter()
+    index = BM25SearchIndex.build(entries)
+    print(f"索引构建耗时: {time.perf_counter() - start:.2f}秒")
+
+    # 增量追加：在已有索引上逐批追加，每批耗时只与批次大小相关
+    incremental = BM25SearchIndex.build(entries[:-args.batch * 5])
+    batch_times = []
+    for offset in range(len(entries) - args.batch * 5, len(entries), args.batch):
+        start = time.perf_counter()
+        for title, summary, body in entries[offset:offset + args.batch]:
+            incremental.add(title, summary, body)
+        batch_times.append((time.perf_counter() - start) * 1000)
+    print(f"增量追加 {args.batch} 篇/批: 平均 {sum(batch_times) / len(batch_times):.1f} ms")
+
+    # 结果一致性校验：阈值算法与对全部倒排项打分的结果一致
+    exhaustive_max = search_index.EXHAUSTIVE_MAX_POSTINGS
+    for query in DEFAULT_QUERIES:
+        search_index.EXHAUSTIVE_MAX_POSTINGS = 0
+        pruned = index.search(query, 20)
+        search_index.EXHAUSTIVE_MAX_POSTINGS = float("inf")
+        assert [doc_id for doc_id, _ in pruned] == [doc_id for doc_id, _ in index.search(query, 20)], query
+    search_index.EXHAUSTIVE_MAX_POSTINGS = exhaustive_max
+
+    for query in DEFAULT_QUERIES:
+        index.search(query, 20)  # 预热：首次查询时构建各词的权重降序排列
+
+    rows = [
+        ("首页(20)", measure(lambda q: index.search(q, 20), args.rounds)),
+        ("前100", measure(lambda q: index.search(q, 100), args.rounds)),
+        ("总数", measure(lambda q: index.count(q, 1000), args.rounds)),
+    ]
+    print(f"{'查询':<12}{'p50 (ms)':>12}{'p99 (ms)':>12}")
+    for name, samples in rows:
+        print(f"{name:<12}{percentile(samples, 50):>12.3f}{percentile(samples, 99):>12.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# Copyright (c) 2025 XBXyftx
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# 
+#     http://www.apache.org/licenses/LICENSE-2.0
+# 
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+搜索延迟基准测试：线性扫描 vs n-gram倒排索引
+
+用法: python benchmarks/benchmark_search.py [--articles 50000] [--rounds 20]
+"""
+
+import argparse
+import logging
+import time
+
+from synthetic_corpus import DEFAULT_QUERIES, make_articles, percentile
+
+from core.search_index import NgramSearchIndex
+
+
+def linear_scan(articles, search):
+    """原有实现：复制列表并逐篇小写化匹配"""
+    filtered_news = articles.copy()
+    search_lower = search.lower()
+    return [
+        news for news in filtered_news
+        if search_lower in news.title.lower() or
+           (news.summary and search_lower in news.summary.lower())
+    ]
+
+
+def indexed_search(articles, index, search):
+    return [articles[doc_id] for doc_id in index.search(search)]
+
+
+def measure(func, rounds):
+    samples = []
+    for _ in range(rounds):
+        for query in DEFAULT_QUERIES:
+            start = time.perf_counter()
+            func(query)
+            samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description="搜索延迟基准测试")
+    parser.add_argument("--articles", type=int, default=50000, help="合成文章数量")
+    parser.add_argument("--rounds", type=int, default=20, help="每个查询的重复次数")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+
+    print(f"生成 {args.articles} 篇合成文章...")
+    articles = make_articles(args.articles, content_blocks=1)
+
+    start = time.perf_counter()
+    index = NgramSearchIndex.build((a.title, a.summary) for a in articles)
+    print(f"索引构建耗时: {time.perf_counter() - start:.2f}秒")
+
+    # 结果一致性校验
+    for query in DEFAULT_QUERIES:
+        assert linear_scan(articles, query) == indexed_search(articles, index, query), query
+
+    scan = measure(lambda q: linear_scan(articles, q), args.rounds)
+    indexed = measure(lambda q: indexed_search(articles, index, q), args.rounds)
+
+    print(f"{'方式':<12}{'p50 (ms)':>12}{'p99 (ms)':>12}")
+    print(f"{'线性扫描':<12}{percentile(scan, 50):>12.3f}{percentile(scan, 99):>12.3f}")
+    print(f"{'倒排索引':<12}{percentile(indexed, 50):>12.3f}{percentile(indexed, 99):>12.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# Copyright (c) 2025 XBXyftx
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+全量导出基准测试：整体生成JSON文档 vs 分块流式输出（JSON文档 / NDJSON）
+
+对每个语料规模统计首字节时间、完整输出耗时和单次请求的内存峰值（tracemalloc，不含快照本身）。
+流式输出的数据块在生成后立即丢弃，模拟逐块写入连接。
+
+用法: python benchmarks/benchmark_streaming.py [--sizes 1000,5000,20000] [--blocks 8]
+"""
+
+import argparse
+import gc
+import logging
+import time
+import tracemalloc
+
+from synthetic_corpus import make_articles
+
+from api.news import _stream_articles, _stream_document
+from core.cache import NewsCache
+from models.news import NewsResponse
+
+
+def full_document(cache, snapshot):
+    """原有方式：一页取出全部文章，整体编码为JSON"""
+    total = len(snapshot.articles)
+    result = cache.get_news(page=1, page_size=max(total, 1), snapshot=snapshot)
+    yield result.model_dump_json().encode("utf-8")
+
+
+def chunked_document(cache, snapshot):
+    total, articles = cache.iter_news(snapshot=snapshot)
+    envelope = NewsResponse(articles=[], total=total, page=1, page_size=total,
+                            has_next=False, has_prev=False, version=snapshot.version)
+    return _stream_document(envelope, articles)
+
+
+def ndjson(cache, snapshot):
+    total, articles = cache.iter_news(snapshot=snapshot)
+    return _stream_articles(articles, b"\n", tail=b"\n" if total else b"")
+
+
+def measure(produce, cache, snapshot):
+    """返回(首字节毫秒, 总耗时毫秒, 输出字节数, 内存峰值字节)；计时与内存统计分两轮，避免tracemalloc影响耗时"""
+    gc.collect()
+    start = time.perf_counter()
+    first_byte = None
+    size = 0
+    for chunk in produce(cache, snapshot):
+        if first_byte is None:
+            first_byte = time.perf_counter() - start
+        size += len(chunk)
+        del chunk
+    elapsed = time.perf_counter() - start
+
+    gc.collect()
+    tracemalloc.start()
+    for chunk in produce(cache, snapshot):
+        del chunk
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return first_byte * 1000, elapsed * 1000, size, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description="全量导出基准测试")
+    parser.add_argument("--sizes", default="1000,5000,20000", help="语料规模，逗号分隔")
+    parser.add_argument("--blocks", type=int, default=8, help="每篇文章的内容块数量")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+
+    modes = [("整体JSON", full_document), ("分块JSON", chunked_document), ("NDJSON", ndjson)]
+    print(f"{'文章数':>8}{'方式':>10}{'首字节 (ms)':>14}{'总耗时 (ms)':>14}{'输出 (MB)':>12}{'内存峰值 (MB)':>16}")
+    for count in (int(size) for size in args.sizes.split(",")):
+        cache = NewsCache()
+        cache.update_cache(make_articles(count, content_blocks=args.blocks))
+        snapshot = cache.snapshot
+        for name, produce in modes:
+            first_byte, elapsed, size, peak = measure(produce, cache, snapshot)
+            print(f"{count:>8}{name:>10}{first_byte:>14.1f}{elapsed:>14.1f}"
+                  f"{size / 1024 / 1024:>12.1f}{peak / 1024 / 1024:>16.1f}")
+
+        # 三种方式输出的文章一致
+        document = b"".join(full_document(cache, snapshot))
+        assert b"".join(chunked_document(cache, snapshot)) == document
+        assert len(b"".join(ndjson(cache, snapshot)).splitlines()) == count
+
+
+if __name__ == "__main__":
+    main()
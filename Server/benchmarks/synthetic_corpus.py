@@ -0,0 +1,109 @@
+# Copyright (c) 2025 XBXyftx
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# 
+#     http://www.apache.org/licenses/LICENSE-2.0
+# 
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+基准测试用的合成新闻语料
+"""
+
+import hashlib
+import itertools
+import random
+import statistics
+import sys
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Dict, List
+
+# 添加项目根目录到Python路径
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+WORDS = [
+    "OpenHarmony", "鸿蒙", "开源", "社区", "开发者", "大会", "ArkTS", "ArkUI", "API",
+    "版本", "发布", "生态", "设备", "分布式", "内核", "应用", "框架", "适配", "合作伙伴",
+    "技术", "峰会", "SIG", "贡献", "代码", "驱动", "安全", "性能", "优化", "教程", "实践",
+    "LiteOS", "HDF", "DevEco", "Studio", "组件", "动画", "图形", "媒体", "网络", "蓝牙",
+]
+
+CATEGORIES = [("官方动态", "OpenHarmony"), ("技术博客", "OpenHarmony技术博客")]
+
+DEFAULT_QUERIES = [
+    "鸿", "鸿蒙", "开发者大会", "arkts", "openharmony", "api", "性能优化",
+    "分布式 设备", "devEco studio", "不存在的关键词",
+]
+
+
+def _sentence(rng: random.Random, min_words: int, max_words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(rng.randint(min_words, max_words)))
+
+
+def _zipf_sentence_maker(vocabulary_size: int):
+    """
+    按Zipf分布（词频与排名成反比）抽词造句，更接近真实语料的词频分布：
+    WORDS中的词分散在不同排名上，其余位置用合成词填充
+    """
+    vocabulary = [f"term{rank}" for rank in range(vocabulary_size)]
+    step = max(vocabulary_size // len(WORDS), 1)
+    for i, word in enumerate(WORDS):
+        vocabulary[min(i * step, vocabulary_size - 1)] = word
+    cum_weights = list(itertools.accumulate(1.0 / (rank + 1) for rank in range(vocabulary_size)))
+
+    def sentence(rng: random.Random, min_words: int, max_words: int) -> str:
+        return " ".join(rng.choices(vocabulary, cum_weights=cum_weights, k=rng.randint(min_words, max_words)))
+    return sentence
+
+
+def make_article_dicts(count: int, seed: int = 42, content_blocks: int = 8,
+                       zipf_vocabulary: int = 0) -> List[Dict]:
+    """
+    生成与爬虫输出格式一致的文章字典；
+    zipf_vocabulary大于0时正文按该词表大小的Zipf分布抽词，否则从WORDS中均匀抽词（每篇文章几乎包含全部词）
+    """
+    rng = random.Random(seed)
+    body_sentence = _zipf_sentence_maker(zipf_vocabulary) if zipf_vocabulary > 0 else _sentence
+    start = date(2020, 1, 1)
+    articles = []
+    for i in range(count):
+        category, source = CATEGORIES[i % len(CATEGORIES)]
+        url = f"https://www.openharmony.cn/news/{i}"
+        content = []
+        for j in range(content_blocks):
+            if j % 4 == 3:
+                content.append({"type": "image", "value": f"https://www.openharmony.cn/img/{i}_{j}.png"})
+            else:
+                content.append({"type": "text", "value": body_sentence(rng, 20, 60)})
+        articles.append({
+            "id": hashlib.md5(url.encode()).hexdigest()[:16],
+            "title": _sentence(rng, 3, 8),
+            "date": (start + timedelta(days=rng.randint(0, 2000))).strftime("%Y-%m-%d"),
+            "url": url,
+            "content": content,
+            "category": category,
+            "summary": _sentence(rng, 10, 30),
+            "source": source,
+            "created_at": datetime(2025, 1, 1, 8, 0, 0).isoformat(),
+            "updated_at": datetime(2025, 1, 1, 8, 0, 0).isoformat(),
+        })
+    return articles
+
+
+def make_articles(count: int, seed: int = 42, content_blocks: int = 8, zipf_vocabulary: int = 0):
+    """生成NewsArticle对象列表"""
+    from models.news import NewsArticle
+    return [NewsArticle(**item) for item in make_article_dicts(count, seed, content_blocks, zipf_vocabulary)]
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """计算百分位数（毫秒样本）"""
+    if len(samples) < 2:
+        return samples[0] if samples else 0.0
+    return statistics.quantiles(samples, n=100, method="inclusive")[int(pct) - 1]
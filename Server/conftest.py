@@ -0,0 +1,34 @@
+"""
+Shared pytest fixtures for the news cache tests
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to Python path
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from models.news import ContentType, NewsArticle, NewsContentBlock
+
+
+def _make_article(index: int, **fields) -> NewsArticle:
+    """Deterministic test article; keyword arguments override individual fields"""
+    values = dict(
+        id=str(index),
+        title=f"OpenHarmony 新闻 {index}",
+        date=f"2024-{index % 12 + 1:02d}-{index % 28 + 1:02d}",
+        url=f"https://example.com/news/{index}",
+        content=[NewsContentBlock(type=ContentType.TEXT, value=f"正文 {index}")],
+        category="官方动态" if index % 2 else "技术博客",
+        source="OpenHarmony"
+    )
+    values.update(fields)
+    return NewsArticle(**values)
+
+
+@pytest.fixture
+def make_article():
+    """Factory fixture: make_article(index, **overrides) -> NewsArticle"""
+    return _make_article
@@ -0,0 +1,249 @@
+# Copyright (c) 2025 XBXyftx
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# 
+#     http://www.apache.org/licenses/LICENSE-2.0
+# 
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import sys
+import threading
+import zlib
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, Optional, Tuple, Union
+
+from core.config import settings
+from models.news import ContentType, NewsArticle, NewsArticleSummary, NewsContentBlock
+
+# 内容块：(类型, 值)，类型为ContentType枚举成员（全局单例，不额外占用内存）
+ContentBlock = Tuple[ContentType, str]
+
+ZLIB_LEVEL = 6
+_CONTENT_TYPES: Dict[str, ContentType] = {content_type.value: content_type for content_type in ContentType}
+
+
+def compress_content(content: Tuple[ContentBlock, ...]) -> bytes:
+    """将内容块序列化为紧凑JSON并用zlib压缩；相同内容的压缩结果逐字节一致"""
+    if not content:
+        return b""
+    payload = json.dumps(
+        [[block_type.value, value] for block_type, value in content],
+        ensure_ascii=False, separators=(",", ":")
+    )
+    return zlib.compress(payload.encode("utf-8"), ZLIB_LEVEL)
+
+
+def decompress_content(blob: bytes) -> Tuple[ContentBlock, ...]:
+    """解压并还原内容块"""
+    if not blob:
+        return ()
+    return tuple(
+        (_CONTENT_TYPES[block_type], value)
+        for block_type, value in json.loads(zlib.decompress(blob))
+    )
+
+
+class ContentLRU:
+    """
+    最近解压的正文LRU缓存
+
+    以压缩数据本身为键：bytes对象缓存了哈希值，查找时先比较对象身份，
+    内容更新后旧记录的条目自然淘汰，不会返回过期正文
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[bytes, Tuple[ContentBlock, ...]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, blob: bytes) -> Tuple[ContentBlock, ...]:
+        """返回解压后的内容块，未命中时解压并缓存"""
+        with self._lock:
+            content = self._entries.get(blob)
+            if content is not None:
+                self._entries.move_to_end(blob)
+                self.hits += 1
+                return content
+            self.misses += 1
+
+        # 解压在锁外执行，避免阻塞其他读取方
+        content = decompress_content(blob)
+        if self.max_entries > 0:
+            with self._lock:
+                self._entries[blob] = content
+                self._entries.move_to_end(blob)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return content
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+# 全局正文解压缓存
+_content_lru = ContentLRU(settings.content_cache_entries)
+
+def get_content_lru() -> ContentLRU:
+    """获取正文解压缓存实例"""
+    return _content_lru
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    """驻留重复度高的短字符串（分类、来源、日期），相同取值在内存中只保留一份"""
+    return sys.intern(value) if value else value
+
+
+class ArticleRecord:
+    """
+    缓存内部使用的紧凑文章记录
+
+    使用__slots__代替pydantic模型的实例字典和字段集合，分类/来源/日期字符串驻留共享；
+    正文只有详情视图需要，默认以zlib压缩保存，读取content时经LRU按需解压。
+    只在响应边界通过to_article()/to_summary()生成pydantic模型。
+    记录创建后不再修改，可在多个快照之间共享。
+    """
+
+    __slots__ = (
+        "id", "title", "date", "url", "category", "summary", "source",
+        "_content", "image", "created_at", "updated_at",
+    )
+
+    def __init__(self, id: Optional[str], title: str, date: str, url: str,
+                 content: Union[bytes, Tuple[ContentBlock, ...]] = (),
+                 category: Optional[str] = None,
+                 summary: Optional[str] = None,
+                 source: Optional[str] = None,
+                 image: Optional[str] = None,
+                 created_at: Optional[datetime] = None,
+                 updated_at: Optional[datetime] = None):
+        self.id = id
+        self.title = title
+        self.date = _intern(date)
+        self.url = url
+        self._content = content  # 压缩后的bytes，或未压缩的内容块元组
+        self.category = _intern(category)
+        self.summary = summary
+        self.source = _intern(source)
+        self.image = image  # 首张图片URL（列表缩略图），写入时提取一次
+        self.created_at = created_at
+        self.updated_at = updated_at
+
+    @property
+    def content(self) -> Tuple[ContentBlock, ...]:
+        """内容块（压缩保存时经LRU解压）"""
+        return self.get_content()
+
+    def get_content(self, use_lru: bool = True) -> Tuple[ContentBlock, ...]:
+        """
+        获取内容块；use_lru为False时直接解压且不写入LRU，
+        用于整页/全量列表等一次性读取，避免挤掉详情页的热点正文
+        """
+        content = self._content
+        if isinstance(content, bytes):
+            return _content_lru.get(content) if use_lru else decompress_content(content)
+        return content
+
+    @property
+    def is_compressed(self) -> bool:
+        return isinstance(self._content, bytes)
+
+    @property
+    def content_blob(self) -> bytes:
+        """压缩后的正文（用于持久化，已压缩时直接返回）"""
+        content = self._content
+        return content if isinstance(content, bytes) else compress_content(content)
+
+    @classmethod
+    def from_blob(cls, content_blob: Optional[bytes], compress: Optional[bool] = None, **fields) -> "ArticleRecord":
+        """由压缩正文和其余字段还原记录（用于加载持久化快照），compress默认取配置"""
+        if compress is None:
+            compress = settings.cache_compress_content
+        content_blob = bytes(content_blob or b"")
+        return cls(content=content_blob if compress else decompress_content(content_blob), **fields)
+
+    @classmethod
+    def from_article(cls, article: NewsArticle, compress: Optional[bool] = None) -> "ArticleRecord":
+        """从pydantic文章模型转换为紧凑记录，compress默认取配置cache_compress_content"""
+        content = tuple((block.type, block.value) for block in article.content)
+        image = next((value for block_type, value in content if block_type == ContentType.IMAGE), None)
+        if compress is None:
+            compress = settings.cache_compress_content
+        return cls(
+            id=article.id,
+            title=article.title,
+            date=article.date,
+            url=article.url,
+            content=compress_content(content) if compress else content,
+            category=article.category,
+            summary=article.summary,
+            source=article.source,
+            image=image,
+            created_at=article.created_at,
+            updated_at=article.updated_at
+        )
+
+    def to_article(self, use_lru: bool = True) -> NewsArticle:
+        """在响应边界生成完整的文章模型（数据写入时已校验，跳过重复校验）"""
+        return NewsArticle.model_construct(
+            id=self.id,
+            title=self.title,
+            date=self.date,
+            url=self.url,
+            content=[
+                NewsContentBlock.model_construct(type=block_type, value=value)
+                for block_type, value in self.get_content(use_lru)
+            ],
+            category=self.category,
+            summary=self.summary,
+            source=self.source,
+            created_at=self.created_at,
+            updated_at=self.updated_at
+        )
+
+    def to_summary(self) -> NewsArticleSummary:
+        """在响应边界生成列表卡片摘要模型（不含内容块）"""
+        return NewsArticleSummary.model_construct(
+            id=self.id,
+            title=self.title,
+            date=self.date,
+            url=self.url,
+            category=self.category,
+            summary=self.summary,
+            source=self.source,
+            image=self.image
+        )
+
+    def same_content(self, other: "ArticleRecord") -> bool:
+        """比较两篇文章的内容是否一致（忽略每次爬取都会变化的created_at/updated_at）"""
+        return (
+            self.id == other.id and self.title == other.title and self.date == other.date and
+            self.summary == other.summary and self.category == other.category and
+            self.source == other.source and self._same_body(other)
+        )
+
+    def _same_body(self, other: "ArticleRecord") -> bool:
+        """比较正文：两者均已压缩时直接比较压缩数据，无需解压"""
+        if type(self._content) is type(other._content):
+            return self._content == other._content
+        return self.get_content(use_lru=False) == other.get_content(use_lru=False)
@@ -12,15 +12,29 @@
 # limitations under the License.
 
 
+import base64
+import hashlib
+import heapq
 import json
 import logging
 import threading
 import time
-from typing import List, Optional, Dict, Any
-from datetime import datetime
+from dataclasses import dataclass, field, replace
+from typing import List, Optional, Dict, Any, Iterable, Iterator, Sequence, Tuple, Union
+from datetime import date, datetime, timedelta
 from enum import Enum
+from operator import itemgetter
 
-from models.news import NewsArticle, NewsResponse
+from models.news import (
+    ContentType, FacetCount, NewsArticle, NewsArticleSummary, NewsFacetsResponse, NewsResponse, NewsSort,
+    NewsSuggestion, NewsSuggestResponse, NewsSummaryResponse, NewsView
+)
+from core.article_store import ArticleRecord
+from core.config import settings
+from core.database import archive_news_articles
+from core.date_normalizer import parse_date
+from core.search_index import BM25SearchIndex, NgramSearchIndex, TitleSuggestIndex
+from core.snapshot_store import SnapshotStore, get_snapshot_store
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -28,301 +42,957 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+_EPOCH = date(1970, 1, 1)
+_TIEBREAK_MASK = (1 << 64) - 1
+_BISECT_INSERT_MAX = 32  # 批次不超过该数量时逐篇二分插入，否则线性归并
+
+def _next_version(current: int) -> int:
+    """
+    生成下一个快照版本号：单调递增且不小于当前毫秒时间戳，
+    服务重启后版本号不会回退，可安全用于ETag和增量同步
+    """
+    return max(current + 1, int(time.time() * 1000))
+
+def encode_cursor(sort_key: int, article_id: Optional[str]) -> str:
+    """将(排序键, 文章ID)编码为不透明的分页游标"""
+    raw = f"{sort_key:x}:{article_id or ''}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+def decode_cursor(cursor: str) -> Tuple[int, str]:
+    """解析分页游标，格式无效时抛出ValueError"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode("utf-8")
+        sort_key, article_id = raw.split(":", 1)
+        return int(sort_key, 16), article_id
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError(f"无效的分页游标: {cursor}") from e
+
+def _bisect_desc(keys: Sequence[int], key: int) -> int:
+    """在单调不增的排序键序列中二分查找第一个不大于key的位置"""
+    lo, hi = 0, len(keys)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if keys[mid] > key:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+def _date_range_bounds(start_date: Optional[date], end_date: Optional[date]) -> Tuple[Optional[int], Optional[int]]:
+    """将日期范围（含两端）换算为排序键区间[lower, upper]，未指定的一端为None"""
+    lower = upper = None
+    if start_date is not None:
+        lower = max((start_date - _EPOCH).days, 0) << 64
+    if end_date is not None:
+        upper = (max((end_date - _EPOCH).days + 1, 0) << 64) - 1
+    return lower, upper
+
+FACET_FIELDS = ("category", "source", "month")
+UNKNOWN_MONTH = "unknown"  # 日期无法解析（纪元天数为0）的文章所属月份
+
+def _count_facets(keyed_articles: Iterable[Tuple[int, ArticleRecord]],
+                  base: Optional[Dict[str, Dict[str, int]]] = None) -> Dict[str, Dict[str, int]]:
+    """统计分类/来源/月份直方图，月份取自排序键高位的纪元天数；传入base时在其副本上累加"""
+    facets = {name: dict(base[name]) if base and name in base else {} for name in FACET_FIELDS}
+    categories, sources, months = facets["category"], facets["source"], facets["month"]
+    month_of_day: Dict[int, str] = {}
+    for sort_key, article in keyed_articles:
+        if article.category:
+            categories[article.category] = categories.get(article.category, 0) + 1
+        if article.source:
+            sources[article.source] = sources.get(article.source, 0) + 1
+        epoch_day = sort_key >> 64
+        month = month_of_day.get(epoch_day)
+        if month is None:
+            month = (_EPOCH + timedelta(days=epoch_day)).strftime("%Y-%m") if epoch_day > 0 else UNKNOWN_MONTH
+            month_of_day[epoch_day] = month
+        months[month] = months.get(month, 0) + 1
+    return facets
+
 class ServiceStatus(str, Enum):
     """服务状态枚举"""
     READY = "ready"           # 服务就绪
     PREPARING = "preparing"   # 准备中（数据更新中）
     ERROR = "error"           # 错误状态
 
+@dataclass(frozen=True)
+class SnapshotDiff:
+    """相邻两个快照版本之间的数据差异，用于增量同步"""
+    from_version: int
+    to_version: int
+    upserted_urls: Tuple[str, ...] = ()  # 新增或内容变化的文章URL
+    removed: Tuple[Tuple[str, Optional[str]], ...] = ()  # 被移除文章的(URL, ID)
+
+@dataclass(frozen=True)
+class NewsSnapshot:
+    """
+    新闻缓存的不可变快照
+    
+    读取方只需读取一次快照引用即可获得一致的数据与状态，无需加锁；
+    写入方在锁外构建新快照，再通过替换引用一次性发布。
+    """
+    version: int = 0  # 数据版本号，每次发布新数据时递增
+    articles: Tuple[ArticleRecord, ...] = ()  # 按日期由近到远排序的文章（紧凑记录，响应时才生成pydantic模型）
+    sort_keys: Tuple[int, ...] = ()  # 与articles一一对应的整数排序键（单调不增）
+    search_index: NgramSearchIndex = field(default_factory=NgramSearchIndex)  # 只追加，快照只可见前len(articles)个文档
+    search_docs: Optional[Tuple[Tuple[int, ArticleRecord], ...]] = None  # 文档编号 -> (排序键, 文章)；None表示编号即articles下标
+    ranked_index: Optional[BM25SearchIndex] = None  # BM25相关度索引，文档编号与search_index一致；None表示未启用或尚未构建
+    suggest_index: Optional[TitleSuggestIndex] = None  # 标题前缀补全索引，文档编号即articles下标；分批写入期间为None
+    views: Dict[Tuple[Optional[str], Optional[str]], Tuple[ArticleRecord, ...]] = field(default_factory=dict)  # (分类, 来源)视图
+    view_keys: Dict[Tuple[Optional[str], Optional[str]], Tuple[int, ...]] = field(default_factory=dict)  # 与视图一一对应的排序键
+    by_id: Dict[str, ArticleRecord] = field(default_factory=dict)  # 文章ID -> 文章
+    by_url: Dict[str, ArticleRecord] = field(default_factory=dict)  # 文章URL -> 文章
+    facets: Dict[str, Dict[str, int]] = field(default_factory=dict)  # 分类/来源/月份直方图，发布时统计
+    status: ServiceStatus = ServiceStatus.READY  # 初始状态为就绪，等待数据分批写入
+    error_message: Optional[str] = None
+    last_update: Optional[str] = None
+    update_count: int = 0
+    is_updating: bool = False  # 标记是否正在更新
+    is_first_load: bool = True  # 标记是否为首次加载
+    history: Tuple[SnapshotDiff, ...] = ()  # 最近若干次数据发布的差异（由旧到新，有界）
+
 class NewsCache:
     """新闻数据缓存管理器"""
     
-    def __init__(self):
-        self._cache: List[NewsArticle] = []
-        self._cache_lock = threading.RLock()  # 可重入锁
-        self._status = ServiceStatus.READY  # 初始状态为就绪，等待数据分批写入
-        self._last_update = None
-        self._update_count = 0
-        self._error_message = None
-        self._is_updating = False  # 标记是否正在更新
-        self._is_first_load = True  # 标记是否为首次加载
+    def __init__(self, history_size: Optional[int] = None, store: Optional[SnapshotStore] = None,
+                 archive: bool = False):
+        self._snapshot = NewsSnapshot()
+        self._cache_lock = threading.RLock()  # 写入锁（可重入），只串行化写入方，读取方不加锁
+        self._history_size = history_size if history_size is not None else settings.news_changes_history
+        self._store = store  # 快照持久化存储，None表示不持久化
+        self._archive = archive  # 是否将写入的文章归档到数据库
+        self._lazy_suggest: Optional[Tuple[int, TitleSuggestIndex]] = None  # 分批写入期间按需构建的(版本, 补全索引)
+        self._ranked_lock = threading.Lock()
+        self._ranked_building: Optional[NgramSearchIndex] = None  # 正在后台为其构建相关度索引的快照（以搜索索引标识）
+    
+    @property
+    def snapshot(self) -> NewsSnapshot:
+        """当前发布的快照（一次原子引用读取）"""
+        return self._snapshot
+    
+    @property
+    def is_first_load(self) -> bool:
+        """是否仍处于首次加载（分批写入）阶段"""
+        return self._snapshot.is_first_load
         
     def get_status(self) -> Dict[str, Any]:
         """获取服务状态"""
+        snapshot = self._snapshot
+        return {
+            "status": snapshot.status.value,
+            "last_update": snapshot.last_update,
+            "cache_count": len(snapshot.articles),
+            "update_count": snapshot.update_count,
+            "error_message": snapshot.error_message,
+            "is_updating": snapshot.is_updating,
+            "is_first_load": snapshot.is_first_load  # 添加首次加载标识
+        }
+    
+    def restore_snapshot(self) -> bool:
+        """
+        从持久化存储同步加载上次发布的快照（服务启动时调用）
+        加载成功后直接以就绪状态提供服务，后台爬取完成后通过完整更新替换
+        """
+        return self._load_from_store(initial=True)
+    
+    def sync_from_store(self) -> bool:
+        """
+        共享快照模式下只读工作进程定期调用：存储中的快照比当前新时同步
+        发布进程只追加了文章（首次加载的分批写入）时只读取新增的行并增量追加索引，
+        两次同步之间的多个批次合并为一次追加；整体替换后才完整重新加载。
+        沿用发布进程的版本号，各工作进程返回的ETag和增量同步版本保持一致
+        """
+        if self._store is None:
+            return False
+        try:
+            stored_version = self._store.get_version("news")
+            if stored_version is None or stored_version <= self._snapshot.version:
+                return False
+            if self._snapshot.articles and self._extend_from_store():
+                return True
+        except Exception as e:
+            logger.warning(f"⚠️ 🔗 [共享快照] 增量同步新闻快照失败，完整重新加载: {e}")
+        return self._load_from_store(initial=False)
+    
+    def _extend_from_store(self) -> bool:
+        """读取当前版本之后追加的文章并增量追加到快照；存储中的快照已整体替换时返回False"""
+        start_time = time.time()
+        current = self._snapshot
+        loaded = self._store.load_news(since_version=current.version)
+        if loaded is None:
+            return False
+        meta, batch = loaded
+        if not batch or meta["replaced_version"] > current.version:
+            return False
+        if any(article.url in current.by_url for _, article in batch):
+            # 已有文章被改写，不是单纯追加
+            return False
+        
         with self._cache_lock:
-            return {
-                "status": self._status.value,
-                "last_update": self._last_update,
-                "cache_count": len(self._cache),
-                "update_count": self._update_count,
-                "error_message": self._error_message,
-                "is_updating": self._is_updating,
-                "is_first_load": self._is_first_load  # 添加首次加载标识
-            }
+            if self._snapshot is not current:
+                return False
+            version = meta["version"]
+            staged_data = self._extend_indexes(current, batch)
+            self._publish(
+                version=version,
+                history=self._record_append(current, batch, version),
+                last_update=meta["last_update"],
+                update_count=meta["update_count"],
+                status=ServiceStatus.READY,
+                error_message=None,
+                is_updating=False,
+                is_first_load=False,
+                **staged_data
+            )
+        logger.info(f"🔗 [共享快照] 增量同步新闻快照（版本 {version}），追加 {len(batch)} 篇文章，耗时 {time.time() - start_time:.3f}秒")
+        return True
+    
+    def _load_from_store(self, initial: bool) -> bool:
+        if self._store is None:
+            return False
+        tag = "💾 [快照持久化]" if initial else "🔗 [共享快照]"
+        try:
+            if not initial:
+                stored_version = self._store.get_version("news")
+                if stored_version is None or stored_version <= self._snapshot.version:
+                    return False
+            
+            start_time = time.time()
+            loaded = self._store.load_news()
+            if loaded is None:
+                if initial:
+                    logger.info(f"{tag} 未找到新闻快照，等待首次爬取")
+                return False
+            meta, keyed_records = loaded
+            staged_data = self._build_indexes(keyed_records)
+            with self._cache_lock:
+                current = self._snapshot
+                version = meta["version"]
+                if version <= current.version:
+                    return False
+                self._publish(
+                    version=version,
+                    # 同步时记录与上一快照的差异，只读工作进程同样支持增量同步
+                    history=() if initial else self._record_diff(current, staged_data, version),
+                    last_update=meta["last_update"],
+                    update_count=meta["update_count"],
+                    status=ServiceStatus.READY if keyed_records else ServiceStatus.PREPARING,
+                    error_message=None,
+                    is_updating=False,
+                    # 已有完整数据，后续爬取结果整体替换，不再分批写入
+                    is_first_load=not keyed_records,
+                    **staged_data
+                )
+            logger.info(f"{tag} 已加载新闻快照（版本 {version}），共 {len(keyed_records)} 篇文章，耗时 {time.time() - start_time:.3f}秒")
+            return bool(keyed_records)
+        except Exception as e:
+            logger.warning(f"⚠️ {tag} 加载新闻快照失败: {e}")
+            return False
+    
+    def _persist(self, keyed_records: List[Tuple[int, ArticleRecord]], replace: bool):
+        """
+        将当前快照写入持久化存储，并将本次写入的文章归档到数据库
+        （调用方需持有写入锁，保证写入顺序与发布顺序一致）
+        """
+        if self._store is not None:
+            snapshot = self._snapshot
+            try:
+                self._store.save_news(snapshot.version, snapshot.last_update, snapshot.update_count,
+                                      keyed_records, replace=replace)
+            except Exception as e:
+                # 持久化失败不影响内存中的快照继续提供服务
+                logger.warning(f"⚠️ [快照持久化] 保存新闻快照失败: {e}")
+        if self._archive:
+            try:
+                archived = archive_news_articles(keyed_records)
+                if archived:
+                    logger.info(f"🗄️ [文章归档] 写入 {archived} 篇新增或变化的文章")
+            except Exception as e:
+                logger.warning(f"⚠️ [文章归档] 归档文章失败: {e}")
+    
+    def _publish(self, **changes) -> NewsSnapshot:
+        """基于当前快照替换部分字段并发布新快照（调用方需持有写入锁）"""
+        self._snapshot = replace(self._snapshot, **changes)
+        return self._snapshot
     
     def set_status(self, status: ServiceStatus, error_message: Optional[str] = None):
         """设置服务状态"""
         with self._cache_lock:
-            self._status = status
-            self._error_message = error_message
+            self._publish(status=status, error_message=error_message)
             logger.info(f"服务状态更新: {status.value}")
     
     def set_updating(self, is_updating: bool):
-        """设置更新状态"""
+        """
+        设置更新状态
+        已有数据时保持就绪，旧快照在更新期间继续提供服务；只有缓存为空时才设为准备中
+        """
         with self._cache_lock:
-            self._is_updating = is_updating
+            self._publish(is_updating=is_updating)
             if is_updating:
+                if self._snapshot.articles:
+                    logger.info("开始数据更新，旧快照继续提供服务")
+                    return
                 logger.info("开始数据更新，状态设为准备中")
                 self.set_status(ServiceStatus.PREPARING)
             else:
                 logger.info("数据更新完成，状态设为就绪")
                 self.set_status(ServiceStatus.READY)
     
-    def get_news(self, page: int = 1, page_size: int = 20, 
-                 category: Optional[str] = None, 
-                 search: Optional[str] = None) -> NewsResponse:
-        """获取新闻数据（带分页和过滤）"""
+    def set_failed(self, error_message: str) -> bool:
+        """
+        记录一次更新失败：已有快照时保持原状态，旧数据继续提供服务，只记录错误信息；
+        缓存为空时才设为错误状态。返回是否保留了旧快照
+        """
         with self._cache_lock:
-            if self._status == ServiceStatus.ERROR:
-                raise Exception(f"服务错误: {self._error_message}")
-            
-            # 过滤数据
-            filtered_news = self._cache.copy()
-            
-            # 分类过滤
+            if self._snapshot.articles:
+                self._publish(error_message=error_message, is_updating=False)
+                logger.warning("⚠️ 更新失败，继续使用旧快照提供服务")
+                return True
+            self._publish(status=ServiceStatus.ERROR, error_message=error_message, is_updating=False)
+            logger.info(f"服务状态更新: {ServiceStatus.ERROR.value}")
+            return False
+    
+    def _select(self, snapshot: NewsSnapshot,
+                category: Optional[str] = None,
+                search: Optional[str] = None,
+                source: Optional[str] = None) -> Tuple[Sequence[ArticleRecord], Sequence[int]]:
+        """按过滤条件从快照中选出文章及其排序键（均保持缓存中的日期顺序）"""
+        if search:
+            # 搜索过滤：通过n-gram倒排索引取得命中文章的下标，再按分类/来源过滤
+            doc_ids = snapshot.search_index.search(search, doc_count=len(snapshot.articles))
+            if snapshot.search_docs is None:
+                hits = [(snapshot.sort_keys[doc_id], snapshot.articles[doc_id]) for doc_id in doc_ids]
+            else:
+                # 分批写入期间文档编号按写入顺序分配，命中结果需按排序键重新排列
+                search_docs = snapshot.search_docs
+                hits = sorted((search_docs[doc_id] for doc_id in doc_ids), key=itemgetter(0), reverse=True)
             if category:
-                filtered_news = [news for news in filtered_news if news.category == category]
-            
-            # 搜索过滤
-            if search:
-                search_lower = search.lower()
-                filtered_news = [
-                    news for news in filtered_news 
-                    if search_lower in news.title.lower() or 
-                       (news.summary and search_lower in news.summary.lower())
-                ]
-            
-            # 🔥 改进：由于缓存写入时已经排序，这里只做轻量级验证
-            # 检查是否需要重新排序（防御性编程）
-            try:
-                if len(filtered_news) > 1:
-                    # 检查前两篇文章的日期顺序
-                    first_date = self._parse_date_for_sorting(filtered_news[0].date)
-                    second_date = self._parse_date_for_sorting(filtered_news[1].date)
-                    
-                    # 如果顺序不对，重新排序
-                    if first_date < second_date:
-                        logger.info("🔄 [读取排序] 检测到顺序异常，执行重新排序")
-                        filtered_news.sort(key=lambda x: self._parse_date_for_sorting(x.date), reverse=True)
-                    else:
-                        logger.debug("✅ [读取排序] 日期顺序正确，无需重新排序")
-            except Exception as e:
-                logger.warning(f"⚠️ [读取排序] 日期顺序检查失败，使用原始顺序: {e}")
-            
-            # 分页处理
-            total = len(filtered_news)
+                hits = [hit for hit in hits if hit[1].category == category]
+            if source:
+                hits = [hit for hit in hits if hit[1].source == source]
+            return [article for _, article in hits], [sort_key for sort_key, _ in hits]
+        if category or source:
+            # 分类/来源过滤：直接使用预先构建的视图，无需扫描全部文章
+            view_key = (category or None, source or None)
+            return snapshot.views.get(view_key, ()), snapshot.view_keys.get(view_key, ())
+        return snapshot.articles, snapshot.sort_keys
+    
+    @staticmethod
+    def _slice_date_range(records: Sequence[ArticleRecord], keys: Sequence[int],
+                          start_date: Optional[date], end_date: Optional[date]
+                          ) -> Tuple[Sequence[ArticleRecord], Sequence[int]]:
+        """
+        按日期范围截取已按排序键由近到远排列的文章：排序键高位即纪元天数，
+        在排序键上二分两次即可定位区间，耗时O(log n + k)，可叠加在分类/来源视图和搜索结果之上
+        """
+        lower, upper = _date_range_bounds(start_date, end_date)
+        begin = _bisect_desc(keys, upper) if upper is not None else 0
+        end = _bisect_desc(keys, lower - 1) if lower is not None else len(keys)
+        if begin == 0 and end == len(keys):
+            return records, keys
+        return records[begin:end], keys[begin:end]
+    
+    def _select_ranked(self, snapshot: NewsSnapshot, search: str, limit: int,
+                       category: Optional[str] = None,
+                       source: Optional[str] = None,
+                       start_date: Optional[date] = None,
+                       end_date: Optional[date] = None) -> Tuple[List[ArticleRecord], List[int], int]:
+        """
+        按BM25相关度选出得分最高的limit篇（得分降序），分类/来源/日期范围作为过滤条件；
+        同时返回命中总数（至多search_ranked_max_results）
+        """
+        search_docs = snapshot.search_docs
+        if search_docs is None:
+            record_of = snapshot.articles.__getitem__
+            key_of = snapshot.sort_keys.__getitem__
+        else:
+            record_of = lambda doc_id: search_docs[doc_id][1]
+            key_of = lambda doc_id: search_docs[doc_id][0]
+        
+        lower, upper = _date_range_bounds(start_date, end_date)
+        
+        def _accept(doc_id: int) -> bool:
+            article = record_of(doc_id)
+            if (category and article.category != category) or (source and article.source != source):
+                return False
+            sort_key = key_of(doc_id)
+            return (lower is None or sort_key >= lower) and (upper is None or sort_key <= upper)
+        
+        has_filter = bool(category or source or lower is not None or upper is not None)
+        accept = _accept if has_filter else None
+        doc_count = len(snapshot.articles)
+        cap = settings.search_ranked_max_results
+        hits = snapshot.ranked_index.search(search, min(limit, cap), doc_count=doc_count, accept=accept)
+        total = snapshot.ranked_index.count(search, cap, doc_count=doc_count, accept=accept)
+        return [record_of(doc_id) for doc_id, _ in hits], [key_of(doc_id) for doc_id, _ in hits], total
+    
+    def get_news(self, page: int = 1, page_size: int = 20, 
+                 category: Optional[str] = None, 
+                 search: Optional[str] = None,
+                 source: Optional[str] = None,
+                 snapshot: Optional[NewsSnapshot] = None,
+                 cursor: Optional[str] = None,
+                 view: NewsView = NewsView.FULL,
+                 start_date: Optional[date] = None,
+                 end_date: Optional[date] = None,
+                 sort: NewsSort = NewsSort.DATE) -> Union[NewsResponse, NewsSummaryResponse]:
+        """
+        获取新闻数据（带分页和过滤），可传入调用方已读取的快照以保证状态与数据一致
+        传入cursor时使用键集分页：忽略page，从游标指向的文章之后继续，
+        在排序键上二分定位，分批写入期间翻页不会重复或遗漏
+        start_date/end_date按文章日期过滤（含两端），在排序键上二分截取
+        sort为relevance且有搜索词时按BM25相关度排序（检索正文，只支持page分页）
+        view为summary时只返回写入时提取的列表摘要字段，不包含内容块
+        只为当前页的文章生成pydantic模型
+        """
+        snapshot = snapshot or self._snapshot
+        if snapshot.status == ServiceStatus.ERROR:
+            raise Exception(f"服务错误: {snapshot.error_message}")
+        
+        # 相关度排序只取到当前页为止的前page*page_size篇，总数单独统计
+        filtered_news, filtered_keys, total, ranked = self._filter_news(
+            snapshot, category, search, source, start_date, end_date, sort, page * page_size
+        )
+        if ranked:
+            cursor = None
+        
+        # 分页处理
+        if cursor:
+            cursor_key, cursor_id = decode_cursor(cursor)
+            start = _bisect_desc(filtered_keys, cursor_key)
+            # 排序键相同的文章按缓存顺序排列，跳过游标文章及其之前的并列文章
+            tie_end = start
+            while tie_end < total and filtered_keys[tie_end] == cursor_key:
+                tie_end += 1
+            for index in range(start, tie_end):
+                if filtered_news[index].id == cursor_id:
+                    start = index + 1
+                    break
+            else:
+                start = tie_end
+            has_prev = start > 0
+        else:
             start = (page - 1) * page_size
-            end = start + page_size
-            paginated_news = filtered_news[start:end]
-            
-            return NewsResponse(
-                articles=paginated_news,
+            has_prev = page > 1
+        end = start + page_size
+        paginated_news = list(filtered_news[start:end])
+        
+        has_next = end < total
+        next_cursor = None
+        if has_next and paginated_news and not ranked:
+            next_cursor = encode_cursor(filtered_keys[end - 1], paginated_news[-1].id)
+        
+        if view == NewsView.SUMMARY:
+            return NewsSummaryResponse(
+                articles=[article.to_summary() for article in paginated_news],
                 total=total,
                 page=page,
                 page_size=page_size,
-                has_next=end < total,
-                has_prev=page > 1
+                has_next=has_next,
+                has_prev=has_prev,
+                next_cursor=next_cursor,
+                version=snapshot.version
+            )
+        
+        return NewsResponse(
+            articles=[article.to_article(use_lru=False) for article in paginated_news],
+            total=total,
+            page=page,
+            page_size=page_size,
+            has_next=has_next,
+            has_prev=has_prev,
+            next_cursor=next_cursor,
+            version=snapshot.version
+        )
+    
+    def _filter_news(self, snapshot: NewsSnapshot,
+                     category: Optional[str], search: Optional[str], source: Optional[str],
+                     start_date: Optional[date], end_date: Optional[date],
+                     sort: NewsSort, limit: int) -> Tuple[Sequence[ArticleRecord], Sequence[int], int, bool]:
+        """
+        按过滤条件选出文章，返回(文章, 排序键, 总数, 是否按相关度排序)
+        相关度排序时只选出得分最高的limit篇；按日期排序时返回全部匹配文章，limit不生效
+        """
+        ranked = bool(search) and self.resolve_sort(search, sort, snapshot) == NewsSort.RELEVANCE
+        if ranked:
+            filtered_news, filtered_keys, total = self._select_ranked(
+                snapshot, search, limit, category, source, start_date, end_date
             )
+            return filtered_news, filtered_keys, total, True
+        
+        # 快照发布时已按排序键排好序并完成校验，读取时无需再解析日期
+        filtered_news, filtered_keys = self._select(snapshot, category, search, source)
+        if start_date is not None or end_date is not None:
+            filtered_news, filtered_keys = self._slice_date_range(filtered_news, filtered_keys, start_date, end_date)
+        return filtered_news, filtered_keys, len(filtered_news), False
     
-    def _parse_date_for_sorting(self, date_str: str) -> datetime:
+    def iter_news(self, category: Optional[str] = None,
+                  search: Optional[str] = None,
+                  source: Optional[str] = None,
+                  snapshot: Optional[NewsSnapshot] = None,
+                  view: NewsView = NewsView.FULL,
+                  start_date: Optional[date] = None,
+                  end_date: Optional[date] = None,
+                  sort: NewsSort = NewsSort.DATE) -> Tuple[int, Iterator[Union[NewsArticle, NewsArticleSummary]]]:
         """
-        解析日期字符串用于排序，支持多种日期格式
-        支持格式：2024-08-31, 2024.08.31, 2024/08/31, 2024年08月31日等
+        不分页地逐篇生成全部匹配文章的模型（用于流式响应），返回(总数, 文章迭代器)
+        迭代器只引用传入的快照，迭代期间发布新快照不影响本次结果；
+        每次只生成一篇文章的模型，内存占用与匹配文章数无关
         """
+        snapshot = snapshot or self._snapshot
+        if snapshot.status == ServiceStatus.ERROR:
+            raise Exception(f"服务错误: {snapshot.error_message}")
+        
+        filtered_news, _, total, _ = self._filter_news(
+            snapshot, category, search, source, start_date, end_date, sort, settings.search_ranked_max_results
+        )
+        if view == NewsView.SUMMARY:
+            return total, (article.to_summary() for article in filtered_news)
+        return total, (article.to_article(use_lru=False) for article in filtered_news)
+    
+    def get_facets(self, search: Optional[str] = None, snapshot: Optional[NewsSnapshot] = None) -> NewsFacetsResponse:
+        """
+        获取分类/来源/月份的文章数统计：不带搜索词时直接返回快照发布时统计好的直方图，
+        带搜索词时通过搜索索引取得命中文章后统计
+        """
+        snapshot = snapshot or self._snapshot
+        if snapshot.status == ServiceStatus.ERROR:
+            raise Exception(f"服务错误: {snapshot.error_message}")
+        
+        if search:
+            articles, sort_keys = self._select(snapshot, search=search)
+            facets, total = _count_facets(zip(sort_keys, articles)), len(articles)
+        else:
+            facets, total = snapshot.facets, len(snapshot.articles)
+        
+        def by_count(counts: Dict[str, int]) -> List[FacetCount]:
+            return [FacetCount(value=value, count=count)
+                    for value, count in sorted(counts.items(), key=lambda item: (-item[1], item[0]))]
+        
+        # 月份由近到远排列，日期无法解析的unknown始终排在最后
+        months = facets.get("month", {})
+        month_order = sorted((month for month in months if month != UNKNOWN_MONTH), reverse=True)
+        if UNKNOWN_MONTH in months:
+            month_order.append(UNKNOWN_MONTH)
+        
+        return NewsFacetsResponse(
+            total=total,
+            category=by_count(facets.get("category", {})),
+            source=by_count(facets.get("source", {})),
+            month=[FacetCount(value=month, count=months[month]) for month in month_order],
+            version=snapshot.version
+        )
+    
+    def resolve_sort(self, search: Optional[str], sort: NewsSort,
+                     snapshot: Optional[NewsSnapshot] = None) -> NewsSort:
+        """
+        返回快照实际采用的排序方式：按相关度排序但该快照的BM25索引尚未构建完成时，
+        在后台开始构建并暂时按日期排序（响应缓存键应使用该返回值，索引就绪后不会命中按日期排序的旧结果）
+        """
+        snapshot = snapshot or self._snapshot
+        if not search or sort != NewsSort.RELEVANCE or snapshot.ranked_index is not None:
+            return sort
+        if settings.search_ranked_enabled and snapshot.articles:
+            self._start_ranked_build(snapshot)
+        return NewsSort.DATE
+    
+    def _start_ranked_build(self, snapshot: NewsSnapshot):
+        """为快照启动后台BM25索引构建线程（同一快照只构建一次）"""
+        with self._ranked_lock:
+            if self._ranked_building is snapshot.search_index:
+                return
+            self._ranked_building = snapshot.search_index
+        threading.Thread(target=self._build_ranked_index, args=(snapshot,),
+                         name="ranked-index-builder", daemon=True).start()
+    
+    def _build_ranked_index(self, snapshot: NewsSnapshot):
+        """
+        在写入锁外为快照的全部文档构建BM25索引，完成后以相同版本号发布到当前快照；
+        构建期间分批追加的文章在发布前补入索引，期间数据被整体替换时丢弃结果
+        """
+        tag = "🔎 [相关度索引]"
         try:
-            if not date_str or not isinstance(date_str, str):
-                logger.warning(f"无效的日期字符串: {date_str}")
-                return datetime(1970, 1, 1)
-            
-            # 清理日期字符串
-            date_str = date_str.strip()
-            
-            # 1. 优先使用正则表达式提取日期组件，支持更多格式
-            import re
-            
-            # 匹配 YYYY-MM-DD, YYYY.MM.DD, YYYY/MM/DD 格式（支持单数字月/日）
-            date_patterns = [
-                r'(\d{4})[-./](\d{1,2})[-./](\d{1,2})',  # 2024-08-31, 2024.08.31, 2024/08/31
-                r'(\d{4})年(\d{1,2})月(\d{1,2})日?',      # 2024年08月31日
-                r'(\d{4})年(\d{1,2})月(\d{1,2})',        # 2024年08月31
-                r'(\d{1,2})[-./](\d{1,2})[-./](\d{4})',  # 31-08-2024, 31.08.2024 (DD-MM-YYYY)
-            ]
-            
-            for pattern in date_patterns:
-                match = re.search(pattern, date_str)
-                if match:
-                    groups = match.groups()
-                    try:
-                        if len(groups) == 3:
-                            # 检查是否是DD-MM-YYYY格式
-                            if pattern.startswith(r'(\d{1,2})'):
-                                day, month, year = groups
-                            else:
-                                year, month, day = groups
-                            
-                            year = int(year)
-                            month = int(month)
-                            day = int(day)
-                            
-                            # 验证日期有效性
-                            if 1 <= month <= 12 and 1 <= day <= 31 and 1900 <= year <= 2100:
-                                parsed_date = datetime(year, month, day)
-                                logger.debug(f"✅ 日期解析成功: {date_str} -> {parsed_date.strftime('%Y-%m-%d')}")
-                                return parsed_date
-                    except (ValueError, TypeError) as e:
-                        logger.debug(f"正则匹配但转换失败: {date_str}, 错误: {e}")
-                        continue
-            
-            # 2. 如果正则匹配失败，尝试标准datetime格式
-            date_formats = [
-                '%Y-%m-%d',           # 2024-08-31
-                '%Y.%m.%d',           # 2024.08.31
-                '%Y/%m/%d',           # 2024/08/31
-                '%Y-%m-%d %H:%M:%S',  # 2024-08-31 10:30:00
-                '%Y.%m.%d %H:%M:%S',  # 2024.08.31 10:30:00
-                '%Y/%m/%d %H:%M:%S',  # 2024/08/31 10:30:00
-                '%Y年%m月%d日',        # 2024年08月31日
-                '%Y年%m月%d',          # 2024年08月31
-                '%m-%d',              # 08-31 (假设为当年)
-                '%m.%d',              # 08.31 (假设为当年)
-                '%m/%d',              # 08/31 (假设为当年)
-            ]
-            
-            for date_format in date_formats:
-                try:
-                    parsed_date = datetime.strptime(date_str, date_format)
-                    # 如果只有月日，补充当前年份
-                    if '%Y' not in date_format:
-                        parsed_date = parsed_date.replace(year=datetime.now().year)
-                    logger.debug(f"✅ strptime解析成功: {date_str} -> {parsed_date.strftime('%Y-%m-%d')}")
-                    return parsed_date
-                except ValueError:
-                    continue
-            
-            # 3. 最后的尝试：提取任何可能的数字组合
-            number_match = re.findall(r'\d+', date_str)
-            if len(number_match) >= 3:
-                try:
-                    # 假设第一个是年份（如果是4位数），否则按顺序处理
-                    nums = [int(x) for x in number_match[:3]]
-                    
-                    # 判断年份位置
-                    if nums[0] > 1900:  # 第一个数字是年份
-                        year, month, day = nums[0], nums[1], nums[2]
-                    elif nums[2] > 1900:  # 第三个数字是年份
-                        day, month, year = nums[0], nums[1], nums[2]
-                    else:
-                        # 默认当前年份
-                        year = datetime.now().year
-                        month, day = nums[0], nums[1]
-                    
-                    if 1 <= month <= 12 and 1 <= day <= 31:
-                        parsed_date = datetime(year, month, day)
-                        logger.debug(f"✅ 数字提取解析成功: {date_str} -> {parsed_date.strftime('%Y-%m-%d')}")
-                        return parsed_date
-                except (ValueError, IndexError):
-                    pass
-            
-            # 最后的fallback：返回Unix纪元时间
-            logger.warning(f"⚠️ 无法解析日期格式: '{date_str}'，使用默认时间")
-            return datetime(1970, 1, 1)
-            
+            start_time = time.time()
+            search_docs = snapshot.search_docs
+            records = snapshot.articles if search_docs is None else [article for _, article in search_docs]
+            ranked_index = BM25SearchIndex.build(
+                (article.title, article.summary, self._body_texts(article)) for article in records
+            )
+            with self._cache_lock:
+                current = self._snapshot
+                if current.search_index is not snapshot.search_index or current.ranked_index is not None:
+                    logger.info(f"{tag} 构建期间数据已整体替换，丢弃本次构建结果")
+                    return
+                if current.search_docs is not None:
+                    # 文档编号与search_index一致：补入构建期间追加的文档
+                    for _, article in current.search_docs[len(ranked_index):]:
+                        ranked_index.add(article.title, article.summary, self._body_texts(article))
+                self._publish(ranked_index=ranked_index)
+            logger.info(f"{tag} 后台构建完成，共 {len(ranked_index)} 篇文章，耗时 {time.time() - start_time:.3f}秒")
         except Exception as e:
-            logger.error(f"❌ 日期解析异常: '{date_str}', 错误: {e}")
-            return datetime(1970, 1, 1)
+            logger.warning(f"⚠️ {tag} 后台构建失败: {e}")
+        finally:
+            with self._ranked_lock:
+                if self._ranked_building is snapshot.search_index:
+                    self._ranked_building = None
+    
+    def get_suggestions(self, query: str, limit: int = 10,
+                        snapshot: Optional[NewsSnapshot] = None) -> NewsSuggestResponse:
+        """标题前缀补全：返回标题（或标题中某个词）以query开头的最新至多limit篇文章"""
+        snapshot = snapshot or self._snapshot
+        if snapshot.status == ServiceStatus.ERROR:
+            raise Exception(f"服务错误: {snapshot.error_message}")
+        
+        suggest_index = snapshot.suggest_index
+        if suggest_index is None:
+            # 分批写入期间每批都重建代价过高，改为查询时为当前快照构建一次并复用
+            lazy = self._lazy_suggest
+            if lazy is not None and lazy[0] == snapshot.version:
+                suggest_index = lazy[1]
+            else:
+                suggest_index = TitleSuggestIndex(article.title for article in snapshot.articles)
+                self._lazy_suggest = (snapshot.version, suggest_index)
+        
+        articles = snapshot.articles
+        return NewsSuggestResponse(
+            query=query,
+            suggestions=[
+                NewsSuggestion(id=articles[doc_id].id, title=articles[doc_id].title, date=articles[doc_id].date)
+                for doc_id in suggest_index.suggest(query, limit)
+            ],
+            version=snapshot.version
+        )
+    
+    def get_changes(self, since: int, snapshot: Optional[NewsSnapshot] = None) -> Optional[Dict[str, Any]]:
+        """
+        获取自指定版本以来的数据变化
+        返回{"version", "upserted", "removed"}，upserted为当前快照中新增或变化的文章，
+        removed为已移除文章的ID；since已超出保留的差异历史时返回None，客户端需全量同步
+        """
+        snapshot = snapshot or self._snapshot
+        if snapshot.status == ServiceStatus.ERROR:
+            raise Exception(f"服务错误: {snapshot.error_message}")
+        
+        if since == snapshot.version:
+            return {"version": snapshot.version, "upserted": [], "removed": []}
+        
+        # 找到从since开始的差异，依次合并到当前版本
+        history = snapshot.history
+        start = next((i for i, diff in enumerate(history) if diff.from_version == since), None)
+        if start is None:
+            return None
+        
+        upserted_urls: Dict[str, None] = {}
+        removed: Dict[str, Optional[str]] = {}
+        for diff in history[start:]:
+            for url in diff.upserted_urls:
+                upserted_urls[url] = None
+                removed.pop(url, None)
+            for url, article_id in diff.removed:
+                upserted_urls.pop(url, None)
+                removed[url] = article_id
+        
+        by_url = snapshot.by_url
+        return {
+            "version": snapshot.version,
+            "upserted": [by_url[url].to_article(use_lru=False) for url in upserted_urls if url in by_url],
+            "removed": [article_id for url, article_id in removed.items() if url not in by_url and article_id]
+        }
     
-    def _sort_articles_by_date(self, articles: List[NewsArticle]) -> List[NewsArticle]:
+    def get_article(self, article_id: str, snapshot: Optional[NewsSnapshot] = None) -> Optional[NewsArticle]:
+        """按ID获取单篇文章（哈希索引，O(1)），不存在时返回None"""
+        snapshot = snapshot or self._snapshot
+        if snapshot.status == ServiceStatus.ERROR:
+            raise Exception(f"服务错误: {snapshot.error_message}")
+        record = snapshot.by_id.get(article_id)
+        return record.to_article() if record is not None else None
+    
+    def get_article_by_url(self, url: str, snapshot: Optional[NewsSnapshot] = None) -> Optional[NewsArticle]:
+        """按URL获取单篇文章（哈希索引，O(1)），不存在时返回None"""
+        snapshot = snapshot or self._snapshot
+        if snapshot.status == ServiceStatus.ERROR:
+            raise Exception(f"服务错误: {snapshot.error_message}")
+        record = snapshot.by_url.get(url)
+        return record.to_article() if record is not None else None
+    
+    def _sort_key(self, article: ArticleRecord) -> int:
         """
-        按日期对文章进行排序（由近到远）
+        计算文章的整数排序键：高位为日期的纪元天数，低64位为基于ID的确定性并列次序
+        只在文章写入缓存时计算一次，排序和顺序校验均直接比较该整数
+        """
+        parsed = parse_date(article.date)
+        epoch_day = (parsed - _EPOCH).days if parsed is not None else 0
+        try:
+            tiebreak = int(article.id, 16) & _TIEBREAK_MASK
+        except (TypeError, ValueError):
+            tiebreak = int(hashlib.md5((article.id or article.url).encode()).hexdigest()[:16], 16)
+        return (max(epoch_day, 0) << 64) | tiebreak
+    
+    def _with_sort_keys(self, articles: List[NewsArticle]) -> List[Tuple[int, ArticleRecord]]:
+        """将新写入的文章转换为紧凑记录并计算排序键（每篇文章只解析一次日期）"""
+        records = [ArticleRecord.from_article(article) for article in articles]
+        return [(self._sort_key(record), record) for record in records]
+    
+    def _sort_articles_by_date(self, keyed_articles: List[Tuple[int, ArticleRecord]]) -> List[Tuple[int, ArticleRecord]]:
+        """
+        按排序键对文章进行排序（由近到远）
         在数据合并时统一触发排序，确保数据一致性
         """
         try:
-            if not articles:
-                return articles
+            if not keyed_articles:
+                return keyed_articles
             
-            logger.info(f"🔄 [缓存排序] 开始对 {len(articles)} 篇文章进行日期排序...")
+            logger.info(f"🔄 [缓存排序] 开始对 {len(keyed_articles)} 篇文章进行日期排序...")
             
-            # 统计日期解析情况
-            parse_stats = {"success": 0, "failed": 0, "examples": []}
+            # 执行排序：直接比较预先计算的整数排序键
+            sorted_articles = sorted(keyed_articles, key=itemgetter(0), reverse=True)
             
-            def sort_key_with_stats(article):
-                parsed_date = self._parse_date_for_sorting(article.date)
-                if parsed_date.year > 1970:
-                    parse_stats["success"] += 1
-                    if len(parse_stats["examples"]) < 3:
-                        parse_stats["examples"].append(f"{article.date} -> {parsed_date.strftime('%Y-%m-%d')}")
-                else:
-                    parse_stats["failed"] += 1
-                return parsed_date
-            
-            # 执行排序
-            sorted_articles = sorted(articles, key=sort_key_with_stats, reverse=True)
-            
-            # 输出统计信息
-            total = len(articles)
-            success_rate = (parse_stats["success"] / total * 100) if total > 0 else 0
+            # 输出统计信息（纪元天数为0表示日期解析失败）
+            total = len(sorted_articles)
+            failed = sum(1 for sort_key, _ in sorted_articles if sort_key >> 64 == 0)
+            success = total - failed
+            success_rate = (success / total * 100) if total > 0 else 0
             
             logger.info(f"✅ [缓存排序] 排序完成！")
-            logger.info(f"📊 [缓存排序] 成功解析: {parse_stats['success']}/{total} ({success_rate:.1f}%)")
-            if parse_stats["failed"] > 0:
-                logger.warning(f"⚠️ [缓存排序] 解析失败: {parse_stats['failed']} 篇文章")
-            
-            if parse_stats["examples"]:
-                logger.info(f"📅 [缓存排序] 解析示例: {', '.join(parse_stats['examples'])}")
+            logger.info(f"📊 [缓存排序] 成功解析: {success}/{total} ({success_rate:.1f}%)")
+            if failed > 0:
+                logger.warning(f"⚠️ [缓存排序] 解析失败: {failed} 篇文章")
             
             # 显示排序后的前几篇文章的日期
-            if sorted_articles:
-                latest_dates = [article.date for article in sorted_articles[:3]]
-                logger.info(f"📈 [缓存排序] 最新文章日期: {latest_dates}")
+            latest_dates = [article.date for _, article in sorted_articles[:3]]
+            logger.info(f"📈 [缓存排序] 最新文章日期: {latest_dates}")
             
             return sorted_articles
             
         except Exception as e:
             logger.error(f"❌ [缓存排序] 排序失败: {e}")
-            return articles  # 排序失败时返回原列表
+            return keyed_articles  # 排序失败时返回原列表
+    
+    @staticmethod
+    def _merge_sorted(sort_keys: Sequence[int], articles: Sequence[ArticleRecord],
+                      batch: List[Tuple[int, ArticleRecord]]) -> Tuple[List[int], List[ArticleRecord]]:
+        """
+        将已排序的新批次合并进已有的有序文章（由近到远），不再对全部文章重新排序
+        小批次逐篇二分插入，大批次线性归并；排序键相同时已有文章在前
+        """
+        if len(batch) <= _BISECT_INSERT_MAX:
+            merged_keys = list(sort_keys)
+            merged_articles = list(articles)
+            for sort_key, article in batch:
+                # 第一个小于新排序键的位置，保证并列时插在已有文章之后
+                index = _bisect_desc(merged_keys, sort_key)
+                while index < len(merged_keys) and merged_keys[index] == sort_key:
+                    index += 1
+                merged_keys.insert(index, sort_key)
+                merged_articles.insert(index, article)
+            return merged_keys, merged_articles
+        merged = list(heapq.merge(zip(sort_keys, articles), batch, key=itemgetter(0), reverse=True))
+        return [sort_key for sort_key, _ in merged], [article for _, article in merged]
+    
+    @staticmethod
+    def _view_keys_of(article: ArticleRecord) -> set:
+        """文章所属的(分类, 来源)视图，None表示不限"""
+        category = article.category or None
+        source = article.source or None
+        return {(category, None), (None, source), (category, source)} - {(None, None)}
+    
+    @staticmethod
+    def _body_texts(article: ArticleRecord) -> List[str]:
+        """正文中参与相关度检索的文本（文本块与代码块）"""
+        return [
+            value for block_type, value in article.get_content(use_lru=False)
+            if block_type in (ContentType.TEXT, ContentType.CODE)
+        ]
+    
+    def _build_indexes(self, keyed_articles: List[Tuple[int, ArticleRecord]]) -> Dict[str, Any]:
+        """
+        为已排序的文章构建快照数据：文章元组、排序键、搜索索引、ID/URL索引、分类/来源视图和分面直方图
+        BM25相关度索引不在此构建（见resolve_sort）；纯函数，不访问当前快照，可在写入锁外执行
+        """
+        start_time = time.time()
+        sort_keys = [sort_key for sort_key, _ in keyed_articles]
+        articles = [article for _, article in keyed_articles]
+        
+        # 顺序校验：排序键必须单调不增，否则按排序键重新排序（防御性编程）
+        if any(sort_keys[i] < sort_keys[i + 1] for i in range(len(sort_keys) - 1)):
+            logger.warning("⚠️ [缓存索引] 检测到顺序异常，按排序键重新排序")
+            return self._build_indexes(sorted(keyed_articles, key=itemgetter(0), reverse=True))
+        
+        search_index = NgramSearchIndex.build(
+            (article.title, article.summary) for article in articles
+        )
+        
+        # 按(分类, 来源)组合预先分组，None表示不限；视图继承缓存的日期顺序
+        views: Dict[Tuple[Optional[str], Optional[str]], List[ArticleRecord]] = {}
+        view_keys: Dict[Tuple[Optional[str], Optional[str]], List[int]] = {}
+        for sort_key, article in zip(sort_keys, articles):
+            for key in self._view_keys_of(article):
+                views.setdefault(key, []).append(article)
+                view_keys.setdefault(key, []).append(sort_key)
+        
+        # ID/URL哈希索引：重复时保留排序靠前（日期较新）的文章
+        by_id: Dict[str, ArticleRecord] = {}
+        by_url: Dict[str, ArticleRecord] = {}
+        for article in articles:
+            by_id.setdefault(article.id, article)
+            by_url.setdefault(article.url, article)
+        
+        facets = _count_facets(zip(sort_keys, articles))
+        suggest_index = TitleSuggestIndex(article.title for article in articles)
+        
+        logger.info(f"🔎 [缓存索引] 索引构建完成，共 {len(search_index)} 篇文章，{len(views)} 个视图，耗时 {time.time() - start_time:.3f}秒")
+        return {
+            "articles": tuple(articles),
+            "sort_keys": tuple(sort_keys),
+            "search_index": search_index,
+            "search_docs": None,
+            "ranked_index": None,  # 构建耗时较长，不阻塞发布，首次按相关度查询时在后台构建
+            "views": {key: tuple(view) for key, view in views.items()},
+            "view_keys": {key: tuple(keys) for key, keys in view_keys.items()},
+            "by_id": by_id,
+            "by_url": by_url,
+            "facets": facets,
+            "suggest_index": suggest_index,
+        }
+    
+    def _extend_indexes(self, base: NewsSnapshot, batch: List[Tuple[int, ArticleRecord]]) -> Dict[str, Any]:
+        """
+        在已有快照的基础上追加一批已排序的新文章（首次加载的分批写入）
+        文章与视图通过归并插入，搜索索引只追加新文档，ID/URL索引只处理新文章，
+        写入开销与批次大小相关，而不是对全部文章重建；调用方需持有写入锁
+        """
+        start_time = time.time()
+        sort_keys, articles = self._merge_sorted(base.sort_keys, base.articles, batch)
+        
+        search_index = base.search_index
+        search_docs = base.search_docs
+        if search_docs is None:
+            search_docs = tuple(zip(base.sort_keys, base.articles))
+        ranked_index = base.ranked_index
+        if ranked_index is None and settings.search_ranked_enabled and not search_docs:
+            ranked_index = BM25SearchIndex()
+        if len(search_index) != len(search_docs) or (
+            ranked_index is not None and len(ranked_index) != len(search_docs)
+        ):
+            # 上次追加中途失败导致索引与文档表不一致，回退为完整构建
+            logger.warning("⚠️ [缓存索引] 搜索索引与文档表不一致，完整重建索引")
+            return self._build_indexes(list(zip(sort_keys, articles)))
+        
+        views = dict(base.views)
+        view_keys = dict(base.view_keys)
+        view_batches: Dict[Tuple[Optional[str], Optional[str]], List[Tuple[int, ArticleRecord]]] = {}
+        for sort_key, article in batch:
+            for key in self._view_keys_of(article):
+                view_batches.setdefault(key, []).append((sort_key, article))
+        for key, view_batch in view_batches.items():
+            merged_keys, merged_articles = self._merge_sorted(view_keys.get(key, ()), views.get(key, ()), view_batch)
+            views[key] = tuple(merged_articles)
+            view_keys[key] = tuple(merged_keys)
+        
+        by_id = dict(base.by_id)
+        by_url = dict(base.by_url)
+        for _, article in batch:
+            by_id.setdefault(article.id, article)
+            by_url.setdefault(article.url, article)
+        
+        # 已发布的快照只查询前len(articles)个文档，追加新文档不影响正在读取的旧快照
+        for _, article in batch:
+            search_index.add(article.title, article.summary)
+            if ranked_index is not None:
+                ranked_index.add(article.title, article.summary, self._body_texts(article))
+        
+        logger.info(f"🔎 [缓存索引] 增量追加 {len(batch)} 篇文章，共 {len(articles)} 篇，耗时 {time.time() - start_time:.3f}秒")
+        return {
+            "articles": tuple(articles),
+            "sort_keys": tuple(sort_keys),
+            "search_index": search_index,
+            "search_docs": search_docs + tuple(batch),
+            "ranked_index": ranked_index,
+            "views": views,
+            "view_keys": view_keys,
+            "by_id": by_id,
+            "by_url": by_url,
+            "facets": _count_facets(batch, base.facets),
+            "suggest_index": None,  # 文章下标随归并插入变化，查询时按需为当前快照构建
+        }
+    
+    def _record_diff(self, current: NewsSnapshot, staged_data: Dict[str, Any], version: int) -> Tuple[SnapshotDiff, ...]:
+        """对比当前快照与整体替换的新数据，返回追加了本次差异的有界历史（调用方需持有写入锁）"""
+        old_by_url = current.by_url
+        new_by_url = staged_data["by_url"]
+        upserted_urls = tuple(
+            url for url, article in new_by_url.items()
+            if url not in old_by_url or (
+                old_by_url[url] is not article and not old_by_url[url].same_content(article)
+            )
+        )
+        removed = tuple(
+            (url, article.id) for url, article in old_by_url.items()
+            if url not in new_by_url
+        )
+        return self._append_history(current, SnapshotDiff(current.version, version, upserted_urls, removed))
+    
+    def _record_append(self, current: NewsSnapshot, batch: List[Tuple[int, ArticleRecord]],
+                       version: int) -> Tuple[SnapshotDiff, ...]:
+        """
+        分批追加的差异：追加不修改、不移除批次之外的文章，新增文章即本批次的URL，
+        无需对比新旧URL索引，开销与批次大小相关（调用方需持有写入锁）
+        """
+        upserted_urls = tuple(dict.fromkeys(article.url for _, article in batch))
+        return self._append_history(current, SnapshotDiff(current.version, version, upserted_urls))
+    
+    def _append_history(self, current: NewsSnapshot, diff: SnapshotDiff) -> Tuple[SnapshotDiff, ...]:
+        """返回追加了本次差异的有界历史"""
+        logger.info(f"📝 [增量同步] 版本 {diff.from_version} -> {diff.to_version}：新增/变化 {len(diff.upserted_urls)} 篇，移除 {len(diff.removed)} 篇")
+        if self._history_size <= 0:
+            return ()
+        return (current.history + (diff,))[-self._history_size:]
     
     def update_cache(self, news_data: List[NewsArticle]):
-        """更新缓存数据（完全替换）"""
-        with self._cache_lock:
-            try:
-                # 设置更新状态为True，状态变为准备中
-                self.set_updating(True)
-                
-                # 🔥 关键改进：在数据合并时触发日期排序
-                logger.info(f"🔄 [完整更新] 开始更新缓存，原始数据: {len(news_data)} 篇文章")
-                sorted_news_data = self._sort_articles_by_date(news_data.copy())
-                
-                # 更新缓存
-                self._cache = sorted_news_data
-                self._last_update = datetime.now().isoformat()
-                self._update_count += 1
+        """
+        更新缓存数据（完全替换）
+        双缓冲：新数据在暂存区完成排序和索引，期间旧快照继续提供服务，完成后一次性发布
+        """
+        try:
+            # 设置更新状态为True（已有数据时状态保持就绪）
+            self.set_updating(True)
+            
+            # 🔥 关键改进：在数据合并时触发日期排序（在暂存区构建新快照，不影响读取）
+            logger.info(f"🔄 [完整更新] 开始在暂存区构建新快照，原始数据: {len(news_data)} 篇文章")
+            sorted_news_data = self._sort_articles_by_date(self._with_sort_keys(news_data))
+            staged_data = self._build_indexes(sorted_news_data)
+            
+            with self._cache_lock:
+                current = self._snapshot
                 
                 # 🔥 重要：标记首次加载完成，后续不再使用分批写入
-                if self._is_first_load:
-                    self._is_first_load = False
+                if current.is_first_load:
                     logger.info("🏁 首次完整加载完成，后续更新将使用完整替换模式")
                 
-                # 设置更新状态为False，状态变为就绪
-                self.set_updating(False)
-                
-                logger.info(f"🔄 缓存完整更新成功，共 {len(news_data)} 条新闻")
-                
-            except Exception as e:
-                error_msg = f"缓存更新失败: {str(e)}"
-                self.set_status(ServiceStatus.ERROR, error_msg)
-                self._is_updating = False
-                logger.error(error_msg)
-                raise
+                # 一次性发布新快照，同时将状态恢复为就绪
+                version = _next_version(current.version)
+                self._publish(
+                    version=version,
+                    history=self._record_diff(current, staged_data, version),
+                    last_update=datetime.now().isoformat(),
+                    update_count=current.update_count + 1,
+                    is_first_load=False,
+                    is_updating=False,
+                    status=ServiceStatus.READY,
+                    error_message=None,
+                    **staged_data
+                )
+                logger.info("数据更新完成，状态设为就绪")
+                self._persist(sorted_news_data, replace=True)
+            
+            logger.info(f"🔄 缓存完整更新成功，共 {len(news_data)} 条新闻")
+            
+        except Exception as e:
+            # 暂存区构建失败时丢弃新数据，已有旧快照时继续提供服务
+            error_msg = f"缓存更新失败: {str(e)}"
+            self.set_failed(error_msg)
+            logger.error(error_msg)
+            raise
     
     def append_to_cache(self, new_articles: List[NewsArticle]):
         """增量追加新文章到缓存（仅用于首次加载的分批写入）"""
@@ -331,13 +1001,15 @@ class NewsCache:
                 if not new_articles:
                     return
                 
+                current = self._snapshot
+                
                 # 🔥 重要：只在首次加载时才允许分批写入
-                if not self._is_first_load:
+                if not current.is_first_load:
                     logger.warning("⚠️ 非首次加载，忽略分批写入，等待完整更新")
                     return
                 
-                # 获取现有文章的URL集合，用于去重
-                existing_urls = {article.url for article in self._cache}
+                # 直接使用快照的URL索引去重，无需每批重建URL集合
+                existing_urls = current.by_url
                 
                 # 过滤掉重复的文章
                 unique_articles = [
@@ -346,22 +1018,28 @@ class NewsCache:
                 ]
                 
                 if unique_articles:
-                    # 追加新文章
-                    self._cache.extend(unique_articles)
-                    
-                    # 🔥 关键改进：分批写入后立即触发排序，保持数据一致性
-                    logger.info(f"🔄 [分批更新] 追加 {len(unique_articles)} 篇文章后触发排序")
-                    self._cache = self._sort_articles_by_date(self._cache)
-                    
-                    self._last_update = datetime.now().isoformat()
+                    # 🔥 关键改进：只对本批次排序，再归并进已排好序的快照，保持数据一致性
+                    # 新快照构建期间读取方继续使用旧快照，不受写入影响
+                    logger.info(f"🔄 [分批更新] 追加 {len(unique_articles)} 篇文章，排序后归并到缓存")
+                    # 已有文章沿用快照中的排序键，只为新文章解析日期
+                    sorted_batch = self._sort_articles_by_date(self._with_sort_keys(unique_articles))
+                    staged_data = self._extend_indexes(current, sorted_batch)
+                    version = _next_version(current.version)
+                    snapshot = self._publish(
+                        version=version,
+                        history=self._record_append(current, sorted_batch, version),
+                        last_update=datetime.now().isoformat(),
+                        **staged_data
+                    )
+                    self._persist(sorted_batch, replace=False)
                     
                     # 🔥 关键修改：如果缓存中有文章了，就设置状态为READY
-                    if len(self._cache) > 0 and self._status == ServiceStatus.PREPARING:
+                    if len(snapshot.articles) > 0 and snapshot.status == ServiceStatus.PREPARING:
                         logger.info("🎉 缓存中已有数据，状态设为就绪，用户可以开始查看文章")
                         self.set_status(ServiceStatus.READY)
                     
                     logger.info(f"📝 [首次加载] 增量追加 {len(unique_articles)} 篇新文章到缓存（跳过 {len(new_articles) - len(unique_articles)} 篇重复）")
-                    logger.info(f"📊 [首次加载] 缓存总数: {len(self._cache)} 篇文章")
+                    logger.info(f"📊 [首次加载] 缓存总数: {len(snapshot.articles)} 篇文章")
                 else:
                     logger.info(f"📝 [首次加载] 本批次 {len(new_articles)} 篇文章全部为重复，跳过")
                 
@@ -370,26 +1048,42 @@ class NewsCache:
                 logger.error(error_msg)
                 raise
     
+    def complete_first_load(self):
+        """结束首次加载的分批写入阶段，后续更新使用双缓冲完整替换"""
+        with self._cache_lock:
+            if self._snapshot.is_first_load:
+                self._publish(is_first_load=False)
+                logger.info("🏁 首次分批加载完成，后续更新将使用完整替换模式")
+    
     def get_cache_info(self) -> Dict[str, Any]:
         """获取缓存信息"""
-        with self._cache_lock:
-            return {
-                "cache_size": len(self._cache),
-                "last_update": self._last_update,
-                "update_count": self._update_count,
-                "status": self._status.value,
-                "error_message": self._error_message,
-                "is_updating": self._is_updating
-            }
+        snapshot = self._snapshot
+        return {
+            "cache_size": len(snapshot.articles),
+            "version": snapshot.version,
+            "last_update": snapshot.last_update,
+            "update_count": snapshot.update_count,
+            "status": snapshot.status.value,
+            "error_message": snapshot.error_message,
+            "is_updating": snapshot.is_updating
+        }
     
     def clear_cache(self):
         """清空缓存"""
         with self._cache_lock:
-            self._cache.clear()
-            self._last_update = None
-            self._update_count = 0
+            current = self._snapshot
+            # 清空后差异历史一并丢弃，客户端的增量同步将收到全量同步信号
+            self._snapshot = NewsSnapshot(
+                version=_next_version(current.version),
+                is_first_load=current.is_first_load
+            )
             self.set_updating(True)  # 清空时设为准备中
             logger.info("缓存已清空")
+            if self._store is not None:
+                try:
+                    self._store.clear_news(self._snapshot.version)
+                except Exception as e:
+                    logger.warning(f"⚠️ [快照持久化] 清空新闻快照失败: {e}")
 
 # 全局缓存实例
 _news_cache: Optional[NewsCache] = None
@@ -402,26 +1096,78 @@ def get_news_cache() -> NewsCache:
     return _news_cache
 
 def init_cache():
-    """初始化缓存"""
+    """初始化缓存，启用持久化时同步加载上次的快照"""
     global _news_cache, _banner_cache
-    _news_cache = NewsCache()
-    _banner_cache = BannerCache()
+    store = get_snapshot_store()
+    _news_cache = NewsCache(store=store, archive=settings.news_archive_enabled)
+    _banner_cache = BannerCache(store=store)
     logger.info("新闻缓存初始化完成")
     logger.info("轮播图缓存初始化完成")
+    if store is not None:
+        _news_cache.restore_snapshot()
+        _banner_cache.restore_snapshot()
 
 
 class BannerCache:
     """轮播图缓存管理器"""
     
-    def __init__(self):
+    def __init__(self, store: Optional[SnapshotStore] = None):
         self._cache: List[Dict[str, Any]] = []
         self._cache_lock = threading.RLock()
+        self._store = store  # 快照持久化存储，None表示不持久化
         self._status = ServiceStatus.PREPARING  # 初始状态为准备中，等待首次爬取
         self._last_update = None
         self._update_count = 0
         self._error_message = None
         self._is_updating = False
         self._first_load_completed = False  # 标记是否完成首次加载
+        self._version = 0  # 数据版本号，每次写入新数据时递增
+    
+    def restore_snapshot(self) -> bool:
+        """从持久化存储同步加载上次的轮播图数据（服务启动时调用）"""
+        return self._load_from_store(initial=True)
+    
+    def sync_from_store(self) -> bool:
+        """共享快照模式下定期调用：其他工作进程保存了更新的轮播图时重新加载"""
+        return self._load_from_store(initial=False)
+    
+    def _load_from_store(self, initial: bool) -> bool:
+        if self._store is None:
+            return False
+        tag = "💾 [快照持久化]" if initial else "🔗 [共享快照]"
+        try:
+            if not initial:
+                stored_version = self._store.get_version("banner")
+                if stored_version is None or stored_version <= self._version:
+                    return False
+            loaded = self._store.load_banners()
+            if loaded is None:
+                return False
+            meta, images = loaded
+            with self._cache_lock:
+                if meta["version"] <= self._version:
+                    return False
+                self._cache = images
+                self._version = meta["version"]
+                self._last_update = meta["last_update"]
+                self._update_count = meta["update_count"]
+                if images:
+                    self._first_load_completed = True
+                    self._status = ServiceStatus.READY
+            logger.info(f"{tag} 已加载轮播图快照（版本 {meta['version']}），共 {len(images)} 张图片")
+            return bool(images)
+        except Exception as e:
+            logger.warning(f"⚠️ {tag} 加载轮播图快照失败: {e}")
+            return False
+    
+    def _persist(self):
+        """将当前轮播图数据写入持久化存储（调用方需持有锁）"""
+        if self._store is None:
+            return
+        try:
+            self._store.save_banners(self._version, self._last_update, self._update_count, self._cache)
+        except Exception as e:
+            logger.warning(f"⚠️ [快照持久化] 保存轮播图快照失败: {e}")
         
     def get_status(self) -> Dict[str, Any]:
         """获取轮播图服务状态"""
@@ -433,7 +1179,8 @@ class BannerCache:
                 "update_count": self._update_count,
                 "error_message": self._error_message,
                 "is_updating": self._is_updating,
-                "first_load_completed": self._first_load_completed
+                "first_load_completed": self._first_load_completed,
+                "version": self._version
             }
     
     def set_status(self, status: ServiceStatus, error_message: Optional[str] = None):
@@ -444,16 +1191,28 @@ class BannerCache:
             logger.info(f"轮播图服务状态更新: {status.value}")
     
     def set_updating(self, is_updating: bool):
-        """设置更新状态"""
+        """设置更新状态（已有数据时保持就绪，更新期间继续返回旧数据）"""
         with self._cache_lock:
             self._is_updating = is_updating
             if is_updating:
+                if self._cache:
+                    logger.info("开始轮播图数据更新，旧数据继续提供服务")
+                    return
                 logger.info("开始轮播图数据更新，状态设为准备中")
                 self.set_status(ServiceStatus.PREPARING)
             else:
                 logger.info("轮播图数据更新完成，状态设为就绪")
                 self.set_status(ServiceStatus.READY)
     
+    def get_version(self) -> int:
+        """获取当前数据版本号"""
+        return self._version
+    
+    def get_versioned_images(self) -> Tuple[int, List[Dict[str, Any]]]:
+        """原子地获取(数据版本号, 轮播图数据)，保证ETag与内容对应"""
+        with self._cache_lock:
+            return self._version, self.get_banner_images()
+    
     def get_banner_images(self) -> List[Dict[str, Any]]:
         """获取轮播图数据"""
         with self._cache_lock:
@@ -471,6 +1230,7 @@ class BannerCache:
                 
                 # 更新缓存
                 self._cache = banner_data.copy()
+                self._version = _next_version(self._version)
                 self._last_update = datetime.now().isoformat()
                 self._update_count += 1
                 
@@ -483,6 +1243,8 @@ class BannerCache:
                 if len(banner_data) > 0:
                     self.set_updating(False)  # 这会设置为READY
                     logger.info(f"🖼️ 轮播图缓存更新成功，共 {len(banner_data)} 张图片，状态：READY")
+                    # 空结果不覆盖已保存的快照
+                    self._persist()
                 else:
                     # 如果没有数据，保持PREPARING状态
                     self._is_updating = False
@@ -508,14 +1270,22 @@ class BannerCache:
                 "is_updating": self._is_updating
             }
     
-    def clear_cache(self):
-        """清空轮播图缓存"""
+    def clear_cache(self) -> int:
+        """
+        清空轮播图缓存并持久化空快照（重启或其他工作进程同步时不会恢复已清空的数据），
+        返回清空前的图片数量
+        """
         with self._cache_lock:
-            self._cache.clear()
+            original_count = len(self._cache)
+            # 替换而不是原地清空，正在用旧列表生成响应的读取方不受影响
+            self._cache = []
+            self._version = _next_version(self._version)
             self._last_update = None
             self._update_count = 0
             self.set_updating(True)
             logger.info("轮播图缓存已清空")
+            self._persist()
+            return original_count
 
 
 # 全局轮播图缓存实例
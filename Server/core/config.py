@@ -26,6 +26,7 @@ class Settings(BaseSettings):
     # 数据库配置
     database_url: str = "sqlite:///./openharmony_news.db"
     db_path: str = "./openharmony_news.db"
+    news_archive_enabled: bool = True  # 是否将爬取的文章归档到news_articles表（含FTS5全文索引）
     
     # API配置
     api_prefix: str = "/api"
@@ -44,6 +45,24 @@ class Settings(BaseSettings):
     # 缓存配置
     enable_cache: bool = True
     cache_initial_load: bool = True  # 是否在启动时加载缓存
+    response_cache_max_entries: int = 256         # 常规列表响应缓存条目上限
+    response_cache_search_entries: int = 512      # 搜索响应LRU条目上限
+    response_cache_max_mb: int = 64               # 常规列表响应缓存容量（MB）
+    response_cache_search_mb: int = 16            # 搜索响应缓存容量（MB）
+    http_cache_max_age: int = 300                 # 响应Cache-Control的max-age（秒）
+    news_stream_min_articles: int = 1000          # all=true结果超过该篇数时流式输出，不整体缓存响应体
+    news_stream_batch_size: int = 100             # 流式响应每次写出的文章篇数
+    news_changes_history: int = 64                # 增量同步保留的快照差异数量
+    cache_compress_content: bool = True           # 缓存中的文章正文是否以zlib压缩保存
+    content_cache_entries: int = 256              # 最近解压的正文LRU条目上限
+    date_parse_cache_size: int = 4096             # 日期解析结果LRU条目上限
+    search_ranked_enabled: bool = True            # 是否构建BM25相关度索引（标题/摘要/正文）
+    search_ranked_max_results: int = 1000         # 相关度排序最多返回的结果数
+    cache_persist_enabled: bool = True            # 是否将缓存快照持久化到本地，启动时直接加载
+    cache_snapshot_path: str = "./data/cache_snapshot.db"  # 缓存快照文件路径
+    cache_shared_enabled: bool = False            # 多工作进程共享快照：只有一个进程爬取并发布，其余进程只读同步
+    cache_owner_lock_path: str = "./data/cache_owner.lock"  # 爬虫归属文件锁路径
+    cache_sync_interval: float = 2.0              # 只读工作进程检查快照更新的间隔（秒）
     
     # 日志配置
     log_level: str = "INFO"
@@ -12,16 +12,40 @@
 # limitations under the License.
 
 import sqlite3
+import hashlib
+import json
 import logging
+import threading
 from contextlib import contextmanager
-from typing import Generator
+from datetime import datetime
+from typing import Generator, Iterable, List, Optional, Tuple
 import os
 
+from core.article_store import ArticleRecord
+from core.search_index import BODY_WEIGHT, SUMMARY_WEIGHT, TITLE_WEIGHT, query_terms, tokenized_text
+from models.news import ContentType
+
 logger = logging.getLogger(__name__)
 
 # 数据库配置
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./openharmony_news.db")
-DB_PATH = "./openharmony_news.db"
+DB_PATH = DATABASE_URL[len("sqlite:///"):] if DATABASE_URL.startswith("sqlite:///") else "./openharmony_news.db"
+
+# 归档所需的列（早期版本创建的表缺少这些列，初始化时补充）
+_NEWS_ARCHIVE_COLUMNS = (
+    ("article_id", "TEXT"),
+    ("image", "TEXT"),
+    ("sort_key", "TEXT"),  # 定长十六进制排序键（与缓存排序键一致），字典序即数值序
+    ("content_hash", "TEXT"),  # 压缩正文的摘要，用于跳过内容未变化的文章
+)
+_SORT_KEY_WIDTH = 32
+
+# 归档写入时按URL批量查询已有记录，每批URL数量低于SQLite参数个数上限
+_LOOKUP_CHUNK = 500
+
+# 每个线程复用一个连接，不再每次调用都重新打开数据库文件
+_local = threading.local()
+_fts_available = False
 
 def init_database():
     """初始化数据库，创建表结构"""
@@ -41,9 +65,29 @@ def init_database():
                     source TEXT,
                     content TEXT,  -- JSON格式存储内容块
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    article_id TEXT,
+                    image TEXT,
+                    sort_key TEXT,
+                    content_hash TEXT
                 )
             ''')
+            columns = {row["name"] for row in cursor.execute("PRAGMA table_info(news_articles)")}
+            for column, definition in _NEWS_ARCHIVE_COLUMNS:
+                if column not in columns:
+                    cursor.execute(f"ALTER TABLE news_articles ADD COLUMN {column} {definition}")
+            
+            # 创建全文索引：写入预先分词的文本（中文为单字+相邻双字），rowid即news_articles.id
+            global _fts_available
+            try:
+                cursor.execute('''
+                    CREATE VIRTUAL TABLE IF NOT EXISTS news_articles_fts
+                    USING fts5(title, summary, body, tokenize = 'unicode61')
+                ''')
+                _fts_available = True
+            except sqlite3.OperationalError as e:
+                _fts_available = False
+                logger.warning(f"⚠️ [文章归档] 当前SQLite不支持FTS5，归档搜索退化为标题/摘要子串匹配: {e}")
             
             # 创建话题表
             cursor.execute('''
@@ -80,6 +124,7 @@ def init_database():
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_news_date ON news_articles(date)')
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_news_category ON news_articles(category)')
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_news_url ON news_articles(url)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_news_sort_key ON news_articles(sort_key)')
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_topics_created ON topics(created_at)')
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_releases_version ON releases(version)')
             
@@ -90,22 +135,38 @@ def init_database():
         logger.error(f"数据库初始化失败: {e}")
         raise
 
+def _connect() -> sqlite3.Connection:
+    os.makedirs(os.path.dirname(os.path.abspath(DB_PATH)), exist_ok=True)
+    conn = sqlite3.connect(DB_PATH, timeout=10)
+    conn.row_factory = sqlite3.Row  # 使结果可以通过列名访问
+    # WAL模式：归档写入时不阻塞读取；WAL下NORMAL同步级别仍保证数据库一致
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("PRAGMA synchronous = NORMAL")
+    return conn
+
 @contextmanager
 def get_db() -> Generator[sqlite3.Connection, None, None]:
-    """获取数据库连接的上下文管理器"""
-    conn = None
+    """获取当前线程复用的数据库连接（首次使用时打开），出错时回滚未提交的事务"""
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        try:
+            conn = _connect()
+        except Exception as e:
+            logger.error(f"数据库连接失败: {e}")
+            raise
+        _local.conn = conn
     try:
-        conn = sqlite3.connect(DB_PATH)
-        conn.row_factory = sqlite3.Row  # 使结果可以通过列名访问
         yield conn
-    except Exception as e:
-        logger.error(f"数据库连接失败: {e}")
-        if conn:
-            conn.rollback()
+    except Exception:
+        conn.rollback()
         raise
-    finally:
-        if conn:
-            conn.close()
+
+def close_db():
+    """关闭当前线程的数据库连接"""
+    conn = getattr(_local, "conn", None)
+    if conn is not None:
+        conn.close()
+        _local.conn = None
 
 def execute_query(query: str, params: tuple = ()) -> list:
     """执行查询语句"""
@@ -128,4 +189,122 @@ def execute_update(query: str, params: tuple = ()) -> int:
             return cursor.rowcount
     except Exception as e:
         logger.error(f"更新执行失败: {e}")
-        raise 
\ No newline at end of file
+        raise 
+
+def _body_text(record: ArticleRecord) -> str:
+    """正文中参与检索的文本（文本块与代码块）"""
+    return "\n".join(
+        value for block_type, value in record.get_content(use_lru=False)
+        if block_type in (ContentType.TEXT, ContentType.CODE)
+    )
+
+def archive_news_articles(keyed_records: Iterable[Tuple[int, ArticleRecord]]) -> int:
+    """
+    将(排序键, 文章记录)批量写入news_articles归档（按URL插入或更新），同一事务内同步FTS5全文索引
+    只写入新增或内容变化的文章，返回写入的文章数
+    """
+    latest = {record.url: (sort_key, record) for sort_key, record in keyed_records}
+    if not latest:
+        return 0
+
+    with get_db() as conn:
+        existing = {}
+        urls = list(latest)
+        for i in range(0, len(urls), _LOOKUP_CHUNK):
+            chunk = urls[i:i + _LOOKUP_CHUNK]
+            for row in conn.execute(
+                "SELECT url, article_id, title, date, category, summary, source, image, sort_key, content_hash "
+                f"FROM news_articles WHERE url IN ({','.join('?' * len(chunk))})", chunk
+            ):
+                existing[row[0]] = tuple(row)[1:]
+
+        changed = []
+        for url, (sort_key, record) in latest.items():
+            values = (
+                record.id, record.title, record.date, record.category, record.summary, record.source,
+                record.image, f"{sort_key:0{_SORT_KEY_WIDTH}x}", hashlib.md5(record.content_blob).hexdigest()
+            )
+            if existing.get(url) != values:
+                changed.append((url, record, values))
+        if not changed:
+            return 0
+
+        now = datetime.now().isoformat(sep=" ", timespec="seconds")
+        conn.executemany(
+            '''
+            INSERT INTO news_articles (url, article_id, title, date, category, summary, source, image,
+                                       sort_key, content_hash, content, created_at, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(url) DO UPDATE SET
+                article_id = excluded.article_id, title = excluded.title, date = excluded.date,
+                category = excluded.category, summary = excluded.summary, source = excluded.source,
+                image = excluded.image, sort_key = excluded.sort_key, content_hash = excluded.content_hash,
+                content = excluded.content, updated_at = excluded.updated_at
+            ''',
+            (
+                (url,) + values + (json.dumps(
+                    [{"type": block_type.value, "value": value} for block_type, value in record.get_content(use_lru=False)],
+                    ensure_ascii=False
+                ), now, now)
+                for url, record, values in changed
+            )
+        )
+        if _fts_available:
+            conn.executemany(
+                "DELETE FROM news_articles_fts WHERE rowid = (SELECT id FROM news_articles WHERE url = ?)",
+                ((url,) for url, _, _ in changed)
+            )
+            conn.executemany(
+                "INSERT INTO news_articles_fts (rowid, title, summary, body) "
+                "SELECT id, ?, ?, ? FROM news_articles WHERE url = ?",
+                (
+                    (tokenized_text(record.title), tokenized_text(record.summary or ""),
+                     tokenized_text(_body_text(record)), url)
+                    for url, record, _ in changed
+                )
+            )
+        conn.commit()
+    return len(changed)
+
+def search_news_articles(search: Optional[str] = None, category: Optional[str] = None,
+                         source: Optional[str] = None, limit: int = 20,
+                         offset: int = 0) -> Tuple[List[sqlite3.Row], int]:
+    """
+    分页查询归档文章，返回(当前页的行, 总数)；只读取当前页，归档不加载到内存
+    有搜索词时由FTS5按BM25得分排序（标题/摘要/正文权重与内存中的相关度索引一致），否则按日期由近到远
+    """
+    conditions: List[str] = []
+    params: list = []
+    if category:
+        conditions.append("a.category = ?")
+        params.append(category)
+    if source:
+        conditions.append("a.source = ?")
+        params.append(source)
+
+    terms = query_terms(search) if search else []
+    if search and not terms:
+        return [], 0
+    if terms and _fts_available:
+        # 任一查询词命中即可，与内存中的相关度排序一致
+        match = " OR ".join('"' + term.replace('"', '""') + '"' for term in terms)
+        conditions.insert(0, "news_articles_fts MATCH ?")
+        params.insert(0, match)
+        from_clause = "news_articles_fts JOIN news_articles a ON a.id = news_articles_fts.rowid"
+        order = f"bm25(news_articles_fts, {TITLE_WEIGHT}, {SUMMARY_WEIGHT}, {BODY_WEIGHT}), a.sort_key DESC"
+    else:
+        if terms:
+            conditions.append("(a.title LIKE ? OR a.summary LIKE ?)")
+            params.extend([f"%{search.strip()}%"] * 2)
+        from_clause = "news_articles a"
+        order = "a.sort_key DESC"
+    where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+
+    with get_db() as conn:
+        total = conn.execute(f"SELECT count(*) FROM {from_clause}{where}", params).fetchone()[0]
+        rows = conn.execute(
+            "SELECT a.article_id, a.title, a.date, a.url, a.category, a.summary, a.source, a.image "
+            f"FROM {from_clause}{where} ORDER BY {order} LIMIT ? OFFSET ?",
+            params + [limit, offset]
+        ).fetchall()
+    return rows, total
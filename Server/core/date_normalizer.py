@@ -0,0 +1,177 @@
+# Copyright (c) 2025 XBXyftx
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# 
+#     http://www.apache.org/licenses/LICENSE-2.0
+# 
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+import re
+import threading
+import time
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional
+
+from core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 年月日：2024-08-31, 2024.8.31, 2024/08/31, 2024年8月31日, 2024-08-31 10:30:00
+_YMD = re.compile(r"(\d{4})[-./年](\d{1,2})[-./月](\d{1,2})")
+# 日月年：31-08-2024, 31.08.2024
+_DMY = re.compile(r"(\d{1,2})[-./](\d{1,2})[-./](\d{4})")
+# 只有年月：2025.9, 2025年9月（取当月第一天）
+_YM = re.compile(r"(\d{4})[-./年](\d{1,2})(?!\d)")
+# 只有月日：08-31, 8/31（取当前年份）
+_MD = re.compile(r"(\d{1,2})[-./](\d{1,2})")
+_NUMBERS = re.compile(r"\d+")
+
+
+def _make_date(year: int, month: int, day: int) -> Optional[date]:
+    if not (1900 <= year <= 2100 and 1 <= month <= 12 and 1 <= day <= 31):
+        return None
+    try:
+        return date(year, month, day)
+    except ValueError:  # 如2月30日
+        return None
+
+
+def _parse(value: str, current_year: int) -> Optional[date]:
+    """
+    按预编译的模式依次尝试解析（不带缓存），全部失败时返回None
+    缺少年份的日期取current_year；年份作为参数参与缓存键，跨年后不会沿用上一年的结果
+    """
+    # 快速路径：已标准化的YYYY-MM-DD（可带时间）
+    if len(value) >= 10 and value[4] == "-" and value[7] == "-" and value[:4].isdigit():
+        try:
+            parsed = date.fromisoformat(value[:10])
+        except ValueError:
+            parsed = None
+        if parsed and 1900 <= parsed.year <= 2100:
+            return parsed
+    ymd = _YMD.search(value)
+    if ymd:
+        parsed = _make_date(int(ymd.group(1)), int(ymd.group(2)), int(ymd.group(3)))
+        if parsed:
+            return parsed
+    match = _DMY.search(value)
+    if match:
+        parsed = _make_date(int(match.group(3)), int(match.group(2)), int(match.group(1)))
+        if parsed:
+            return parsed
+    match = _YM.search(value) if ymd is None else None  # 年月日齐全但无效时不退化为当月第一天
+    if match:
+        parsed = _make_date(int(match.group(1)), int(match.group(2)), 1)
+        if parsed:
+            return parsed
+    match = _MD.fullmatch(value)
+    if match:
+        parsed = _make_date(current_year, int(match.group(1)), int(match.group(2)))
+        if parsed:
+            return parsed
+
+    # 最后的尝试：取前三个数字，按年份所在位置判断顺序
+    numbers = [int(number) for number in _NUMBERS.findall(value)[:3]]
+    if len(numbers) == 3:
+        if numbers[0] > 1900:
+            parsed = _make_date(numbers[0], numbers[1], numbers[2])
+        elif numbers[2] > 1900:
+            parsed = _make_date(numbers[2], numbers[1], numbers[0])
+        else:
+            parsed = _make_date(current_year, numbers[0], numbers[1])
+        if parsed:
+            return parsed
+
+    # 同一字符串的结果会被缓存，每个无法解析的字符串只记录一次
+    logger.warning(f"⚠️ [日期解析] 无法解析日期格式: '{value}'")
+    return None
+
+
+class DateNormalizer:
+    """
+    爬虫与缓存共用的日期解析/标准化
+
+    支持格式：2024-08-31, 2024.8.31, 2024/08/31, 2024年8月31日, 带时间的日期, 31.08.2024,
+    只有年月（取当月第一天）和只有月日（取当前年份）。
+    模式在模块加载时编译一次；列表页和全量更新中大量重复的日期字符串经LRU直接返回结果。
+    """
+
+    def __init__(self, cache_size: int = 4096):
+        self._parse_cached = lru_cache(maxsize=cache_size)(_parse)
+        self._lock = threading.Lock()
+        self.failures = 0  # 解析失败次数（含缓存命中的失败）
+        self._year = 0
+        self._next_year_at = 0.0  # 下一年1月1日零点（本地时间）的时间戳
+
+    def _current_year(self) -> int:
+        """当前年份；date.today()开销较大，只在跨过下一年1月1日零点后重新计算"""
+        if time.time() >= self._next_year_at:
+            year = date.today().year
+            self._next_year_at = datetime(year + 1, 1, 1).timestamp()
+            self._year = year
+        return self._year
+
+    def parse(self, value: Optional[str]) -> Optional[date]:
+        """解析日期字符串，空值或无法解析时返回None"""
+        if not value or not isinstance(value, str):
+            return None
+        parsed = self._parse_cached(value.strip(), self._current_year())
+        if parsed is None:
+            with self._lock:
+                self.failures += 1
+        return parsed
+
+    def normalize(self, value: Optional[str]) -> str:
+        """标准化为YYYY-MM-DD；无法解析时原样返回，空值返回空字符串"""
+        parsed = self.parse(value)
+        if parsed is None:
+            return value or ""
+        return parsed.isoformat()
+
+    def normalize_many(self, values: Iterable[Optional[str]]) -> List[str]:
+        """批量标准化（如一个列表页的全部日期），同一批中重复的字符串只处理一次"""
+        values = list(values)
+        normalized = {value: self.normalize(value) for value in dict.fromkeys(values)}
+        return [normalized[value] for value in values]
+
+    def clear(self):
+        self._parse_cached.cache_clear()
+        with self._lock:
+            self.failures = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        info = self._parse_cached.cache_info()
+        return {
+            "entries": info.currsize,
+            "max_entries": info.maxsize,
+            "hits": info.hits,
+            "misses": info.misses,
+            "failures": self.failures,
+        }
+
+
+# 全局日期解析实例
+_date_normalizer = DateNormalizer(settings.date_parse_cache_size)
+
+def get_date_normalizer() -> DateNormalizer:
+    """获取日期解析实例"""
+    return _date_normalizer
+
+def parse_date(value: Optional[str]) -> Optional[date]:
+    """解析日期字符串，空值或无法解析时返回None"""
+    return _date_normalizer.parse(value)
+
+def normalize_date(value: Optional[str]) -> str:
+    """标准化为YYYY-MM-DD；无法解析时原样返回，空值返回空字符串"""
+    return _date_normalizer.normalize(value)
+
+def normalize_dates(values: Iterable[Optional[str]]) -> List[str]:
+    """批量标准化一个列表页的日期"""
+    return _date_normalizer.normalize_many(values)
@@ -0,0 +1,187 @@
+# Copyright (c) 2025 XBXyftx
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# 
+#     http://www.apache.org/licenses/LICENSE-2.0
+# 
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import gzip
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+try:
+    import brotli
+except ImportError:  # brotli为可选依赖，未安装时只提供gzip
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+# 小于该字节数的响应不压缩
+MIN_COMPRESS_SIZE = 1024
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 9
+
+
+def supported_encodings() -> Tuple[str, ...]:
+    """当前环境支持的预压缩编码，按优先级排序"""
+    return ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def compress_body(body: bytes, encoding: str) -> bytes:
+    """压缩响应体；gzip固定mtime，保证同一快照的压缩结果逐字节一致"""
+    if encoding == "gzip":
+        return gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+    if encoding == "br" and brotli is not None:
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    raise ValueError(f"不支持的压缩编码: {encoding}")
+
+
+class CachedBody:
+    """已编码的响应体及其按需生成的压缩版本"""
+    
+    __slots__ = ("raw", "variants")
+    
+    def __init__(self, raw: bytes):
+        self.raw = raw
+        self.variants: Dict[str, bytes] = {}
+    
+    def __len__(self) -> int:
+        return len(self.raw) + sum(len(variant) for variant in self.variants.values())
+
+
+class LRUBytesCache:
+    """按条目数和总字节数限制容量的LRU缓存"""
+    
+    def __init__(self, max_entries: int, max_bytes: int):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Hashable, Tuple[CachedBody, int]]" = OrderedDict()  # 键 -> (响应体, 写入时的字节数)
+        self._total_bytes = 0
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+    
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+    
+    def get(self, key: Hashable) -> Optional[CachedBody]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self._entries.move_to_end(key)
+        return entry[0]
+    
+    def put(self, key: Hashable, body: CachedBody):
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._total_bytes -= previous[1]
+        
+        # 超过总容量的单个响应不缓存，避免挤掉所有条目
+        size = len(body)
+        if size > self.max_bytes:
+            return
+        self._entries[key] = (body, size)
+        self._total_bytes += size
+        while len(self._entries) > self.max_entries or self._total_bytes > self.max_bytes:
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self._total_bytes -= evicted_size
+    
+    def clear(self):
+        self._entries.clear()
+        self._total_bytes = 0
+
+
+class ResponseCache:
+    """
+    按快照版本缓存已编码的响应体
+    
+    键中不包含版本号：缓存整体绑定到一个快照版本，遇到更新的版本时自动清空。
+    常规查询（分页/分类）和搜索查询分别使用独立的LRU，避免大量搜索变体挤掉热点列表响应。
+    gzip/brotli压缩版本在首次被请求时生成并与原始字节一起保存，每个快照只压缩一次。
+    """
+    
+    def __init__(self, max_entries: int = 256, max_search_entries: int = 512,
+                 max_bytes: int = 64 * 1024 * 1024, max_search_bytes: int = 16 * 1024 * 1024):
+        self._lock = threading.Lock()
+        self._version: Optional[int] = None
+        self._entries = LRUBytesCache(max_entries, max_bytes)
+        self._search_entries = LRUBytesCache(max_search_entries, max_search_bytes)
+        self._hits = 0
+        self._misses = 0
+    
+    def _sync_version(self, version: int) -> bool:
+        """切换到更新的快照版本时清空缓存；旧版本的请求返回False，不读写缓存（调用方需持有锁）"""
+        if self._version is None or version > self._version:
+            if self._version is not None:
+                logger.debug(f"🧹 [响应缓存] 快照版本 {self._version} -> {version}，清空缓存")
+            self._version = version
+            self._entries.clear()
+            self._search_entries.clear()
+        return version == self._version
+    
+    def get(self, version: int, key: Hashable, is_search: bool = False) -> Optional[CachedBody]:
+        with self._lock:
+            if not self._sync_version(version):
+                return None
+            body = (self._search_entries if is_search else self._entries).get(key)
+            if body is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+            return body
+    
+    def contains(self, version: int, key: Hashable, is_search: bool = False) -> bool:
+        """是否已缓存该快照版本的响应（不计入命中统计，不调整LRU顺序）"""
+        with self._lock:
+            return version == self._version and key in (self._search_entries if is_search else self._entries)
+    
+    def put(self, version: int, key: Hashable, body: CachedBody, is_search: bool = False):
+        with self._lock:
+            if self._sync_version(version):
+                (self._search_entries if is_search else self._entries).put(key, body)
+    
+    def get_or_build(self, version: int, key: Hashable, build: Callable[[], bytes],
+                     is_search: bool = False, encoding: Optional[str] = None) -> Tuple[bytes, Optional[str]]:
+        """
+        返回(响应体, 实际使用的压缩编码)
+        命中时直接返回缓存的字节；未命中时构建并写入缓存；
+        请求的压缩版本不存在时压缩一次并保存（构建和压缩过程不持有锁）
+        """
+        body = self.get(version, key, is_search)
+        if body is None:
+            body = CachedBody(build())
+            self.put(version, key, body, is_search)
+        
+        if encoding is None or len(body.raw) < MIN_COMPRESS_SIZE:
+            return body.raw, None
+        
+        variant = body.variants.get(encoding)
+        if variant is None:
+            variant = compress_body(body.raw, encoding)
+            body.variants[encoding] = variant
+            # 重新写入以更新LRU的字节统计
+            self.put(version, key, body, is_search)
+        return variant, encoding
+    
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "version": self._version,
+                "entries": len(self._entries),
+                "search_entries": len(self._search_entries),
+                "bytes": self._entries.total_bytes + self._search_entries.total_bytes,
+                "hits": self._hits,
+                "misses": self._misses
+            }
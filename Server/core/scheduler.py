@@ -22,6 +22,7 @@ from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
 from .cache import get_news_cache, get_banner_cache, ServiceStatus
+from .shared_cache import get_shared_cache
 from services.news_service import get_news_service, NewsSource
 
 logger = logging.getLogger(__name__)
@@ -91,25 +92,28 @@ class TaskScheduler:
             logger.info(f"✅ {task_name} - 验证完成，有效文章数: {len(valid_articles)}")
             
             # 🔥 重要：根据是否首次加载决定更新策略
-            if cache._is_first_load:
+            if cache.is_first_load:
                 # 首次加载：数据已经通过分批写入，只需确保状态正确
                 cache_status = cache.get_status()
                 if cache_status['cache_count'] > 0 and cache_status['status'] != 'ready':
                     logger.info(f"🎯 {task_name} - 确保缓存状态为就绪")
                     cache.set_status(ServiceStatus.READY)
+                # 首次加载完成后，后续定时更新改为后台构建新快照并原子替换
+                if cache_status['cache_count'] > 0:
+                    cache.complete_first_load()
                 logger.info(f"🎉 {task_name}完成（首次加载），缓存中共有 {cache_status['cache_count']} 篇文章")
             else:
                 # 后续更新：完整替换缓存，避免数据倒退
                 logger.info(f"🔄 {task_name} - 执行完整缓存更新（非首次加载）")
-                cache.update_cache(valid_articles)
+                cache.update_cache(news_service.to_news_articles(valid_articles))
                 cache_status = cache.get_status()
                 logger.info(f"🎉 {task_name}完成（完整更新），缓存中共有 {cache_status['cache_count']} 篇文章")
             
         except Exception as e:
             logger.error(f"❌ {task_name}失败: {e}", exc_info=True)
-            # 设置错误状态
+            # 缓存为空时设置错误状态；已有数据（含热重启恢复的快照）时旧快照继续提供服务
             cache = get_news_cache()
-            cache.set_status(ServiceStatus.ERROR, str(e))
+            cache.set_failed(str(e))
     
     async def _update_cache_job(self, source: NewsSource = NewsSource.ALL):
         """定时更新缓存任务"""
@@ -224,13 +228,19 @@ class TaskScheduler:
             
         except Exception as e:
             logger.error(f"提交初始缓存加载任务失败: {e}")
-            # 设置错误状态
+            # 缓存为空时设置错误状态，已有数据时继续提供服务
             cache = get_news_cache()
-            cache.set_status(ServiceStatus.ERROR, str(e))
+            cache.set_failed(str(e))
     
     async def manual_crawl(self, source: NewsSource = NewsSource.ALL):
         """手动触发爬取任务"""
         try:
+            # 共享快照模式下只读进程不爬取，转交持有爬虫的进程执行
+            coordinator = get_shared_cache()
+            if coordinator is not None and not coordinator.is_owner:
+                coordinator.request_crawl("news", source.value)
+                return
+            
             logger.info(f"开始执行手动爬取任务 - 来源: {source.value}")
             
             # 在线程池中执行爬虫任务
@@ -242,13 +252,18 @@ class TaskScheduler:
             
         except Exception as e:
             logger.error(f"提交手动爬取任务失败: {e}")
-            # 设置错误状态
+            # 缓存为空时设置错误状态，已有数据时继续提供服务
             cache = get_news_cache()
-            cache.set_status(ServiceStatus.ERROR, str(e))
+            cache.set_failed(str(e))
     
     async def manual_banner_crawl(self):
         """手动触发轮播图爬取任务"""
         try:
+            coordinator = get_shared_cache()
+            if coordinator is not None and not coordinator.is_owner:
+                coordinator.request_crawl("banner")
+                return
+            
             logger.info("开始执行手动轮播图爬取任务")
             
             # 在线程池中执行轮播图爬虫任务
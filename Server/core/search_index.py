@@ -0,0 +1,497 @@
+# Copyright (c) 2025 XBXyftx
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# 
+#     http://www.apache.org/licenses/LICENSE-2.0
+# 
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import heapq
+import logging
+import math
+import re
+import threading
+import unicodedata
+from array import array
+from bisect import bisect_left
+from collections import Counter, OrderedDict
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 建立索引的n-gram长度：单字/双字/三字，兼顾中文单字检索与英文短词检索
+GRAM_SIZES = (1, 2, 3)
+MAX_GRAM_SIZE = max(GRAM_SIZES)
+
+
+def _extract_grams(text: str, size: int) -> Set[str]:
+    """提取文本中指定长度的全部n-gram"""
+    if len(text) < size:
+        return set()
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+
+class NgramSearchIndex:
+    """
+    标题/摘要的字符n-gram倒排索引
+
+    与原有线性扫描保持相同的语义：关键词（忽略大小写）是标题或摘要的子串即命中。
+    查询时取关键词中倒排表最短的n-gram作为候选集，再用预先小写化的文本确认，
+    避免每次搜索都遍历并小写化全部文章。
+    
+    索引只追加不修改：已发布的快照记录自己的文档数量，查询时传入doc_count
+    即可忽略之后追加的文档，因此分批写入时多个快照可以共享同一个索引。
+    """
+
+    def __init__(self):
+        self._postings: Dict[str, array] = {}
+        self._texts: List[Tuple[str, str]] = []  # 每篇文章小写化后的(标题, 摘要)
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    def add(self, title: str, summary: Optional[str]) -> int:
+        """添加一篇文章，返回其文档编号（按添加顺序递增）"""
+        doc_id = len(self._texts)
+        title_lower = (title or "").lower()
+        summary_lower = (summary or "").lower()
+        self._texts.append((title_lower, summary_lower))
+
+        # n-gram按字段分别提取，避免跨越标题与摘要边界产生伪命中
+        grams: Set[str] = set()
+        for size in GRAM_SIZES:
+            grams |= _extract_grams(title_lower, size)
+            grams |= _extract_grams(summary_lower, size)
+
+        for gram in grams:
+            posting = self._postings.get(gram)
+            if posting is None:
+                posting = self._postings[gram] = array('i')
+            posting.append(doc_id)
+
+        return doc_id
+
+    def search(self, keyword: str, doc_count: Optional[int] = None) -> List[int]:
+        """返回命中关键词的文档编号列表（升序），指定doc_count时只返回编号小于它的文档"""
+        if doc_count is None:
+            doc_count = len(self._texts)
+        keyword_lower = keyword.lower()
+        if not keyword_lower:
+            return list(range(doc_count))
+
+        size = min(len(keyword_lower), MAX_GRAM_SIZE)
+        grams = _extract_grams(keyword_lower, size)
+
+        # 选择最短的倒排表作为候选集；任一n-gram不存在即无结果
+        shortest: Optional[array] = None
+        for gram in grams:
+            posting = self._postings.get(gram)
+            if posting is None:
+                return []
+            if shortest is None or len(posting) < len(shortest):
+                shortest = posting
+
+        if shortest is None:
+            return []
+        
+        # 倒排表升序排列且可能被下一个快照并发追加：总是按doc_count二分截取一次，
+        # 不能先判断末尾再截取（两次读取之间可能追加了快照之外的文档）
+        candidates = shortest[:bisect_left(shortest, doc_count)]
+
+        # 关键词不长于n-gram时，n-gram命中即子串命中，无需再确认
+        if len(keyword_lower) <= MAX_GRAM_SIZE:
+            return candidates.tolist()
+
+        texts = self._texts
+        return [
+            doc_id for doc_id in candidates
+            if keyword_lower in texts[doc_id][0] or keyword_lower in texts[doc_id][1]
+        ]
+
+    @classmethod
+    def build(cls, entries: Iterable[Tuple[str, Optional[str]]]) -> "NgramSearchIndex":
+        """根据(标题, 摘要)序列批量构建索引，文档编号即序列下标"""
+        index = cls()
+        for title, summary in entries:
+            index.add(title, summary)
+        return index
+
+
+# BM25参数（与Lucene默认值一致）
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# 字段权重：标题、摘要中的词比正文中的同一个词更能代表文章主题
+TITLE_WEIGHT = 3
+SUMMARY_WEIGHT = 2
+BODY_WEIGHT = 1
+
+# 命中的倒排项总数不超过该值时直接对全部倒排项打分，否则按权重降序逐步加深取前k篇
+EXHAUSTIVE_MAX_POSTINGS = 2000
+
+# 文档频率不低于文档总数的1/DENSE_MIN_RATIO的词，查询时展开为稠密权重数组，最多缓存DENSE_CACHE_TERMS个词
+DENSE_MIN_RATIO = 16
+DENSE_CACHE_TERMS = 64
+
+# 中日韩文字（含假名、谚文）按字切分，其余文字、数字按单词切分
+_CJK_CHARS = "\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af\uf900-\ufaff"
+_TOKEN_RUN = re.compile(f"[{_CJK_CHARS}]+|[^\\W{_CJK_CHARS}]+")
+_CJK_RUN = re.compile(f"[{_CJK_CHARS}]")
+_CJK_GAP = re.compile(f"(?<=[{_CJK_CHARS}])(?=[{_CJK_CHARS}])")
+_CJK_BIGRAM = re.compile(f"(?=([{_CJK_CHARS}]{{2}}))")
+
+
+def count_terms(text: str, weight: int = 1, counts: Optional[Dict[str, int]] = None) -> Dict[str, int]:
+    """
+    文档分词并累加词频（每次出现计weight）：拉丁字母/数字按单词切分（忽略大小写），
+    连续的中日韩文字同时产生单字和相邻双字，无需词典即可检索任意中文词
+    """
+    if counts is None:
+        counts = {}
+    get = counts.get
+    # 先统计连续字符段再展开，重复出现的字符段只展开一次
+    for run, n in Counter(_TOKEN_RUN.findall(text.lower())).items():
+        n *= weight
+        if _CJK_RUN.match(run):
+            for token in run:
+                counts[token] = get(token, 0) + n
+            for i in range(len(run) - 1):
+                token = run[i:i + 2]
+                counts[token] = get(token, 0) + n
+        else:
+            counts[run] = get(run, 0) + n
+    return counts
+
+
+def query_terms(text: str) -> List[str]:
+    """查询分词：中文词取相邻双字（单个汉字取单字），去重并保持顺序"""
+    terms: List[str] = []
+    for run in _TOKEN_RUN.findall(text.lower()):
+        if _CJK_RUN.match(run) and len(run) > 1:
+            terms.extend(run[i:i + 2] for i in range(len(run) - 1))
+        else:
+            terms.append(run)
+    return list(dict.fromkeys(terms))
+
+
+def tokenized_text(text: str) -> str:
+    """
+    以空格分隔的文档分词结果（与count_terms切分规则相同，保留重复），
+    用于写入按空白分词的SQLite全文索引
+    """
+    runs = " ".join(_TOKEN_RUN.findall(text.lower()))
+    # 单字：在相邻的两个中日韩文字之间插入空格；双字：重叠匹配相邻两字，词序不影响BM25得分
+    bigrams = _CJK_BIGRAM.findall(runs)
+    unigrams = _CJK_GAP.sub(" ", runs)
+    return f"{unigrams} {' '.join(bigrams)}" if bigrams else unigrams
+
+
+class BM25SearchIndex:
+    """
+    标题/摘要/正文（文本与代码块）的BM25相关度倒排索引
+
+    每个词的倒排表按文档编号升序保存，同时保存写入时算好的词频归一化权重
+    tf·(k1+1) / (tf + k1·(1-b+b·dl/avgdl))，查询时只需乘以按可见文档数计算的idf。
+    与NgramSearchIndex相同，索引只追加不修改，查询时传入doc_count即可忽略快照之后追加的文档。
+    分批追加的文档使用写入时的平均文档长度，下一次完整更新重建索引时统一。
+
+    取前k篇时按权重降序遍历各词的倒排表（阈值算法）：未遍历到的文档得分不超过各词当前深度权重之和，
+    第k篇候选的得分不低于该上界即可提前结束，常见词也无需对全部文档打分。
+    """
+
+    def __init__(self):
+        self._doc_ids: Dict[str, array] = {}  # 词 -> 文档编号（升序）
+        self._weights: Dict[str, array] = {}  # 词 -> 与文档编号对应的归一化词频权重
+        self._impact: Dict[str, array] = {}   # 词 -> 按权重降序排列的倒排项下标，查询时惰性构建
+        self._dense: "OrderedDict[str, array]" = OrderedDict()  # 高频词 -> 按文档编号索引的权重（LRU）
+        self._dense_lock = threading.Lock()
+        self._doc_count = 0
+        self._total_length = 0.0
+
+    def __len__(self) -> int:
+        return self._doc_count
+
+    @staticmethod
+    def _weighted_counts(title: str, summary: Optional[str], body: Iterable[str]) -> Tuple[Dict[str, int], int]:
+        """按字段权重统计词频，返回(词频, 加权文档长度)"""
+        counts: Dict[str, int] = {}
+        count_terms(title or "", TITLE_WEIGHT, counts)
+        count_terms(summary or "", SUMMARY_WEIGHT, counts)
+        count_terms("\n".join(body), BODY_WEIGHT, counts)
+        return counts, sum(counts.values())
+
+    def _add_counts(self, counts: Dict[str, int], length: int, avg_length: float) -> int:
+        doc_id = self._doc_count
+        norm = BM25_K1 * (1 - BM25_B + BM25_B * length / avg_length) if avg_length else BM25_K1
+        for term, tf in counts.items():
+            doc_ids = self._doc_ids.get(term)
+            if doc_ids is None:
+                doc_ids = self._doc_ids[term] = array('i')
+                self._weights[term] = array('f')
+            doc_ids.append(doc_id)
+            self._weights[term].append(tf * (BM25_K1 + 1) / (tf + norm))
+        self._total_length += length
+        self._doc_count = doc_id + 1
+        return doc_id
+
+    def add(self, title: str, summary: Optional[str], body: Iterable[str] = ()) -> int:
+        """追加一篇文章，返回其文档编号（按添加顺序递增，与NgramSearchIndex一致）"""
+        counts, length = self._weighted_counts(title, summary, body)
+        avg_length = (self._total_length + length) / (self._doc_count + 1)
+        return self._add_counts(counts, length, avg_length)
+
+    def _impact_order(self, term: str) -> array:
+        """词的倒排项下标按权重降序排列；追加文档后失效，下次查询时重建"""
+        weights = self._weights[term]
+        order = self._impact.get(term)
+        if order is None or len(order) != len(weights):
+            order = array('i', sorted(range(len(weights)), key=weights.__getitem__, reverse=True))
+            self._impact[term] = order
+        return order
+
+    def _query_postings(self, query: str, doc_count: int) -> List[Tuple[str, array, array, int, float]]:
+        """查询词对应的(词, 文档编号, 权重, 可见倒排项数, idf)，忽略索引中不存在的词"""
+        postings = []
+        for term in query_terms(query):
+            doc_ids = self._doc_ids.get(term)
+            if doc_ids is None:
+                continue
+            df = bisect_left(doc_ids, doc_count)  # 同NgramSearchIndex.search，总是二分截取
+            if df:
+                idf = math.log(1 + (doc_count - df + 0.5) / (df + 0.5))
+                postings.append((term, doc_ids, self._weights[term], df, idf))
+        return postings
+
+    def search(self, query: str, limit: int, doc_count: Optional[int] = None,
+               accept: Optional[Callable[[int], bool]] = None) -> List[Tuple[int, float]]:
+        """
+        返回相关度最高的至多limit篇文档的(文档编号, 得分)，按得分降序、同分按文档编号升序；
+        命中任一查询词即参与排序，指定doc_count时只考虑编号小于它的文档，accept为附加的文档过滤条件
+        """
+        if doc_count is None:
+            doc_count = self._doc_count
+        if limit <= 0 or doc_count <= 0:
+            return []
+        postings = self._query_postings(query, doc_count)
+        if not postings:
+            return []
+
+        if sum(df for _, _, _, df, _ in postings) <= EXHAUSTIVE_MAX_POSTINGS:
+            scores: Dict[int, float] = {}
+            for _, doc_ids, weights, df, idf in postings:
+                for i in range(df):
+                    doc_id = doc_ids[i]
+                    scores[doc_id] = scores.get(doc_id, 0.0) + idf * weights[i]
+            if accept is not None:
+                scores = {doc_id: score for doc_id, score in scores.items() if accept(doc_id)}
+            return self._top(scores, limit)
+
+        # 阈值算法：逐步加深各词按权重降序的遍历深度，只为遍历到的文档计算完整得分
+        orders = [self._impact_order(term) for term, _, _, _, _ in postings]
+        lookups = [self._weight_lookup(term, doc_ids, weights, df, doc_count)
+                   for term, doc_ids, weights, df, _ in postings]
+        positions = [0] * len(postings)
+        taken = [0] * len(postings)
+        scores = {}
+        rejected = set()
+        depth = max(limit, 64)
+        while True:
+            bound = 0.0
+            new_docs = set()
+            for t, (_, doc_ids, weights, df, idf) in enumerate(postings):
+                order = orders[t]
+                pos, count = positions[t], taken[t]
+                if len(order) == df:
+                    # 排序时没有快照之后追加的文档，整段取出
+                    end = min(pos + depth - count, df)
+                    new_docs.update(map(doc_ids.__getitem__, order[pos:end]))
+                    count += end - pos
+                    pos = end
+                    last = order[pos - 1]
+                else:
+                    last = -1
+                    while count < depth and pos < len(order):
+                        i = order[pos]
+                        pos += 1
+                        if doc_ids[i] < doc_count:
+                            new_docs.add(doc_ids[i])
+                            count += 1
+                            last = i
+                positions[t], taken[t] = pos, count
+                if count < df:
+                    # 该词尚未遍历到的文档权重不超过当前深度的权重
+                    bound += idf * weights[last]
+
+            new_docs.difference_update(scores)
+            new_docs.difference_update(rejected)
+            if accept is not None:
+                rejected.update(doc_id for doc_id in new_docs if not accept(doc_id))
+                new_docs.difference_update(rejected)
+            new_docs = list(new_docs)
+            new_scores = [0.0] * len(new_docs)
+            for lookup, (_, _, _, _, idf) in zip(lookups, postings):
+                new_scores = [score + idf * weight for score, weight in zip(new_scores, map(lookup, new_docs))]
+            scores.update(zip(new_docs, new_scores))
+
+            top = self._top(scores, limit)
+            if bound == 0.0 or (len(top) == limit and top[-1][1] >= bound):
+                return top
+            depth *= 2
+
+    def _weight_lookup(self, term: str, doc_ids: array, weights: array, df: int,
+                       doc_count: int) -> Callable[[int], float]:
+        """
+        返回按文档编号取该词权重的函数：高频词展开为按文档编号索引的稠密数组（最近使用的若干个词），
+        O(1)取值；其余词在倒排表上二分查找
+        """
+        if df * DENSE_MIN_RATIO >= doc_count:
+            with self._dense_lock:
+                dense = self._dense.get(term)
+                if dense is not None and len(dense) >= doc_count:
+                    self._dense.move_to_end(term)
+                    return dense.__getitem__
+            size = self._doc_count  # 构建期间可能有新文档追加，只展开当前已有的文档
+            dense = array('f', bytes(4 * size))
+            for i in range(bisect_left(doc_ids, size)):
+                dense[doc_ids[i]] = weights[i]
+            with self._dense_lock:
+                self._dense[term] = dense
+                while len(self._dense) > DENSE_CACHE_TERMS:
+                    self._dense.popitem(last=False)
+            return dense.__getitem__
+
+        def lookup(doc_id: int) -> float:
+            i = bisect_left(doc_ids, doc_id, 0, df)
+            return weights[i] if i < df and doc_ids[i] == doc_id else 0.0
+        return lookup
+
+    def count(self, query: str, cap: int, doc_count: Optional[int] = None,
+              accept: Optional[Callable[[int], bool]] = None) -> int:
+        """统计命中任一查询词的文档数，达到cap即停止（用于分页总数）"""
+        if doc_count is None:
+            doc_count = self._doc_count
+        postings = self._query_postings(query, doc_count)
+        if not postings:
+            return 0
+        if accept is None:
+            if max(df for _, _, _, df, _ in postings) >= cap:
+                return cap
+            return min(len(set().union(*(doc_ids[:df] for _, doc_ids, _, df, _ in postings))), cap)
+
+        seen = set()
+        matched = 0
+        for _, doc_ids, _, df, _ in postings:
+            for i in range(df):
+                doc_id = doc_ids[i]
+                if doc_id in seen:
+                    continue
+                seen.add(doc_id)
+                if accept(doc_id):
+                    matched += 1
+                    if matched >= cap:
+                        return cap
+        return matched
+
+    @staticmethod
+    def _top(scores: Dict[int, float], limit: int) -> List[Tuple[int, float]]:
+        return heapq.nsmallest(limit, scores.items(), key=lambda item: (-item[1], item[0]))
+
+    @classmethod
+    def build(cls, entries: Iterable[Tuple[str, Optional[str], Iterable[str]]]) -> "BM25SearchIndex":
+        """根据(标题, 摘要, 正文文本序列)批量构建索引，全部文档使用同一个平均文档长度"""
+        docs = [cls._weighted_counts(title, summary, body) for title, summary, body in entries]
+        avg_length = sum(length for _, length in docs) / len(docs) if docs else 0.0
+        index = cls()
+        for counts, length in docs:
+            index._add_counts(counts, length, avg_length)
+        return index
+
+
+def normalize_title(text: str) -> str:
+    """标题归一化：全角转半角（NFKC）、忽略大小写、合并连续空白"""
+    return " ".join(unicodedata.normalize("NFKC", text or "").lower().split())
+
+
+class TitleSuggestIndex:
+    """
+    标题前缀补全索引（有序数组 + 二分查找）
+
+    每个归一化标题在开头（位置0，即使以标点开头）及每个词（连续的字母数字或连续的中日韩文字）
+    的起始位置各产生一个后缀条目，条目以(文档编号, 起始位置)保存并按后缀排序，不复制后缀字符串。
+    中日韩文字没有分词，一段连续的中日韩文字只在其起始位置有条目：
+    "鸿蒙开发者大会"可由"鸿蒙"补全，但"开发者"不会匹配到它。
+    文档编号即快照中按日期由近到远的文章下标，编号越小越新。
+    查询时二分得到以前缀开头的条目区间：区间较小时直接取区间内编号最小的k篇，
+    区间较大时按编号从新到旧检查标题，命中的比例高，很快即可凑满k篇。
+    """
+
+    def __init__(self, titles: Iterable[str]):
+        self._titles: List[str] = [normalize_title(title) for title in titles]
+        doc_ids = array("i")
+        offsets = array("i")
+        self._bounds = array("i", [0])  # 文档的条目在offsets中的起止位置
+        for doc_id, title in enumerate(self._titles):
+            starts = [match.start() for match in _TOKEN_RUN.finditer(title)]
+            if title and (not starts or starts[0] != 0):
+                starts.insert(0, 0)  # 以标点开头的标题（如"【公告】"）整体也可前缀匹配
+            for start in starts:
+                doc_ids.append(doc_id)
+                offsets.append(start)
+            self._bounds.append(len(offsets))
+        titles_ = self._titles
+        order = sorted(range(len(offsets)), key=lambda i: titles_[doc_ids[i]][offsets[i]:])
+        self._doc_ids = array("i", (doc_ids[i] for i in order))
+        self._offsets = array("i", (offsets[i] for i in order))
+        self._entry_offsets = offsets  # 按文档顺序排列的起始位置
+
+    def __len__(self) -> int:
+        return len(self._titles)
+
+    def _bisect(self, prefix: str, inclusive: bool) -> int:
+        """二分查找第一个截取前缀长度后大于（inclusive为False时为不小于）prefix的条目"""
+        titles, doc_ids, offsets = self._titles, self._doc_ids, self._offsets
+        size = len(prefix)
+        lo, hi = 0, len(doc_ids)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            offset = offsets[mid]
+            head = titles[doc_ids[mid]][offset:offset + size]
+            if head < prefix or (inclusive and head == prefix):
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def _matches(self, doc_id: int, prefix: str) -> bool:
+        title = self._titles[doc_id]
+        if prefix not in title:
+            return False
+        return any(
+            title.startswith(prefix, self._entry_offsets[i])
+            for i in range(self._bounds[doc_id], self._bounds[doc_id + 1])
+        )
+
+    def suggest(self, prefix: str, limit: int) -> List[int]:
+        """返回标题（或标题中某个词）以prefix开头的最新至多limit篇文章的文档编号（由新到旧）"""
+        prefix = normalize_title(prefix)
+        if not prefix or limit <= 0:
+            return []
+        lo = self._bisect(prefix, inclusive=False)
+        hi = self._bisect(prefix, inclusive=True)
+        if lo >= hi:
+            return []
+        # 区间内扫描约hi-lo次；按新旧顺序检查约limit·N/(hi-lo)次，取代价较小者
+        if (hi - lo) ** 2 <= limit * len(self._titles):
+            return heapq.nsmallest(limit, set(self._doc_ids[lo:hi]))
+        results: List[int] = []
+        for doc_id in range(len(self._titles)):
+            if self._matches(doc_id, prefix):
+                results.append(doc_id)
+                if len(results) >= limit:
+                    break
+        return results
@@ -0,0 +1,171 @@
+# Copyright (c) 2025 XBXyftx
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import logging
+import os
+from typing import Awaitable, Callable, IO, Optional
+
+from core.cache import get_banner_cache, get_news_cache
+from core.config import settings
+from core.snapshot_store import SnapshotStore, get_snapshot_store
+
+try:
+    import fcntl
+except ImportError:  # Windows没有fcntl，退化为每个进程各自爬取
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+
+class CrawlerOwnerLock:
+    """跨进程的爬虫归属锁（非阻塞文件锁，持有进程退出时由操作系统自动释放）"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file: Optional[IO[str]] = None
+
+    @property
+    def is_held(self) -> bool:
+        return self._file is not None
+
+    def try_acquire(self) -> bool:
+        """尝试获取锁，已被其他进程持有时立即返回False"""
+        if self._file is not None:
+            return True
+        if fcntl is None:
+            logger.warning("⚠️ [共享快照] 当前平台不支持文件锁，本进程直接作为爬虫进程")
+            self._file = open(os.devnull, "w")
+            return True
+
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        lock_file = open(self.path, "a+")
+        try:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            return False
+
+        # 记录持有者进程号，便于排查
+        lock_file.seek(0)
+        lock_file.truncate()
+        lock_file.write(str(os.getpid()))
+        lock_file.flush()
+        self._file = lock_file
+        return True
+
+    def release(self):
+        if self._file is not None:
+            self._file.close()  # 关闭文件即释放flock
+            self._file = None
+
+
+class SharedCacheCoordinator:
+    """
+    多工作进程共享快照的协调器
+
+    uvicorn以多个工作进程运行时，只有持有爬虫归属锁的进程运行定时任务、爬取并将快照发布到
+    快照存储；其余进程只读，定期比较存储中的版本号：首次加载的分批写入只读取新增文章并增量追加，
+    两次检查之间的多个批次合并为一次追加；完整更新后才整体重新加载。
+    爬虫进程退出后锁自动释放，下一个检查周期由某个只读进程接管。
+    只读进程收到的手动爬取请求写入存储，由爬虫进程取出执行。
+    """
+
+    def __init__(self, store: SnapshotStore, lock: CrawlerOwnerLock, sync_interval: float):
+        self.store = store
+        self.lock = lock
+        self.sync_interval = sync_interval
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def is_owner(self) -> bool:
+        return self.lock.is_held
+
+    @property
+    def role(self) -> str:
+        return "owner" if self.is_owner else "follower"
+
+    def sync_once(self):
+        """同步一次：只读进程加载新闻快照；轮播图允许任意进程强制爬取，所有进程都同步"""
+        if not self.is_owner:
+            get_news_cache().sync_from_store()
+        get_banner_cache().sync_from_store()
+
+    def request_crawl(self, kind: str, source: Optional[str] = None):
+        """只读进程转交手动爬取请求"""
+        self.store.request_crawl(kind, source)
+        logger.info(f"🔗 [共享快照] 本进程为只读进程，{kind} 爬取请求已转交爬虫进程")
+
+    async def _dispatch_crawl_requests(self):
+        from core.scheduler import get_scheduler
+        from services.news_service import NewsSource
+
+        loop = asyncio.get_event_loop()
+        requests = await loop.run_in_executor(None, self.store.take_crawl_requests)
+        scheduler = get_scheduler()
+        for kind, source in requests:
+            if kind == "news":
+                await scheduler.manual_crawl(NewsSource(source) if source else NewsSource.ALL)
+            elif kind == "banner":
+                await scheduler.manual_banner_crawl()
+
+    async def _run(self, on_promote: Callable[[], Awaitable[None]]):
+        loop = asyncio.get_event_loop()
+        while True:
+            await asyncio.sleep(self.sync_interval)
+            try:
+                await loop.run_in_executor(None, self.sync_once)
+                if not self.is_owner and self.lock.try_acquire():
+                    logger.info(f"🔗 [共享快照] 爬虫进程已退出，本进程（PID {os.getpid()}）接管爬取")
+                    await on_promote()
+                if self.is_owner:
+                    await self._dispatch_crawl_requests()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"⚠️ [共享快照] 同步失败，下个周期重试: {e}")
+
+    def start(self, on_promote: Callable[[], Awaitable[None]]):
+        """在当前事件循环中启动同步任务；on_promote在只读进程接管爬取时调用"""
+        if self._task is None:
+            self._task = asyncio.get_event_loop().create_task(self._run(on_promote))
+
+    def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        self.lock.release()
+
+
+# 全局协调器实例
+_coordinator: Optional[SharedCacheCoordinator] = None
+
+def init_shared_cache() -> Optional[SharedCacheCoordinator]:
+    """初始化共享快照模式并竞争爬虫归属，未启用时返回None"""
+    global _coordinator
+    if not settings.cache_shared_enabled:
+        return None
+    store = get_snapshot_store()
+    if store is None:
+        logger.warning("⚠️ [共享快照] 共享快照依赖快照持久化，CACHE_PERSIST_ENABLED=false 时不启用")
+        return None
+
+    lock = CrawlerOwnerLock(settings.cache_owner_lock_path)
+    lock.try_acquire()
+    _coordinator = SharedCacheCoordinator(store, lock, settings.cache_sync_interval)
+    logger.info(f"🔗 [共享快照] 工作进程 PID {os.getpid()} 角色: {_coordinator.role}")
+    return _coordinator
+
+def get_shared_cache() -> Optional[SharedCacheCoordinator]:
+    """获取共享快照协调器，未启用共享快照模式时返回None"""
+    return _coordinator
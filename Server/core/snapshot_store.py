@@ -0,0 +1,288 @@
+# Copyright (c) 2025 XBXyftx
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# 
+#     http://www.apache.org/licenses/LICENSE-2.0
+# 
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Dict, Generator, Iterable, List, Optional, Tuple
+
+from core.article_store import ArticleRecord
+from core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 快照文件格式版本，结构变化时递增，旧文件将被忽略并在下次发布时重写
+SNAPSHOT_FORMAT = 2
+
+# 排序键超过SQLite整数范围，按定长十六进制文本保存，字典序即数值序
+_SORT_KEY_WIDTH = 32
+
+# 读取时内存映射的最大字节数：多个工作进程映射同一文件，页面由操作系统页缓存共享
+_MMAP_SIZE = 256 * 1024 * 1024
+
+
+def _encode_sort_key(sort_key: int) -> str:
+    return f"{sort_key:0{_SORT_KEY_WIDTH}x}"
+
+
+def _parse_datetime(value: Optional[str]) -> Optional[datetime]:
+    return datetime.fromisoformat(value) if value else None
+
+
+def _format_datetime(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value else None
+
+
+class SnapshotStore:
+    """
+    缓存快照的本地持久化（SQLite单文件）
+
+    每次发布新快照时写入，服务启动时同步加载，重启或部署后无需等待爬虫即可提供完整数据。
+    首次加载的分批写入只追加本批次文章，完整更新在一个事务中整体替换。
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()  # 串行化写入，避免新闻与轮播图同时写入时锁库
+        self._initialized = False
+
+    @contextmanager
+    def _connect(self) -> Generator[sqlite3.Connection, None, None]:
+        """打开快照数据库连接，with块结束时提交事务"""
+        conn = sqlite3.connect(self.path, timeout=10)
+        conn.execute(f"PRAGMA mmap_size = {_MMAP_SIZE}")
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _ensure_schema(self):
+        if self._initialized:
+            return
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            if conn.execute("PRAGMA user_version").fetchone()[0] != SNAPSHOT_FORMAT:
+                logger.info(f"💾 [快照持久化] 快照文件格式不匹配，重建: {self.path}")
+                conn.execute("DROP TABLE IF EXISTS snapshot_meta")
+                conn.execute("DROP TABLE IF EXISTS news_snapshot")
+                conn.execute(f"PRAGMA user_version = {SNAPSHOT_FORMAT}")
+            # WAL模式：只读工作进程加载快照时不阻塞发布进程写入
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS snapshot_meta (
+                    name TEXT PRIMARY KEY,
+                    version INTEGER NOT NULL,
+                    last_update TEXT,
+                    update_count INTEGER DEFAULT 0,
+                    replaced_version INTEGER DEFAULT 0,  -- 最近一次整体替换（或清空）时的版本
+                    payload TEXT  -- 轮播图数据（JSON）
+                )
+            ''')
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS news_snapshot (
+                    url TEXT PRIMARY KEY,
+                    sort_key TEXT NOT NULL,  -- 定长十六进制排序键
+                    id TEXT,
+                    title TEXT NOT NULL,
+                    date TEXT NOT NULL,
+                    category TEXT,
+                    summary TEXT,
+                    source TEXT,
+                    image TEXT,
+                    content BLOB,  -- zlib压缩的内容块
+                    created_at TEXT,
+                    updated_at TEXT,
+                    version INTEGER NOT NULL DEFAULT 0  -- 写入该行的快照版本
+                )
+            ''')
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_news_snapshot_version ON news_snapshot(version)")
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS crawl_request (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    kind TEXT NOT NULL,  -- news / banner
+                    source TEXT,
+                    requested_at TEXT
+                )
+            ''')
+        self._initialized = True
+
+    @staticmethod
+    def _news_rows(keyed_records: Iterable[Tuple[int, ArticleRecord]], version: int) -> Iterable[tuple]:
+        for sort_key, record in keyed_records:
+            yield (
+                record.url, _encode_sort_key(sort_key), record.id, record.title, record.date,
+                record.category, record.summary, record.source, record.image,
+                record.content_blob, _format_datetime(record.created_at), _format_datetime(record.updated_at),
+                version
+            )
+
+    @staticmethod
+    def _save_meta(conn: sqlite3.Connection, name: str, version: int, last_update: Optional[str],
+                   update_count: int, payload: Optional[str] = None, replaced_version: int = 0):
+        conn.execute(
+            "INSERT OR REPLACE INTO snapshot_meta (name, version, last_update, update_count, replaced_version, payload) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (name, version, last_update, update_count, replaced_version, payload)
+        )
+
+    def save_news(self, version: int, last_update: Optional[str], update_count: int,
+                  keyed_records: Iterable[Tuple[int, ArticleRecord]], replace: bool = True):
+        """
+        保存新闻快照；replace为True时整体替换（完整更新），
+        否则只追加本批次文章（首次加载的分批写入）。每行记录写入时的版本，
+        只读工作进程据此只加载上次同步之后追加的文章
+        """
+        start_time = time.time()
+        with self._lock:
+            self._ensure_schema()
+            with self._connect() as conn:
+                if replace:
+                    conn.execute("DELETE FROM news_snapshot")
+                    replaced_version = version
+                else:
+                    row = conn.execute(
+                        "SELECT replaced_version FROM snapshot_meta WHERE name = 'news'"
+                    ).fetchone()
+                    replaced_version = row[0] if row else 0
+                conn.executemany(
+                    "INSERT OR REPLACE INTO news_snapshot (url, sort_key, id, title, date, category, summary, "
+                    "source, image, content, created_at, updated_at, version) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    self._news_rows(keyed_records, version)
+                )
+                self._save_meta(conn, "news", version, last_update, update_count,
+                                replaced_version=replaced_version)
+        logger.debug(f"💾 [快照持久化] 新闻快照已保存（版本 {version}），耗时 {time.time() - start_time:.3f}秒")
+
+    def load_news(self, since_version: int = 0) -> Optional[Tuple[Dict[str, Any], List[Tuple[int, ArticleRecord]]]]:
+        """
+        加载新闻快照，返回(元数据, 按日期由近到远排序的(排序键, 记录)列表)；没有快照时返回None
+        since_version大于0时只返回该版本之后写入的文章；元数据中的replaced_version
+        不大于since_version时，这些文章即为该版本之后追加的全部变化
+        """
+        if not os.path.exists(self.path):
+            return None
+        with self._lock:
+            self._ensure_schema()
+            with self._connect() as conn:
+                # 元数据与文章在同一个读事务中读取，避免读到发布进程写入一半的快照
+                conn.execute("BEGIN")
+                meta = conn.execute(
+                    "SELECT version, last_update, update_count, replaced_version FROM snapshot_meta WHERE name = 'news'"
+                ).fetchone()
+                if meta is None:
+                    return None
+                rows = conn.execute(
+                    "SELECT sort_key, id, title, date, url, category, summary, source, image, content, "
+                    "created_at, updated_at FROM news_snapshot WHERE version > ? ORDER BY sort_key DESC",
+                    (since_version,)
+                ).fetchall()
+
+        keyed_records = [
+            (int(sort_key, 16), ArticleRecord.from_blob(
+                id=article_id, title=title, date=date, url=url, content_blob=content,
+                category=category, summary=summary, source=source, image=image,
+                created_at=_parse_datetime(created_at), updated_at=_parse_datetime(updated_at)
+            ))
+            for (sort_key, article_id, title, date, url, category, summary, source, image,
+                 content, created_at, updated_at) in rows
+        ]
+        version, last_update, update_count, replaced_version = meta
+        return {
+            "version": version, "last_update": last_update, "update_count": update_count,
+            "replaced_version": replaced_version or 0
+        }, keyed_records
+
+    def get_version(self, name: str) -> Optional[int]:
+        """读取已保存快照的版本号（news / banner），用于只读工作进程低成本地检测变化"""
+        if not os.path.exists(self.path):
+            return None
+        with self._lock:
+            self._ensure_schema()
+            with self._connect() as conn:
+                row = conn.execute("SELECT version FROM snapshot_meta WHERE name = ?", (name,)).fetchone()
+        return row[0] if row else None
+
+    def clear_news(self, version: int):
+        """清空新闻快照（保留版本号，保证重启后版本不回退）"""
+        with self._lock:
+            self._ensure_schema()
+            with self._connect() as conn:
+                conn.execute("DELETE FROM news_snapshot")
+                self._save_meta(conn, "news", version, None, 0, replaced_version=version)
+
+    def save_banners(self, version: int, last_update: Optional[str], update_count: int,
+                     images: List[Dict[str, Any]]):
+        """保存轮播图数据"""
+        with self._lock:
+            self._ensure_schema()
+            with self._connect() as conn:
+                self._save_meta(conn, "banner", version, last_update, update_count,
+                                json.dumps(images, ensure_ascii=False))
+
+    def load_banners(self) -> Optional[Tuple[Dict[str, Any], List[Dict[str, Any]]]]:
+        """加载轮播图数据，返回(元数据, 轮播图列表)；没有快照时返回None"""
+        if not os.path.exists(self.path):
+            return None
+        with self._lock:
+            self._ensure_schema()
+            with self._connect() as conn:
+                row = conn.execute(
+                    "SELECT version, last_update, update_count, payload FROM snapshot_meta WHERE name = 'banner'"
+                ).fetchone()
+        if row is None:
+            return None
+        version, last_update, update_count, payload = row
+        return {"version": version, "last_update": last_update, "update_count": update_count}, json.loads(payload or "[]")
+
+    def request_crawl(self, kind: str, source: Optional[str] = None):
+        """记录一次手动爬取请求，由持有爬虫的工作进程取出执行"""
+        with self._lock:
+            self._ensure_schema()
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT INTO crawl_request (kind, source, requested_at) VALUES (?, ?, ?)",
+                    (kind, source, datetime.now().isoformat())
+                )
+
+    def take_crawl_requests(self) -> List[Tuple[str, Optional[str]]]:
+        """取出并删除全部待执行的爬取请求，返回(类型, 来源)列表"""
+        if not os.path.exists(self.path):
+            return []
+        with self._lock:
+            self._ensure_schema()
+            with self._connect() as conn:
+                rows = conn.execute("SELECT id, kind, source FROM crawl_request ORDER BY id").fetchall()
+                if rows:
+                    conn.execute("DELETE FROM crawl_request WHERE id <= ?", (rows[-1][0],))
+        return [(kind, source) for _, kind, source in rows]
+
+
+# 全局快照存储实例
+_snapshot_store: Optional[SnapshotStore] = None
+
+def get_snapshot_store() -> Optional[SnapshotStore]:
+    """获取快照存储实例，未启用持久化时返回None"""
+    global _snapshot_store
+    if not settings.cache_persist_enabled:
+        return None
+    if _snapshot_store is None:
+        _snapshot_store = SnapshotStore(settings.cache_snapshot_path)
+    return _snapshot_store
@@ -20,9 +20,10 @@ import asyncio
 
 from core.config import settings
 from core.logging_config import setup_logging
-from core.database import init_database
+from core.database import init_database, close_db
 from core.scheduler import start_scheduler, stop_scheduler, get_scheduler
 from core.cache import init_cache, get_news_cache
+from core.shared_cache import init_shared_cache, get_shared_cache
 
 # 导入API路由
 from api import news, banner
@@ -168,6 +169,26 @@ async def api_health_check():
             "error": str(e)
         }
 
+async def start_crawler():
+    """启动定时任务调度器并执行初始缓存加载（共享快照模式下只在爬虫进程执行）"""
+    # 启动定时任务调度器
+    if settings.enable_scheduler:
+        try:
+            start_scheduler()
+            logger.info("定时任务调度器启动完成")
+        except Exception as e:
+            logger.error(f"定时任务调度器启动失败: {e}")
+    
+    # 执行初始缓存加载
+    try:
+        logger.info("开始执行初始缓存加载...")
+        scheduler = get_scheduler()
+        await scheduler.initial_cache_load()
+        logger.info("初始缓存加载完成")
+    except Exception as e:
+        logger.error(f"初始缓存加载失败: {e}")
+        # 不抛出异常，让服务继续启动
+
 # 应用启动事件
 @app.on_event("startup")
 async def startup_event():
@@ -189,23 +210,14 @@ async def startup_event():
         logger.error(f"缓存初始化失败: {e}")
         raise
     
-    # 启动定时任务调度器
-    if settings.enable_scheduler:
-        try:
-            start_scheduler()
-            logger.info("定时任务调度器启动完成")
-        except Exception as e:
-            logger.error(f"定时任务调度器启动失败: {e}")
-    
-    # 执行初始缓存加载
-    try:
-        logger.info("开始执行初始缓存加载...")
-        scheduler = get_scheduler()
-        await scheduler.initial_cache_load()
-        logger.info("初始缓存加载完成")
-    except Exception as e:
-        logger.error(f"初始缓存加载失败: {e}")
-        # 不抛出异常，让服务继续启动
+    # 多工作进程共享快照：只有持有爬虫归属锁的进程爬取，其余进程只读同步
+    coordinator = init_shared_cache()
+    if coordinator is None or coordinator.is_owner:
+        await start_crawler()
+    else:
+        logger.info("🔗 [共享快照] 本进程为只读进程，不启动爬虫，从共享快照同步数据")
+    if coordinator is not None:
+        coordinator.start(on_promote=start_crawler)
     
     logger.info("应用启动完成")
 
@@ -214,6 +226,10 @@ async def startup_event():
 async def shutdown_event():
     logger.info("应用关闭中...")
     
+    coordinator = get_shared_cache()
+    if coordinator is not None:
+        coordinator.stop()
+    
     # 停止定时任务调度器
     if settings.enable_scheduler:
         try:
@@ -222,6 +238,9 @@ async def shutdown_event():
         except Exception as e:
             logger.error(f"停止定时任务调度器失败: {e}")
     
+    # 关闭启动时（init_database）在事件循环线程上打开的数据库连接
+    close_db()
+    
     logger.info("应用关闭完成")
 
 if __name__ == "__main__":
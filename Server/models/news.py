@@ -38,6 +38,32 @@ class NewsArticle(BaseModel):
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
+class NewsView(str, Enum):
+    """新闻列表的返回视图"""
+    FULL = "full"         # 完整文章（含全部内容块）
+    SUMMARY = "summary"   # 列表卡片摘要（不含内容块）
+
+class NewsSort(str, Enum):
+    """搜索结果的排序方式"""
+    DATE = "date"             # 按日期由近到远（子串匹配标题/摘要）
+    RELEVANCE = "relevance"   # 按BM25相关度（检索标题、摘要和正文）
+
+class NewsFormat(str, Enum):
+    """新闻列表的响应格式"""
+    JSON = "json"       # 单个JSON文档（NewsResponse）
+    NDJSON = "ndjson"   # 每行一篇文章的流式响应（不分页）
+
+class NewsArticleSummary(BaseModel):
+    """新闻列表卡片所需的字段，完整内容通过详情接口获取"""
+    id: Optional[str] = None
+    title: str
+    date: str
+    url: str
+    category: Optional[str] = None
+    summary: Optional[str] = None
+    source: Optional[str] = None
+    image: Optional[str] = Field(None, description="首张图片URL（列表缩略图）")
+
 class NewsResponse(BaseModel):
     articles: List[NewsArticle]
     total: int
@@ -45,6 +71,46 @@ class NewsResponse(BaseModel):
     page_size: int
     has_next: bool = Field(False, description="是否有下一页")
     has_prev: bool = Field(False, description="是否有上一页")
+    next_cursor: Optional[str] = Field(None, description="下一页游标（键集分页），没有下一页时为空")
+    version: int = Field(0, description="数据快照版本号，可作为增量同步的since参数")
+
+class NewsSummaryResponse(BaseModel):
+    articles: List[NewsArticleSummary]
+    total: int
+    page: int
+    page_size: int
+    has_next: bool = Field(False, description="是否有下一页")
+    has_prev: bool = Field(False, description="是否有上一页")
+    next_cursor: Optional[str] = Field(None, description="下一页游标（键集分页），没有下一页时为空")
+    version: int = Field(0, description="数据快照版本号，可作为增量同步的since参数")
+
+class NewsChangesResponse(BaseModel):
+    since: int = Field(..., description="客户端已同步的快照版本号")
+    version: int = Field(..., description="当前快照版本号，下次同步时作为since传入")
+    full_resync: bool = Field(False, description="since已超出差异历史，客户端需重新全量拉取")
+    upserted: List[NewsArticle] = Field(default_factory=list, description="新增或内容变化的文章")
+    removed: List[str] = Field(default_factory=list, description="已移除文章的ID")
+
+class FacetCount(BaseModel):
+    value: str
+    count: int
+
+class NewsFacetsResponse(BaseModel):
+    total: int = Field(..., description="参与统计的文章数")
+    category: List[FacetCount] = Field(default_factory=list, description="按分类统计（数量降序）")
+    source: List[FacetCount] = Field(default_factory=list, description="按来源统计（数量降序）")
+    month: List[FacetCount] = Field(default_factory=list, description="按月份统计（YYYY-MM，由近到远，日期无法解析的文章计入unknown）")
+    version: int = Field(0, description="数据快照版本号")
+
+class NewsSuggestion(BaseModel):
+    id: Optional[str] = None
+    title: str
+    date: str
+
+class NewsSuggestResponse(BaseModel):
+    query: str
+    suggestions: List[NewsSuggestion] = Field(default_factory=list, description="标题前缀匹配的最新文章（由新到旧）")
+    version: int = Field(0, description="数据快照版本号")
 
 class SearchRequest(BaseModel):
     keyword: str
@@ -17,6 +17,7 @@ from enum import Enum
 
 from .openharmony_news_crawler import OpenHarmonyNewsCrawler
 from .openharmony_blog_crawler import OpenHarmonyBlogCrawler
+from models.news import NewsArticle
 
 logger = logging.getLogger(__name__)
 
@@ -51,35 +52,10 @@ class NewsService:
             def create_batch_callback(source_name):
                 def batch_callback(batch_articles):
                     from core.cache import get_news_cache
-                    from models.news import NewsArticle
                     cache = get_news_cache()
                     
                     # 转换字典为NewsArticle对象
-                    news_articles = []
-                    for article_dict in batch_articles:
-                        try:
-                            # 验证和转换content字段
-                            if 'content' in article_dict:
-                                content = article_dict['content']
-                                if isinstance(content, list):
-                                    # 确保每个content元素都是NewsContentBlock格式
-                                    validated_content = []
-                                    for block in content:
-                                        if isinstance(block, dict) and 'type' in block and 'value' in block:
-                                            validated_content.append(block)
-                                        else:
-                                            logger.warning(f"⚠️ [{source_name}批次] 无效的content块: {block}")
-                                    article_dict['content'] = validated_content
-                                else:
-                                    logger.warning(f"⚠️ [{source_name}批次] content不是列表格式: {type(content)}")
-                                    article_dict['content'] = []
-                            
-                            news_article = NewsArticle(**article_dict)
-                            news_articles.append(news_article)
-                        except Exception as e:
-                            logger.error(f"❌ [{source_name}批次] 文章数据转换失败: {e}")
-                            logger.error(f"文章数据字段: {list(article_dict.keys()) if isinstance(article_dict, dict) else type(article_dict)}")
-                            continue
+                    news_articles = self.to_news_articles(batch_articles, f"{source_name}批次")
                     
                     if news_articles:
                         cache.append_to_cache(news_articles)
@@ -122,6 +98,45 @@ class NewsService:
         
         return articles
     
+    def to_news_articles(self, articles: List[Dict], label: str = "完整更新") -> List[NewsArticle]:
+        """
+        将爬虫输出的文章字典转换为NewsArticle对象，跳过无法转换的文章
+        
+        Args:
+            articles: 爬虫输出的文章字典列表
+            label: 日志标签
+            
+        Returns:
+            NewsArticle对象列表
+        """
+        news_articles = []
+        for article_dict in articles:
+            try:
+                # 验证和转换content字段
+                if 'content' in article_dict:
+                    content = article_dict['content']
+                    if isinstance(content, list):
+                        # 确保每个content元素都是NewsContentBlock格式
+                        validated_content = []
+                        for block in content:
+                            if isinstance(block, dict) and 'type' in block and 'value' in block:
+                                validated_content.append(block)
+                            else:
+                                logger.warning(f"⚠️ [{label}] 无效的content块: {block}")
+                        article_dict['content'] = validated_content
+                    else:
+                        logger.warning(f"⚠️ [{label}] content不是列表格式: {type(content)}")
+                        article_dict['content'] = []
+                
+                news_article = NewsArticle(**article_dict)
+                news_articles.append(news_article)
+            except Exception as e:
+                logger.error(f"❌ [{label}] 文章数据转换失败: {e}")
+                logger.error(f"文章数据字段: {list(article_dict.keys()) if isinstance(article_dict, dict) else type(article_dict)}")
+                continue
+        
+        return news_articles
+    
     def get_news_sources(self) -> List[Dict]:
         """
         获取所有支持的新闻源信息
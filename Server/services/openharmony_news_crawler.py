@@ -19,6 +19,8 @@ import time
 from urllib.parse import urljoin
 from datetime import datetime
 
+from core.date_normalizer import normalize_date, normalize_dates
+
 class OpenHarmonyNewsCrawler:
     def __init__(self):
         self.base_url = "https://old.openharmony.cn"
@@ -66,15 +68,12 @@ class OpenHarmonyNewsCrawler:
                 print(f"✅ 第{page_num}页无数据，爬取完成")
                 break
 
-            # 处理本页数据
+            # 处理本页数据（整页日期一次批量标准化为YYYY-MM-DD）
             page_count = 0
-            for item in data:
+            page_dates = normalize_dates(item.get("startTime", "") for item in data)
+            for item, standardized_date in zip(data, page_dates):
                 url = item.get("url")
                 title = item.get("title", "")
-                date = item.get("startTime", "")
-
-                # 标准化日期格式
-                standardized_date = self._standardize_date(date)
 
                 if url and url not in all_infos:
                     all_infos[url] = {"title": title, "date": standardized_date}
@@ -166,36 +165,6 @@ class OpenHarmonyNewsCrawler:
                             result_data.append({"type": "video", "value": video_url})
         return result_data
 
-    def _standardize_date(self, date_str):
-        """标准化日期格式，将多种日期格式统一为YYYY-MM-DD格式"""
-        if not date_str:
-            return ''
-
-        try:
-            # 匹配多种日期格式：2025.9.13, 2025-9-13, 2025/9/13, 2025年9月13日
-            date_pattern = r'(\d{4})[.\-\/年](\d{1,2})[.\-\/月](\d{1,2})[日]?'
-            match = re.search(date_pattern, str(date_str))
-
-            if match:
-                year, month, day = match.groups()
-                # 格式化为统一的YYYY-MM-DD格式
-                return f"{year}-{int(month):02d}-{int(day):02d}"
-            else:
-                # 尝试直接解析日期字符串
-                # 处理只有年月的情况
-                month_pattern = r'(\d{4})[.\-\/年](\d{1,2})[月]?'
-                month_match = re.search(month_pattern, str(date_str))
-                if month_match:
-                    year, month = month_match.groups()
-                    return f"{year}-{int(month):02d}-01"  # 默认设置为当月第一天
-
-                # 如果都无法匹配，返回原始字符串并记录日志
-                print(f"⚠️ 无法解析日期格式: {date_str}，保持原样")
-                return date_str
-        except Exception as e:
-            print(f"❌ 日期标准化失败: {date_str}, 错误: {e}")
-            return date_str
-
     def _format_article(self, article):
         """将文章格式化为统一的新闻格式"""
         import hashlib
@@ -204,7 +173,7 @@ class OpenHarmonyNewsCrawler:
         article_id = hashlib.md5(article['url'].encode()).hexdigest()[:16]
 
         # 标准化日期格式
-        standardized_date = self._standardize_date(article.get('date', ''))
+        standardized_date = normalize_date(article.get('date', ''))
 
         # 返回统一格式，符合TypeScript接口规范
         return {
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+News cache refresh failure test: a failed full refresh keeps serving the old snapshot
+"""
+import sys
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+# Add project root to Python path
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from api import news
+from core import scheduler as scheduler_module
+from core.cache import NewsCache, ServiceStatus
+
+
+class FakeNewsService:
+    """Returns a fixed crawl result instead of hitting the network"""
+
+    def __init__(self, make_article):
+        self.make_article = make_article
+
+    def crawl_news(self, source):
+        return [{"url": f"https://example.com/news/{index}"} for index in range(60)]
+
+    def validate_articles(self, articles):
+        return articles
+
+    def to_news_articles(self, articles):
+        return [self.make_article(index) for index in range(len(articles))]
+
+
+@pytest.fixture
+def cache(monkeypatch, make_article):
+    cache = NewsCache()
+    cache.update_cache([make_article(index) for index in range(50)])
+    cache.complete_first_load()
+    monkeypatch.setattr(scheduler_module, "get_news_cache", lambda: cache)
+    monkeypatch.setattr(scheduler_module, "get_news_service", lambda: FakeNewsService(make_article))
+    monkeypatch.setattr(news, "get_news_cache", lambda: cache)
+    return cache
+
+
+def test_failed_refresh_keeps_serving_old_snapshot(cache, monkeypatch):
+    def failing_build(*args, **kwargs):
+        raise RuntimeError("index build failed")
+
+    monkeypatch.setattr(cache, "_build_indexes", failing_build)
+    scheduler_module.TaskScheduler()._run_crawler_in_thread("refresh test")
+
+    snapshot = cache.snapshot
+    assert snapshot.status == ServiceStatus.READY
+    assert len(snapshot.articles) == 50
+    assert "index build failed" in snapshot.error_message
+    assert not snapshot.is_updating
+
+    app = FastAPI()
+    app.include_router(news.router)
+    response = TestClient(app).get("/api/news/", params={"page_size": 5})
+    assert response.status_code == 200
+    assert response.json()["total"] == 50
+
+
+def test_failed_load_without_data_reports_error(monkeypatch, make_article):
+    cache = NewsCache()
+    monkeypatch.setattr(scheduler_module, "get_news_cache", lambda: cache)
+    monkeypatch.setattr(scheduler_module, "get_news_service", lambda: FakeNewsService(make_article))
+    monkeypatch.setattr(FakeNewsService, "crawl_news", lambda self, source: 1 / 0)
+
+    scheduler_module.TaskScheduler()._run_crawler_in_thread("initial load test")
+
+    assert cache.snapshot.status == ServiceStatus.ERROR
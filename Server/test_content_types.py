@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Content negotiation test: MessagePack/CBOR bodies decode to the same document as the JSON body
+"""
+import json
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+# Add project root to Python path
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from api import news
+from api.content_types import (
+    CBOR_MEDIA_TYPE, JSON_MEDIA_TYPE, MSGPACK_MEDIA_TYPE, encode_model, stream_frame
+)
+from api.http_cache import choose_media_type
+from core.cache import NewsCache
+from core.config import settings
+from models.news import NewsResponse
+
+msgpack = pytest.importorskip("msgpack")
+cbor2 = pytest.importorskip("cbor2")
+
+DECODERS = {
+    JSON_MEDIA_TYPE: json.loads,
+    MSGPACK_MEDIA_TYPE: lambda body: msgpack.unpackb(body, raw=False),
+    CBOR_MEDIA_TYPE: cbor2.loads,
+}
+BINARY_TYPES = [MSGPACK_MEDIA_TYPE, CBOR_MEDIA_TYPE]
+
+
+def make_response(make_article, count):
+    articles = [make_article(index, created_at=datetime(2024, 5, 1, 8, 30), summary="摘要 ✓")
+                for index in range(count)]
+    return NewsResponse(articles=articles, total=count, page=1, page_size=count, version=7)
+
+
+@pytest.mark.parametrize("media_type", BINARY_TYPES)
+def test_encode_model_round_trip(make_article, media_type):
+    response = make_response(make_article, 3)
+    decoded = DECODERS[media_type](encode_model(response, media_type))
+    assert decoded == json.loads(encode_model(response))
+    assert NewsResponse(**decoded) == response
+
+
+@pytest.mark.parametrize("media_type", [JSON_MEDIA_TYPE] + BINARY_TYPES)
+@pytest.mark.parametrize("count", [0, 1, 4])
+def test_stream_frame_matches_whole_document(make_article, media_type, count):
+    response = make_response(make_article, count)
+    envelope = response.model_copy(update={"articles": []})
+    head, separator, tail = stream_frame(envelope, count, media_type)
+    body = head + separator.join(encode_model(article, media_type) for article in response.articles) + tail
+    assert DECODERS[media_type](body) == json.loads(encode_model(response))
+
+
+@pytest.mark.parametrize("accept, expected", [
+    (None, JSON_MEDIA_TYPE),
+    ("*/*", JSON_MEDIA_TYPE),
+    ("application/msgpack", MSGPACK_MEDIA_TYPE),
+    ("application/x-msgpack", MSGPACK_MEDIA_TYPE),
+    ("application/cbor, application/json;q=0.5", CBOR_MEDIA_TYPE),
+    ("application/json, application/msgpack;q=0.5", JSON_MEDIA_TYPE),
+    ("application/msgpack;q=0", JSON_MEDIA_TYPE),
+])
+def test_choose_media_type(accept, expected):
+    assert choose_media_type(accept) == expected
+
+
+@pytest.fixture
+def client(monkeypatch, make_article):
+    cache = NewsCache()
+    cache.update_cache([make_article(index) for index in range(30)])
+    monkeypatch.setattr(news, "get_news_cache", lambda: cache)
+    monkeypatch.setattr(news, "_response_cache", news.ResponseCache())
+    app = FastAPI()
+    app.include_router(news.router)
+    return TestClient(app)
+
+
+@pytest.mark.parametrize("media_type", BINARY_TYPES)
+@pytest.mark.parametrize("params", [{"page_size": 5}, {"all": "true"}, {"all": "true", "view": "summary"}])
+def test_endpoint_binary_matches_json(client, monkeypatch, media_type, params):
+    # all=true above the threshold is streamed in chunks rather than cached whole
+    monkeypatch.setattr(settings, "news_stream_min_articles", 10)
+    as_json = client.get("/api/news/", params=params)
+    binary = client.get("/api/news/", params=params, headers={"Accept": media_type})
+    assert binary.headers["content-type"] == media_type
+    assert "Accept" in binary.headers["vary"]
+    assert binary.headers["etag"] != as_json.headers["etag"]
+    assert DECODERS[media_type](binary.content) == as_json.json()
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Date normalizer test: month-day dates follow the current year across New Year
+"""
+import sys
+from datetime import date, datetime
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from core import date_normalizer
+from core.date_normalizer import DateNormalizer
+
+
+def freeze_today(monkeypatch, today: date):
+    """Patch the module's date.today() and time.time() to a moment on the given day"""
+
+    class FrozenDate(date):
+        @classmethod
+        def today(cls):
+            return cls(today.year, today.month, today.day)
+
+    monkeypatch.setattr(date_normalizer, "date", FrozenDate)
+    moment = datetime(today.year, today.month, today.day, 12).timestamp()
+    monkeypatch.setattr(date_normalizer.time, "time", lambda: moment)
+
+
+def test_month_day_dates_use_current_year_after_new_year(monkeypatch):
+    normalizer = DateNormalizer(cache_size=64)
+
+    freeze_today(monkeypatch, date(2024, 12, 31))
+    assert normalizer.normalize("12-31") == "2024-12-31"
+    assert normalizer.normalize("1/2 10:30") == "2024-01-02"
+
+    freeze_today(monkeypatch, date(2025, 1, 1))
+    assert normalizer.normalize("12-31") == "2025-12-31"
+    assert normalizer.normalize("1/2 10:30") == "2025-01-02"
+
+
+def test_full_dates_do_not_depend_on_current_year(monkeypatch):
+    normalizer = DateNormalizer(cache_size=64)
+    freeze_today(monkeypatch, date(2030, 6, 1))
+    assert normalizer.normalize("2024年8月31日") == "2024-08-31"
+    assert normalizer.normalize("31.08.2024") == "2024-08-31"
+    assert normalizer.normalize("2024-02-30") == "2024-02-30"  # invalid dates are returned unchanged
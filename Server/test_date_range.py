@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Date range test: sort-key bisection returns the same articles as filtering parsed dates
+"""
+import sys
+from datetime import date
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+# Add project root to Python path
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from api import news
+from core.cache import NewsCache
+from core.date_normalizer import parse_date
+
+DATE_FORMATS = ["{y}-{m:02d}-{d:02d}", "{y}/{m}/{d}", "{y}年{m}月{d}日", "{y}.{m:02d}.{d:02d}"]
+RANGES = [
+    (date(2024, 3, 1), date(2024, 3, 31)),
+    (date(2024, 2, 29), date(2024, 2, 29)),
+    (date(2023, 12, 15), date(2024, 1, 10)),
+    (date(2024, 6, 1), None),
+    (None, date(2023, 11, 30)),
+    (date(2025, 1, 1), None),
+]
+FILTERS = [{}, {"category": "官方动态"}, {"search": "新闻 1"}]
+
+
+@pytest.fixture
+def cache(make_article):
+    articles = []
+    for index in range(240):
+        day = date.fromordinal(date(2023, 10, 1).toordinal() + index * 2)
+        date_text = DATE_FORMATS[index % len(DATE_FORMATS)].format(y=day.year, m=day.month, d=day.day)
+        articles.append(make_article(index, date=date_text))
+    cache = NewsCache()
+    cache.update_cache(articles)
+    return cache
+
+
+def in_range(article, start_date, end_date):
+    parsed = parse_date(article.date)
+    return (start_date is None or parsed >= start_date) and (end_date is None or parsed <= end_date)
+
+
+@pytest.mark.parametrize("filters", FILTERS)
+@pytest.mark.parametrize("start_date, end_date", RANGES)
+def test_range_matches_parsed_date_filter(cache, filters, start_date, end_date):
+    everything = cache.get_news(page_size=1000, **filters).articles
+    expected = [article.url for article in everything if in_range(article, start_date, end_date)]
+
+    result = cache.get_news(page_size=1000, start_date=start_date, end_date=end_date, **filters)
+    assert result.total == len(expected)
+    assert [article.url for article in result.articles] == expected
+
+
+def test_range_pages_with_cursor(cache):
+    start_date, end_date = date(2023, 11, 1), date(2024, 2, 1)
+    expected = [a.url for a in cache.get_news(page_size=1000, start_date=start_date, end_date=end_date).articles]
+    seen = []
+    result = cache.get_news(page_size=7, start_date=start_date, end_date=end_date)
+    while True:
+        seen.extend(article.url for article in result.articles)
+        if result.next_cursor is None:
+            break
+        result = cache.get_news(page_size=7, start_date=start_date, end_date=end_date, cursor=result.next_cursor)
+    assert seen == expected
+
+
+def test_reversed_range_is_rejected(cache, monkeypatch):
+    monkeypatch.setattr(news, "get_news_cache", lambda: cache)
+    app = FastAPI()
+    app.include_router(news.router)
+    response = TestClient(app).get("/api/news/", params={"start_date": "2024-03-02", "end_date": "2024-03-01"})
+    assert response.status_code == 400
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+ETag test: If-None-Match answers 304 without rebuilding until the snapshot version changes
+"""
+import sys
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+# Add project root to Python path
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from api import banner, news
+from api.http_cache import etag_matches, make_etag
+from core.cache import BannerCache, NewsCache
+
+
+@pytest.fixture
+def news_client(monkeypatch, make_article):
+    cache = NewsCache()
+    cache.update_cache([make_article(index) for index in range(40)])
+    builds = []
+    get_news = cache.get_news
+
+    def counting_get_news(*args, **kwargs):
+        builds.append(kwargs)
+        return get_news(*args, **kwargs)
+
+    monkeypatch.setattr(cache, "get_news", counting_get_news)
+    monkeypatch.setattr(news, "get_news_cache", lambda: cache)
+    monkeypatch.setattr(news, "_response_cache", news.ResponseCache())
+    app = FastAPI()
+    app.include_router(news.router)
+    return TestClient(app), cache, builds
+
+
+def test_revalidation_returns_304_without_rebuilding(news_client):
+    client, cache, builds = news_client
+    first = client.get("/api/news/", params={"page_size": 5})
+    assert first.status_code == 200
+    assert first.headers["cache-control"].startswith("public, max-age=")
+    assert len(builds) == 1
+
+    etag = first.headers["etag"]
+    for if_none_match in (etag, f"W/{etag}", f'"other", {etag}', "*"):
+        revalidated = client.get("/api/news/", params={"page_size": 5}, headers={"If-None-Match": if_none_match})
+        assert revalidated.status_code == 304
+        assert revalidated.content == b""
+        assert revalidated.headers["etag"] == etag
+    assert len(builds) == 1
+
+
+def test_etag_changes_with_query_and_version(news_client, make_article):
+    client, cache, _ = news_client
+    first = client.get("/api/news/", params={"page_size": 5})
+    other_query = client.get("/api/news/", params={"page_size": 6})
+    assert other_query.headers["etag"] != first.headers["etag"]
+
+    cache.update_cache([make_article(index) for index in range(41)])
+    refreshed = client.get("/api/news/", params={"page_size": 5}, headers={"If-None-Match": first.headers["etag"]})
+    assert refreshed.status_code == 200
+    assert refreshed.headers["etag"] != first.headers["etag"]
+    assert refreshed.json()["total"] == 41
+
+
+def test_first_load_responses_must_revalidate(monkeypatch, make_article):
+    cache = NewsCache()
+    cache.append_to_cache([make_article(index) for index in range(10)])
+    monkeypatch.setattr(news, "get_news_cache", lambda: cache)
+    monkeypatch.setattr(news, "_response_cache", news.ResponseCache())
+    app = FastAPI()
+    app.include_router(news.router)
+    response = TestClient(app).get("/api/news/")
+    assert response.headers["cache-control"] == "no-cache"
+
+
+def test_compressed_etag_matches_base_etag():
+    base = make_etag(3, ("list",))
+    assert etag_matches(make_etag(3, ("list",), "gzip"), base)
+    assert etag_matches(f'W/{make_etag(3, ("list",), "br")}', base)
+    assert not etag_matches(make_etag(4, ("list",)), base)
+
+
+def test_banner_revalidation_follows_cache_version(monkeypatch):
+    banner_cache = BannerCache()
+    banner_cache.update_cache([{"url": "https://example.com/banner.png"}])
+    monkeypatch.setattr(banner, "get_banner_cache", lambda: banner_cache)
+    monkeypatch.setattr(banner, "_response_cache", banner.ResponseCache(max_entries=8, max_search_entries=1))
+    app = FastAPI()
+    app.include_router(banner.router)
+    client = TestClient(app)
+
+    first = client.get("/api/banner/mobile")
+    assert first.json()["images"] == ["https://example.com/banner.png"]
+    assert client.get("/api/banner/mobile", headers={"If-None-Match": first.headers["etag"]}).status_code == 304
+
+    banner_cache.update_cache([{"url": "https://example.com/banner2.png"}])
+    updated = client.get("/api/banner/mobile", headers={"If-None-Match": first.headers["etag"]})
+    assert updated.status_code == 200
+    assert updated.json()["images"] == ["https://example.com/banner2.png"]
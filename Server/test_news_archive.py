@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Article archive test: cache writes are archived to SQLite and searchable after leaving the cache
+"""
+import sys
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+# Add project root to Python path
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from api import news
+from core import database
+from core.cache import NewsCache
+from core.config import settings
+from models.news import ContentType, NewsContentBlock
+
+
+@pytest.fixture
+def archive_db(tmp_path, monkeypatch):
+    database.close_db()
+    monkeypatch.setattr(database, "DB_PATH", str(tmp_path / "archive.db"))
+    database.init_database()
+    yield
+    database.close_db()
+
+
+def archived_urls(**kwargs):
+    rows, total = database.search_news_articles(limit=100, **kwargs)
+    assert total == len(rows)
+    return [row["url"] for row in rows]
+
+
+def test_updates_archive_only_changed_articles(archive_db, make_article, monkeypatch):
+    written = []
+
+    def counting_archive(keyed_records):
+        written.append(database.archive_news_articles(keyed_records))
+        return written[-1]
+
+    monkeypatch.setattr("core.cache.archive_news_articles", counting_archive)
+    cache = NewsCache(archive=True)
+
+    cache.update_cache([make_article(index) for index in range(30)])
+    cache.update_cache([make_article(index) for index in range(30)])
+    cache.update_cache([make_article(0, title="OpenHarmony 新闻 0（更新）")] +
+                       [make_article(index) for index in range(1, 30)])
+    assert written == [30, 0, 1]
+    assert archived_urls(search="更新") == ["https://example.com/news/0"]
+
+
+def test_archive_keeps_articles_removed_from_cache(archive_db, make_article):
+    cache = NewsCache(archive=True)
+    cache.update_cache([make_article(index) for index in range(20)])
+    cache.update_cache([make_article(index) for index in range(10, 20)])
+
+    assert cache.get_news(page_size=100).total == 10
+    # Without a search term the archive is ordered like the cache: newest first by sort key
+    everything = NewsCache()
+    everything.update_cache([make_article(index) for index in range(20)])
+    assert archived_urls() == [article.url for article in everything.get_news(page_size=100).articles]
+
+
+def test_full_text_search_ranks_and_reads_body(archive_db, make_article):
+    body = [NewsContentBlock(type=ContentType.TEXT, value="分布式软总线 调度 示例")]
+    cache = NewsCache(archive=True)
+    cache.update_cache(
+        [make_article(index) for index in range(20)] +
+        [make_article(20, title="内核 内核 内核", summary="内核"), make_article(21, content=body)]
+    )
+
+    assert archived_urls(search="内核")[0] == "https://example.com/news/20"
+    assert archived_urls(search="软总线") == ["https://example.com/news/21"]
+    official = archived_urls(search="新闻", category="官方动态")
+    assert sorted(official) == sorted(f"https://example.com/news/{index}" for index in range(1, 22, 2))
+
+
+def test_archive_search_without_fts_falls_back_to_substring(archive_db, make_article, monkeypatch):
+    NewsCache(archive=True).update_cache([make_article(index) for index in range(12)])
+    monkeypatch.setattr(database, "_fts_available", False)
+    assert sorted(archived_urls(search="新闻 1")) == sorted(
+        f"https://example.com/news/{index}" for index in (1, 10, 11)
+    )
+
+
+def test_archive_endpoint(archive_db, make_article, monkeypatch):
+    NewsCache(archive=True).update_cache([make_article(index) for index in range(25)])
+    app = FastAPI()
+    app.include_router(news.router)
+    client = TestClient(app)
+
+    monkeypatch.setattr(settings, "news_archive_enabled", False)
+    assert client.get("/api/news/archive").status_code == 404
+
+    monkeypatch.setattr(settings, "news_archive_enabled", True)
+    response = client.get("/api/news/archive", params={"page": 2, "page_size": 10})
+    assert response.status_code == 200
+    body = response.json()
+    assert (body["total"], len(body["articles"]), body["has_next"], body["has_prev"]) == (25, 10, True, True)
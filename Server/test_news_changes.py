@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Delta sync test: appended batches record their own URLs without diffing the whole cache
+"""
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from core.cache import NewsCache
+
+
+def test_append_records_only_the_batch(make_article, monkeypatch):
+    cache = NewsCache()
+    cache.append_to_cache([make_article(index) for index in range(100)])
+    since = cache.snapshot.version
+
+    def full_diff(*args, **kwargs):
+        raise AssertionError("append_to_cache compared the whole cache")
+
+    monkeypatch.setattr(cache, "_record_diff", full_diff)
+    # The duplicate of article 5 is skipped and must not be reported as changed
+    cache.append_to_cache([make_article(index) for index in range(100, 130)] + [make_article(5)])
+
+    diff = cache.snapshot.history[-1]
+    assert diff.removed == ()
+    assert sorted(diff.upserted_urls) == sorted(f"https://example.com/news/{index}" for index in range(100, 130))
+
+    changes = cache.get_changes(since)
+    assert changes["removed"] == []
+    assert sorted(article.url for article in changes["upserted"]) == sorted(diff.upserted_urls)
+
+
+def test_full_update_reports_changed_and_removed(make_article):
+    cache = NewsCache()
+    cache.append_to_cache([make_article(index) for index in range(50)])
+    since = cache.snapshot.version
+
+    updated = [make_article(index) for index in range(10, 60)]
+    updated[0] = make_article(10, title="OpenHarmony 新闻 10（更新）")
+    cache.update_cache(updated)
+
+    changes = cache.get_changes(since)
+    assert sorted(changes["removed"]) == sorted(str(index) for index in range(10))
+    assert sorted(article.url for article in changes["upserted"]) == sorted(
+        f"https://example.com/news/{index}" for index in [10] + list(range(50, 60))
+    )
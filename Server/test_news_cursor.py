@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Keyset pagination test: walking next_cursor returns the same pages as page/page_size
+"""
+import sys
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+# Add project root to Python path
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from api import news
+from core.cache import NewsCache
+
+FILTERS = [{}, {"category": "官方动态"}, {"search": "新闻 1"}, {"category": "技术博客", "search": "新闻"}]
+
+
+def walk_cursor(cache, page_size, **filters):
+    pages = []
+    result = cache.get_news(page_size=page_size, **filters)
+    while True:
+        pages.append([article.url for article in result.articles])
+        if result.next_cursor is None:
+            assert not result.has_next
+            return pages
+        result = cache.get_news(page_size=page_size, cursor=result.next_cursor, **filters)
+
+
+@pytest.fixture
+def cache(make_article):
+    cache = NewsCache()
+    # Several articles per day so that pages split runs of equal dates
+    cache.update_cache([make_article(index, date=f"2024-03-{index % 9 + 1:02d}") for index in range(157)])
+    return cache
+
+
+@pytest.mark.parametrize("filters", FILTERS)
+@pytest.mark.parametrize("page_size", [1, 7, 20])
+def test_cursor_pages_match_offset_pages(cache, filters, page_size):
+    total = cache.get_news(page_size=1, **filters).total
+    offset_pages = [
+        [article.url for article in cache.get_news(page=page, page_size=page_size, **filters).articles]
+        for page in range(1, max(1, -(-total // page_size)) + 1)
+    ]
+    assert walk_cursor(cache, page_size, **filters) == offset_pages
+
+
+def test_cursor_is_stable_while_batches_are_appended(make_article):
+    cache = NewsCache()
+    cache.append_to_cache([make_article(index) for index in range(0, 120, 2)])
+    seen = []
+    result = cache.get_news(page_size=10)
+    while True:
+        seen.extend(article.url for article in result.articles)
+        if result.next_cursor is None:
+            break
+        # Newer and older articles arrive between page requests
+        start = 1 + 2 * len(seen)
+        cache.append_to_cache([make_article(index) for index in range(start, start + 4, 2)])
+        result = cache.get_news(page_size=10, cursor=result.next_cursor)
+
+    original = {f"https://example.com/news/{index}" for index in range(0, 120, 2)}
+    assert len(seen) == len(set(seen))
+    assert original <= set(seen)
+
+
+def test_invalid_cursor_is_rejected(cache, monkeypatch):
+    monkeypatch.setattr(news, "get_news_cache", lambda: cache)
+    app = FastAPI()
+    app.include_router(news.router)
+    response = TestClient(app).get("/api/news/", params={"cursor": "不是游标"})
+    assert response.status_code == 400
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Facet counts test: month buckets are newest first with "unknown" last
+"""
+import sys
+from collections import Counter
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from core.cache import NewsCache
+
+
+def make_corpus(make_article):
+    articles = [make_article(index) for index in range(60)]
+    articles += [make_article(index, date="日期未知") for index in range(60, 64)]
+    return articles
+
+
+def test_month_facets_newest_first_unknown_last(make_article):
+    cache = NewsCache()
+    cache.update_cache(make_corpus(make_article))
+
+    facets = cache.get_facets()
+    months = [facet.value for facet in facets.month]
+    assert months == [f"2024-{month:02d}" for month in range(12, 0, -1)] + ["unknown"]
+    assert dict((facet.value, facet.count) for facet in facets.month)["unknown"] == 4
+    assert facets.total == 64
+    assert {facet.value: facet.count for facet in facets.category} == {"官方动态": 32, "技术博客": 32}
+
+
+def test_search_facets_count_only_matches(make_article):
+    cache = NewsCache()
+    cache.update_cache(make_corpus(make_article))
+
+    facets = cache.get_facets(search="新闻 6")
+    matches = cache.get_news(search="新闻 6", page_size=100).articles
+    assert facets.total == len(matches)
+    assert {facet.value: facet.count for facet in facets.category} == Counter(a.category for a in matches)
+    assert [facet.value for facet in facets.month][-1] == "unknown"
+
+
+def test_appended_facets_match_full_build(make_article):
+    articles = make_corpus(make_article)
+    appended = NewsCache()
+    for start in range(0, len(articles), 16):
+        appended.append_to_cache(articles[start:start + 16])
+    rebuilt = NewsCache()
+    rebuilt.update_cache(articles)
+
+    expected = rebuilt.get_facets()
+    facets = appended.get_facets()
+    assert (facets.total, facets.category, facets.source, facets.month) == \
+        (expected.total, expected.category, expected.source, expected.month)
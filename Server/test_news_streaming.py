@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Full dump test: all=true / format=ndjson skip article filtering on cache hits and 304s
+"""
+import json
+import sys
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+# Add project root to Python path
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from api import news
+from core.cache import NewsCache
+from core.config import settings
+
+
+@pytest.fixture
+def client(monkeypatch, make_article):
+    cache = NewsCache()
+    cache.update_cache([make_article(index) for index in range(120)])
+    calls = []
+    iter_news = cache.iter_news
+
+    def counting_iter_news(*args, **kwargs):
+        calls.append(kwargs.get("search"))
+        return iter_news(*args, **kwargs)
+
+    monkeypatch.setattr(cache, "iter_news", counting_iter_news)
+    monkeypatch.setattr(news, "get_news_cache", lambda: cache)
+    monkeypatch.setattr(news, "_response_cache", news.ResponseCache())
+    app = FastAPI()
+    app.include_router(news.router)
+    return TestClient(app), calls
+
+
+@pytest.mark.parametrize("stream_min_articles", [1000, 10])
+def test_all_filters_once_per_snapshot(client, monkeypatch, stream_min_articles):
+    monkeypatch.setattr(settings, "news_stream_min_articles", stream_min_articles)
+    client, calls = client
+    params = {"all": "true", "search": "新闻 1"}
+
+    first = client.get("/api/news/", params=params)
+    assert first.status_code == 200
+    assert first.json()["total"] == len(first.json()["articles"]) > 0
+    assert len(calls) == 1
+
+    revalidated = client.get("/api/news/", params=params, headers={"If-None-Match": first.headers["etag"]})
+    assert revalidated.status_code == 304
+    assert len(calls) == 1
+
+    # Small results are cached whole; streamed results are not cached and are filtered again
+    again = client.get("/api/news/", params=params)
+    assert again.json() == first.json()
+    assert len(calls) == (1 if stream_min_articles == 1000 else 2)
+
+
+def test_ndjson_skips_filtering_on_304(client):
+    client, calls = client
+    first = client.get("/api/news/", params={"format": "ndjson"})
+    lines = first.text.splitlines()
+    assert first.headers["x-total-count"] == str(len(lines)) == "120"
+    assert json.loads(lines[0])["url"]
+
+    revalidated = client.get("/api/news/", params={"format": "ndjson"}, headers={"If-None-Match": first.headers["etag"]})
+    assert revalidated.status_code == 304
+    assert len(calls) == 1
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+List view test: view=summary returns the summary response shape, also while the cache is preparing
+"""
+import sys
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+# Add project root to Python path
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from api import news
+from core.cache import NewsCache, ServiceStatus
+from models.news import ContentType, NewsContentBlock, NewsResponse, NewsSummaryResponse, NewsView
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    cache = NewsCache()
+    monkeypatch.setattr(news, "get_news_cache", lambda: cache)
+    monkeypatch.setattr(news, "_response_cache", news.ResponseCache())
+    return cache
+
+
+@pytest.fixture
+def client(cache):
+    app = FastAPI()
+    app.include_router(news.router)
+    return TestClient(app)
+
+
+def test_summary_view_omits_content(cache, client, make_article):
+    content = [NewsContentBlock(type=ContentType.IMAGE, value="https://example.com/1.png"),
+               NewsContentBlock(type=ContentType.TEXT, value="正文")]
+    cache.update_cache([make_article(index, content=content) for index in range(10)])
+
+    full = client.get("/api/news/", params={"page_size": 3}).json()
+    summary = client.get("/api/news/", params={"page_size": 3, "view": "summary"}).json()
+    assert [a["url"] for a in summary["articles"]] == [a["url"] for a in full["articles"]]
+    assert all("content" not in article for article in summary["articles"])
+    assert summary["articles"][0]["image"] == "https://example.com/1.png"
+    assert summary["total"] == full["total"] == 10
+
+
+@pytest.mark.parametrize("view, model", [(NewsView.FULL, NewsResponse), (NewsView.SUMMARY, NewsSummaryResponse)])
+def test_preparing_response_matches_requested_view(view, model):
+    response = news._preparing_response(view, 2, 5)
+    assert type(response) is model
+    assert (response.articles, response.total, response.page, response.page_size) == ([], 0, 2, 5)
+
+
+@pytest.mark.parametrize("path", ["/api/news/", "/api/news/openharmony", "/api/news/blog"])
+def test_preparing_endpoints_accept_summary_view(cache, client, path):
+    cache.set_status(ServiceStatus.PREPARING)
+    response = client.get(path, params={"view": "summary", "page": 2, "page_size": 5})
+    assert response.status_code == 200
+    assert response.json()["articles"] == []
+    assert response.json()["page"] == 2
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Ranked search test: BM25 top-k matches exhaustive scoring, and the index is built in the background
+"""
+import random
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+# Add project root to Python path
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from api import news
+from core import search_index as search_index_module
+from core.cache import NewsCache
+from core.search_index import BM25SearchIndex
+from core.snapshot_store import SnapshotStore
+from models.news import ContentType, NewsContentBlock, NewsSort
+
+WORDS = ["鸿蒙", "开发者", "ArkTS", "内核", "社区", "发布", "版本", "分布式", "应用", "设备"]
+
+
+def wait_for_ranked_index(cache, timeout=10.0):
+    deadline = time.time() + timeout
+    while cache.snapshot.ranked_index is None:
+        assert time.time() < deadline, "ranked index was not built in time"
+        time.sleep(0.01)
+
+
+def ranked_articles(make_article, count):
+    """Article 0 mentions 内核 most often, so it must rank first for that query"""
+    articles = [make_article(index) for index in range(count)]
+    articles[0] = make_article(0, title="内核 内核 内核 调度", summary="内核")
+    return articles
+
+
+@pytest.fixture
+def corpus():
+    rng = random.Random(3)
+    return [
+        (" ".join(rng.choices(WORDS, k=4)), " ".join(rng.choices(WORDS, k=6)), [" ".join(rng.choices(WORDS, k=20))])
+        for _ in range(3000)
+    ]
+
+
+@pytest.mark.parametrize("query", ["鸿蒙", "arkts 内核", "分布式应用", "开发者社区发布"])
+def test_top_k_matches_exhaustive_scoring(corpus, monkeypatch, query):
+    index = BM25SearchIndex.build(corpus)
+    pruned = index.search(query, 20)
+    monkeypatch.setattr(search_index_module, "EXHAUSTIVE_MAX_POSTINGS", 10 ** 9)
+    exhaustive = index.search(query, 20)
+    assert [doc_id for doc_id, _ in pruned] == [doc_id for doc_id, _ in exhaustive]
+    assert [score for _, score in pruned] == pytest.approx([score for _, score in exhaustive])
+
+
+def test_full_build_publishes_before_ranked_index(make_article):
+    cache = NewsCache()
+    cache.update_cache(ranked_articles(make_article, 300))
+    assert cache.snapshot.ranked_index is None
+
+    by_date = cache.get_news(search="内核", page_size=5)
+    first = cache.get_news(search="内核", page_size=5, sort=NewsSort.RELEVANCE)
+    # Until the background build finishes, relevance requests fall back to date order
+    assert [a.url for a in first.articles] == [a.url for a in by_date.articles]
+
+    wait_for_ranked_index(cache)
+    ranked = cache.get_news(search="内核", page_size=5, sort=NewsSort.RELEVANCE)
+    assert ranked.articles[0].url == "https://example.com/news/0"
+    assert ranked.next_cursor is None
+
+
+def test_ranked_response_is_not_served_from_fallback_cache(make_article, monkeypatch):
+    cache = NewsCache()
+    cache.update_cache(ranked_articles(make_article, 300))
+    monkeypatch.setattr(news, "get_news_cache", lambda: cache)
+    monkeypatch.setattr(news, "_response_cache", news.ResponseCache())
+    app = FastAPI()
+    app.include_router(news.router)
+    client = TestClient(app)
+    params = {"search": "内核", "sort": "relevance", "page_size": 5}
+
+    fallback = client.get("/api/news/", params=params)
+    wait_for_ranked_index(cache)
+    ranked = client.get("/api/news/", params=params, headers={"If-None-Match": fallback.headers["etag"]})
+    assert ranked.status_code == 200
+    assert ranked.headers["etag"] != fallback.headers["etag"]
+    assert ranked.json()["articles"][0]["url"] == "https://example.com/news/0"
+
+
+def test_ranked_build_catches_up_with_appended_batches(tmp_path, make_article, monkeypatch):
+    path = str(tmp_path / "snapshot.db")
+    owner = NewsCache(store=SnapshotStore(path))
+    follower = NewsCache(store=SnapshotStore(path))
+    owner.append_to_cache(ranked_articles(make_article, 100))
+    assert follower.sync_from_store()
+    assert follower.snapshot.ranked_index is None
+
+    release = threading.Event()
+    build = BM25SearchIndex.build.__func__
+
+    def blocking_build(cls, entries):
+        entries = list(entries)
+        release.wait(10)
+        return build(cls, entries)
+
+    monkeypatch.setattr(BM25SearchIndex, "build", classmethod(blocking_build))
+    follower.get_news(search="内核", sort=NewsSort.RELEVANCE)
+
+    # A batch appended while the index is being built is added before it is published
+    owner.append_to_cache([make_article(index, title=f"内核 补丁 {index}") for index in range(100, 120)])
+    assert follower.sync_from_store()
+    release.set()
+    wait_for_ranked_index(follower)
+
+    assert len(follower.snapshot.ranked_index) == 120
+    result = follower.get_news(search="补丁", page_size=50, sort=NewsSort.RELEVANCE)
+    assert result.total == 20
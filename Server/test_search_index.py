@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+N-gram search index test: results match the original linear substring scan
+"""
+import random
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+# Add project root to Python path
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from core.cache import NewsCache
+from core.config import settings
+from core.search_index import NgramSearchIndex
+from models.news import NewsSort
+
+WORDS = ["OpenHarmony", "鸿蒙", "ArkTS", "开发者", "大会", "发布", "版本", "SIG", "社区", "API", "5.0", "【公告】"]
+KEYWORDS = ["o", "鸿", "ar", "开发", "arkts", "ARKTS", "开发者大会", "harmony 5", "版本发布", "sig社区",
+            "【公", "api 5.0", "不存在的词", "ts鸿", "x"]
+
+
+def linear_scan(entries, keyword):
+    """The original NewsCache.get_news search filter"""
+    keyword = keyword.lower()
+    return [
+        doc_id for doc_id, (title, summary) in enumerate(entries)
+        if keyword in title.lower() or (summary and keyword in summary.lower())
+    ]
+
+
+@pytest.fixture
+def entries():
+    rng = random.Random(7)
+    entries = []
+    for _ in range(400):
+        title = " ".join(rng.choice(WORDS) for _ in range(rng.randint(1, 5)))
+        summary = "".join(rng.choice(WORDS) for _ in range(rng.randint(0, 4))) or None
+        entries.append((title, summary))
+    return entries
+
+
+@pytest.mark.parametrize("keyword", KEYWORDS)
+def test_index_matches_linear_scan(entries, keyword):
+    index = NgramSearchIndex.build(entries)
+    assert index.search(keyword) == linear_scan(entries, keyword)
+    # A snapshot only sees the documents that existed when it was published
+    assert index.search(keyword, doc_count=150) == linear_scan(entries[:150], keyword)
+
+
+def test_title_and_summary_do_not_join():
+    index = NgramSearchIndex.build([("鸿蒙", "大会")])
+    assert index.search("鸿蒙大会") == []
+    assert index.search("蒙") == [0]
+
+
+@pytest.mark.parametrize("keyword", KEYWORDS)
+def test_cache_search_matches_linear_scan(entries, make_article, keyword):
+    cache = NewsCache()
+    cache.update_cache([
+        make_article(index, title=title, summary=summary)
+        for index, (title, summary) in enumerate(entries)
+    ])
+    articles = cache.snapshot.articles
+    expected = [articles[doc_id].url for doc_id in linear_scan([(a.title, a.summary) for a in articles], keyword)]
+
+    result = cache.get_news(search=keyword, page_size=1000)
+    assert result.total == len(expected)
+    assert [article.url for article in result.articles] == expected
+
+
+def test_search_during_appends_stays_within_snapshot(make_article):
+    """Appends extend the shared index while readers search the previous snapshot"""
+    cache = NewsCache()
+    cache.append_to_cache([make_article(index) for index in range(200)])
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    errors = []
+
+    def append_batches():
+        try:
+            for start in range(200, 3000, 50):
+                cache.append_to_cache([make_article(index) for index in range(start, start + 50)])
+        except Exception as e:
+            errors.append(e)
+
+    appender = threading.Thread(target=append_batches)
+    appender.start()
+    try:
+        while appender.is_alive():
+            snapshot = cache.snapshot
+            size = len(snapshot.articles)
+            for keyword in ("新闻", "openharmony 新闻"):
+                result = cache.get_news(search=keyword, page_size=10, snapshot=snapshot)
+                assert result.total == size
+            ranked = cache.get_news(search="新闻", page_size=10, sort=NewsSort.RELEVANCE, snapshot=snapshot)
+            assert ranked.total == min(size, settings.search_ranked_max_results)
+    finally:
+        appender.join()
+        sys.setswitchinterval(switch_interval)
+    assert not errors
+    assert cache.get_news(search="新闻").total == 3000
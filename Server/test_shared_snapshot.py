@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Shared snapshot test: follower workers apply first-load batches incrementally
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to Python path
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from core.cache import NewsCache
+from core.snapshot_store import SnapshotStore
+
+
+@pytest.fixture
+def caches(tmp_path):
+    path = str(tmp_path / "snapshot.db")
+    owner = NewsCache(store=SnapshotStore(path))
+    follower = NewsCache(store=SnapshotStore(path))
+    return owner, follower
+
+
+def assert_same_snapshot(owner, follower):
+    assert follower.snapshot.version == owner.snapshot.version
+    assert [a.url for a in follower.snapshot.articles] == [a.url for a in owner.snapshot.articles]
+    assert follower.snapshot.facets == owner.snapshot.facets
+    assert follower.get_news(search="新闻 1", page_size=100).total == owner.get_news(search="新闻 1", page_size=100).total
+
+
+def test_follower_appends_batches_without_rebuilding(caches, monkeypatch, make_article):
+    owner, follower = caches
+    owner.append_to_cache([make_article(index) for index in range(40)])
+    assert follower.sync_from_store()
+    assert_same_snapshot(owner, follower)
+
+    def fail_rebuild(*args, **kwargs):
+        raise AssertionError("follower rebuilt all indexes for an appended batch")
+
+    monkeypatch.setattr(follower, "_build_indexes", fail_rebuild)
+    # Several batches published between two syncs are applied as one append
+    owner.append_to_cache([make_article(index) for index in range(40, 60)])
+    owner.append_to_cache([make_article(index) for index in range(60, 80)])
+    assert follower.sync_from_store()
+    assert_same_snapshot(owner, follower)
+    assert not follower.sync_from_store()
+
+
+def test_follower_reloads_after_full_replace(caches, make_article):
+    owner, follower = caches
+    owner.append_to_cache([make_article(index) for index in range(40)])
+    follower.sync_from_store()
+
+    owner.update_cache([make_article(index) for index in range(20, 70)])
+    assert follower.sync_from_store()
+    assert_same_snapshot(owner, follower)
+    assert "https://example.com/news/0" not in follower.snapshot.by_url
@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Title suggest index test: prefix matching from the title start and from word starts
+"""
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from core.search_index import TitleSuggestIndex
+
+TITLES = [
+    "【公告】OpenHarmony 5.0 发布",
+    "鸿蒙开发者大会",
+    "OpenHarmony 开发者文档更新",
+]
+
+
+def test_title_start_matches_even_with_leading_punctuation():
+    index = TitleSuggestIndex(TITLES)
+    assert index.suggest("【公", 10) == [0]
+    assert index.suggest("【公告】open", 10) == [0]
+
+
+def test_word_starts_match_newest_first():
+    index = TitleSuggestIndex(TITLES)
+    assert index.suggest("open", 10) == [0, 2]
+    assert index.suggest("公告", 10) == [0]
+    assert index.suggest("开发者", 10) == [2]
+
+
+def test_cjk_runs_only_match_from_their_start():
+    index = TitleSuggestIndex(TITLES)
+    assert index.suggest("鸿蒙", 10) == [1]
+    # "开发者" is inside the CJK run "鸿蒙开发者大会", which has no word boundaries
+    assert 1 not in index.suggest("开发者", 10)